@@ -12,7 +12,7 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ServiceValidationError
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN, FIRMWARE_DEVICE_TYPES, MANUFACTURER
 from .coordinator import EG4DataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -123,7 +123,7 @@ async def _async_update_device_registry(
         device_type = device_data.get("type")
 
         # Only update firmware for inverter and GridBOSS devices
-        if device_type not in ["inverter", "gridboss"]:
+        if device_type not in FIRMWARE_DEVICE_TYPES:
             continue
 
         # Get firmware version from device data
@@ -7,7 +7,7 @@ All entity classes should inherit from these bases to ensure consistent behavior
 import asyncio
 from contextlib import contextmanager
 import logging
-from typing import TYPE_CHECKING, Any, Generator, cast
+from typing import TYPE_CHECKING, Any, Generator
 
 from homeassistant.const import EntityCategory
 from homeassistant.exceptions import HomeAssistantError
@@ -26,9 +26,12 @@ from .const import (
     DIAGNOSTIC_BATTERY_SENSOR_KEYS,
     DIAGNOSTIC_DEVICE_SENSOR_KEYS,
     DOMAIN,
-    ENTITY_PREFIX,
     MANUFACTURER,
-    SENSOR_TYPES,
+    PARALLEL_GROUP_ENTITY_ID_BY_KEY,
+    SENSOR_ENTITY_ID_PREFIX,
+    SensorSpec,
+    get_sensor_description,
+    get_sensor_spec,
 )
 from .coordinator import EG4DataUpdateCoordinator
 from .utils import (
@@ -220,25 +223,6 @@ class EG4StationEntity(CoordinatorEntity):
 # ========== Sensor Base Classes ==========
 
 
-def _get_display_precision(
-    sensor_config: dict[str, Any], device_class: str | None
-) -> int | None:
-    """Get display precision from config or device class defaults.
-
-    Args:
-        sensor_config: Sensor configuration dictionary
-        device_class: Device class string (e.g., "voltage")
-
-    Returns:
-        Suggested display precision or None if not specified
-    """
-    if "suggested_display_precision" in sensor_config:
-        return int(sensor_config["suggested_display_precision"])
-    if device_class == "voltage":
-        return 2
-    return None
-
-
 class EG4BaseSensor(EG4DeviceEntity):
     """Base class for EG4 sensor entities with shared configuration logic.
 
@@ -252,7 +236,7 @@ class EG4BaseSensor(EG4DeviceEntity):
 
     Attributes:
         _sensor_key: The sensor key for lookup in SENSOR_TYPES.
-        _sensor_config: Configuration dictionary for this sensor.
+        _sensor_config: Sensor definition record for this sensor.
     """
 
     def __init__(
@@ -275,9 +259,8 @@ class EG4BaseSensor(EG4DeviceEntity):
         self._device_type = device_type
 
         # Get sensor configuration
-        self._sensor_config: dict[str, Any] = cast(
-            "dict[str, Any]", SENSOR_TYPES.get(sensor_key, {})
-        )
+        self._sensor_config: SensorSpec = get_sensor_spec(sensor_key)
+        self.entity_description = get_sensor_description(sensor_key)
 
         # Generate unique ID
         self._attr_unique_id = f"{serial}_{sensor_key}"
@@ -290,22 +273,10 @@ class EG4BaseSensor(EG4DeviceEntity):
 
         # Modern entity naming
         self._attr_has_entity_name = True
-        self._attr_name = self._sensor_config.get("name", sensor_key)
 
         # Generate entity_id based on device type
         self._setup_entity_id(model, device_type)
 
-        # Set sensor properties from configuration
-        self._attr_native_unit_of_measurement = self._sensor_config.get("unit")
-        self._attr_device_class = self._sensor_config.get("device_class")
-        self._attr_state_class = self._sensor_config.get("state_class")
-        self._attr_icon = self._sensor_config.get("icon")
-
-        # Set display precision using helper function
-        precision = _get_display_precision(self._sensor_config, self._attr_device_class)
-        if precision is not None:
-            self._attr_suggested_display_precision = precision
-
         # Set entity category for diagnostic sensors
         if sensor_key in DIAGNOSTIC_DEVICE_SENSOR_KEYS:
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -314,15 +285,16 @@ class EG4BaseSensor(EG4DeviceEntity):
         """Set up entity_id based on device type."""
         if device_type == "gridboss":
             self._attr_entity_id = (
-                f"sensor.{ENTITY_PREFIX}_gridboss_{self._serial}_{self._sensor_key}"
+                f"{SENSOR_ENTITY_ID_PREFIX}gridboss_{self._serial}_{self._sensor_key}"
             )
         elif device_type == "parallel_group":
-            self._attr_entity_id = (
-                f"sensor.{ENTITY_PREFIX}_parallel_group_{self._sensor_key}"
+            self._attr_entity_id = PARALLEL_GROUP_ENTITY_ID_BY_KEY.get(
+                self._sensor_key,
+                f"{SENSOR_ENTITY_ID_PREFIX}parallel_group_{self._sensor_key}",
             )
         else:
             model_clean = clean_model_name(model, use_underscores=True)
-            self._attr_entity_id = f"sensor.{ENTITY_PREFIX}_{model_clean}_{self._serial}_{self._sensor_key}"
+            self._attr_entity_id = f"{SENSOR_ENTITY_ID_PREFIX}{model_clean}_{self._serial}_{self._sensor_key}"
 
     def _get_raw_value(self) -> Any:
         """Get raw sensor value from coordinator data.
@@ -372,7 +344,7 @@ class EG4BaseBatterySensor(EG4BatteryEntity):
 
     Attributes:
         _sensor_key: The sensor key for lookup in SENSOR_TYPES.
-        _sensor_config: Configuration dictionary for this sensor.
+        _sensor_config: Sensor definition record for this sensor.
     """
 
     def __init__(
@@ -396,9 +368,8 @@ class EG4BaseBatterySensor(EG4BatteryEntity):
         self._sensor_key = sensor_key
 
         # Get sensor configuration
-        self._sensor_config: dict[str, Any] = cast(
-            "dict[str, Any]", SENSOR_TYPES.get(sensor_key, {})
-        )
+        self._sensor_config: SensorSpec = get_sensor_spec(sensor_key)
+        self.entity_description = get_sensor_description(sensor_key)
 
         # Generate unique ID
         self._attr_unique_id = f"{serial}_{battery_key}_{sensor_key}"
@@ -414,27 +385,15 @@ class EG4BaseBatterySensor(EG4BatteryEntity):
 
         # Modern entity naming
         self._attr_has_entity_name = True
-        self._attr_name = self._sensor_config.get("name", sensor_key)
 
         # Generate entity_id
         model_clean = clean_model_name(model, use_underscores=True)
-        self._attr_entity_id = f"sensor.{ENTITY_PREFIX}_{model_clean}_{serial}_battery_{clean_battery_id}_{sensor_key}"
-
-        # Set sensor properties from configuration
-        self._attr_native_unit_of_measurement = self._sensor_config.get("unit")
-        self._attr_device_class = self._sensor_config.get("device_class")
-        self._attr_state_class = self._sensor_config.get("state_class")
-        self._attr_icon = self._sensor_config.get("icon")
-
-        # Set display precision using helper function
-        precision = _get_display_precision(self._sensor_config, self._attr_device_class)
-        if precision is not None:
-            self._attr_suggested_display_precision = precision
+        self._attr_entity_id = f"{SENSOR_ENTITY_ID_PREFIX}{model_clean}_{serial}_battery_{clean_battery_id}_{sensor_key}"
 
         # Set entity category for diagnostic sensors
         if (
             sensor_key in DIAGNOSTIC_BATTERY_SENSOR_KEYS
-            or self._sensor_config.get("entity_category") == "diagnostic"
+            or self._sensor_config.entity_category is EntityCategory.DIAGNOSTIC
         ):
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -484,7 +443,7 @@ class EG4BatteryBankEntity(EG4DeviceEntity):
 
     Attributes:
         _sensor_key: The sensor key for lookup in SENSOR_TYPES.
-        _sensor_config: Configuration dictionary for this sensor.
+        _sensor_config: Sensor definition record for this sensor.
     """
 
     def __init__(
@@ -504,9 +463,8 @@ class EG4BatteryBankEntity(EG4DeviceEntity):
         self._sensor_key = sensor_key
 
         # Get sensor configuration
-        self._sensor_config: dict[str, Any] = cast(
-            "dict[str, Any]", SENSOR_TYPES.get(sensor_key, {})
-        )
+        self._sensor_config: SensorSpec = get_sensor_spec(sensor_key)
+        self.entity_description = get_sensor_description(sensor_key)
 
         # Generate unique ID
         self._attr_unique_id = f"{serial}_battery_bank_{sensor_key}"
@@ -519,22 +477,18 @@ class EG4BatteryBankEntity(EG4DeviceEntity):
 
         # Modern entity naming
         self._attr_has_entity_name = True
-        self._attr_name = self._sensor_config.get("name", sensor_key)
 
         # Generate entity_id
         model_clean = clean_model_name(model, use_underscores=True)
         self._attr_entity_id = (
-            f"sensor.{ENTITY_PREFIX}_{model_clean}_{serial}_battery_bank_{sensor_key}"
+            f"{SENSOR_ENTITY_ID_PREFIX}{model_clean}_{serial}_battery_bank_{sensor_key}"
         )
 
-        # Set sensor properties
-        self._attr_native_unit_of_measurement = self._sensor_config.get("unit")
-        self._attr_device_class = self._sensor_config.get("device_class")
-        self._attr_state_class = self._sensor_config.get("state_class")
-        self._attr_icon = self._sensor_config.get("icon")
+        # Battery bank sensors keep Home Assistant's default precision
+        self._attr_suggested_display_precision = None
 
         # Set entity category
-        if self._sensor_config.get("entity_category") == "diagnostic":
+        if self._sensor_config.entity_category is EntityCategory.DIAGNOSTIC:
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @property
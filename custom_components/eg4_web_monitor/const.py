@@ -1,45 +1,48 @@
 """Constants for the EG4 Web Monitor integration."""
 
-from dataclasses import dataclass
-from typing import TypedDict
-
-from homeassistant.const import (
-    EntityCategory,
-    UnitOfElectricCurrent,
-    UnitOfElectricPotential,
-    UnitOfEnergy,
-    UnitOfFrequency,
-    UnitOfPower,
-    UnitOfTemperature,
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from enum import StrEnum
+import functools
+import logging
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
 )
+from homeassistant.const import EntityCategory
+
+_LOGGER = logging.getLogger(__name__)
 
 
-class SensorConfig(TypedDict, total=False):
-    """TypedDict for sensor configuration.
+@dataclass(slots=True, frozen=True)
+class SensorSpec:
+    """Immutable record describing a sensor type.
 
     Attributes:
         name: Display name for the sensor
         unit: Unit of measurement (e.g., UnitOfPower.WATT)
-        device_class: Home Assistant device class (power, energy, voltage, etc.)
-        state_class: Home Assistant state class (measurement, total, total_increasing)
+        device_class: Home Assistant device class (SensorDeviceClass.POWER, etc.)
+        state_class: Home Assistant state class (SensorStateClass.MEASUREMENT, etc.)
         icon: MDI icon string (e.g., "mdi:solar-power")
         entity_category: Entity category (diagnostic, config, etc.)
-        suggested_display_precision: Number of decimal places to display
     """
 
     name: str
-    unit: str | None
-    device_class: str | None
-    state_class: str | None
-    icon: str
-    entity_category: EntityCategory | None
-    suggested_display_precision: int
+    unit: str | None = None
+    device_class: SensorDeviceClass | None = None
+    state_class: SensorStateClass | None = None
+    icon: str | None = None
+    entity_category: EntityCategory | None = None
 
 
 # Brand Configuration
 # This allows maintaining multiple brands on the same codebase
-@dataclass(frozen=True)
-class BrandConfig:
+class BrandConfig(NamedTuple):
     """Configuration for a brand.
 
     Attributes:
@@ -92,8 +95,38 @@ BRAND_FORTRESS = BrandConfig(
     manufacturer="Fortress Power",
 )
 
-# Current brand configuration - change this to switch brands
-CURRENT_BRAND = BRAND_EG4
+# Brand registry keyed by integration domain
+_BRANDS: Mapping[str, BrandConfig] = MappingProxyType(
+    {
+        BRAND_EG4.domain: BRAND_EG4,
+        BRAND_LUXPOWER.domain: BRAND_LUXPOWER,
+        BRAND_FORTRESS.domain: BRAND_FORTRESS,
+    }
+)
+
+
+def _current_brand() -> BrandConfig:
+    """Resolve the active brand configuration from the integration's domain.
+
+    Home Assistant requires the package folder to match the manifest domain,
+    so the package name is the shipped domain. A domain without a registered
+    brand keeps EG4 settings under that domain, with a warning, rather than
+    failing the integration import.
+    """
+    domain = __package__.rpartition(".")[2]
+    if (brand := _BRANDS.get(domain)) is not None:
+        return brand
+    _LOGGER.warning(
+        "No brand registered for domain %r, using %s settings; known domains: %s",
+        domain,
+        BRAND_EG4.brand_name,
+        ", ".join(_BRANDS),
+    )
+    return BRAND_EG4._replace(domain=domain)
+
+
+# Current brand configuration, selected by the integration domain
+CURRENT_BRAND = _current_brand()
 
 # Integration constants derived from brand configuration
 DOMAIN = CURRENT_BRAND.domain
@@ -102,7 +135,12 @@ DEFAULT_VERIFY_SSL = CURRENT_BRAND.default_verify_ssl
 BRAND_NAME = CURRENT_BRAND.brand_name
 ENTITY_PREFIX = CURRENT_BRAND.entity_prefix
 MANUFACTURER = CURRENT_BRAND.manufacturer
+
+# Entity ID prefixes derived from the brand, built once at import
+SENSOR_ENTITY_ID_PREFIX = sys.intern(f"sensor.{ENTITY_PREFIX}_")
+UPDATE_ENTITY_ID_PREFIX = sys.intern(f"update.{ENTITY_PREFIX}_")
 DEFAULT_UPDATE_INTERVAL = 30  # seconds
+MAX_BACKOFF_INTERVAL = 300  # seconds, cap for the failure backoff
 
 # Configuration keys
 CONF_BASE_URL = "base_url"
@@ -114,9 +152,27 @@ CONF_LIBRARY_DEBUG = "library_debug"
 
 # Connection type configuration
 CONF_CONNECTION_TYPE = "connection_type"
-CONNECTION_TYPE_HTTP = "http"
-CONNECTION_TYPE_MODBUS = "modbus"
-CONNECTION_TYPE_HYBRID = "hybrid"  # Local Modbus + Cloud HTTP for best of both
+
+
+class ConnectionType(StrEnum):
+    """Transport used to reach the inverter."""
+
+    HTTP = "http"
+    MODBUS = "modbus"
+    HYBRID = "hybrid"  # Local Modbus + Cloud HTTP for best of both
+
+
+CONNECTION_TYPE_HTTP = ConnectionType.HTTP
+CONNECTION_TYPE_MODBUS = ConnectionType.MODBUS
+CONNECTION_TYPE_HYBRID = ConnectionType.HYBRID
+
+# Connection types that use the cloud API and the local Modbus transport
+HTTP_CONNECTION_TYPES: frozenset[ConnectionType] = frozenset(
+    {ConnectionType.HTTP, ConnectionType.HYBRID}
+)
+MODBUS_CONNECTION_TYPES: frozenset[ConnectionType] = frozenset(
+    {ConnectionType.MODBUS, ConnectionType.HYBRID}
+)
 
 # Modbus configuration keys
 CONF_MODBUS_HOST = "modbus_host"
@@ -132,19 +188,52 @@ DEFAULT_MODBUS_TIMEOUT = 10.0  # seconds
 
 # Modbus update interval (can be much faster than HTTP due to local network)
 MODBUS_UPDATE_INTERVAL = 5  # seconds (vs 30 for HTTP)
+# Budget for each Modbus read, matching the transport's own per-read timeout
+MODBUS_READ_TIMEOUT = DEFAULT_MODBUS_TIMEOUT  # seconds
+# Consecutive read timeouts before the Modbus connection is dropped
+MODBUS_MAX_CONSECUTIVE_TIMEOUTS = 3
+
 
 # Device types
-DEVICE_TYPE_INVERTER = "inverter"
-DEVICE_TYPE_GRIDBOSS = "gridboss"
-DEVICE_TYPE_BATTERY = "battery"
-
-# Inverter family constants (from pylxpweb InverterFamily enum)
-# Used for feature-based sensor filtering
-INVERTER_FAMILY_SNA = "SNA"  # Split-phase, North America (12000XP, 6000XP)
-INVERTER_FAMILY_PV_SERIES = "PV_SERIES"  # High-voltage DC (18KPV, etc.)
-INVERTER_FAMILY_LXP_EU = "LXP_EU"  # European market
-INVERTER_FAMILY_LXP_LV = "LXP_LV"  # Low-voltage DC
-INVERTER_FAMILY_UNKNOWN = "UNKNOWN"
+class DeviceType(StrEnum):
+    """Device types exposed by the integration."""
+
+    INVERTER = "inverter"
+    GRIDBOSS = "gridboss"
+    BATTERY = "battery"
+    STATION = "station"
+
+
+DEVICE_TYPE_INVERTER = DeviceType.INVERTER
+DEVICE_TYPE_GRIDBOSS = DeviceType.GRIDBOSS
+DEVICE_TYPE_BATTERY = DeviceType.BATTERY
+
+# Device types that report firmware and join a parallel group.
+# Membership tests reference module-level frozensets rather than inline
+# literals; large inline set literals are not constant-folded (gh-148817).
+FIRMWARE_DEVICE_TYPES: frozenset[str] = frozenset(
+    {DeviceType.INVERTER, DeviceType.GRIDBOSS}
+)
+
+
+class InverterFamily(StrEnum):
+    """Inverter family tags (mirrors the pylxpweb InverterFamily enum).
+
+    Used for feature-based sensor filtering.
+    """
+
+    SNA = "SNA"  # Split-phase, North America (12000XP, 6000XP)
+    PV_SERIES = "PV_SERIES"  # High-voltage DC (18KPV, etc.)
+    LXP_EU = "LXP_EU"  # European market
+    LXP_LV = "LXP_LV"  # Low-voltage DC
+    UNKNOWN = "UNKNOWN"
+
+
+INVERTER_FAMILY_SNA = InverterFamily.SNA
+INVERTER_FAMILY_PV_SERIES = InverterFamily.PV_SERIES
+INVERTER_FAMILY_LXP_EU = InverterFamily.LXP_EU
+INVERTER_FAMILY_LXP_LV = InverterFamily.LXP_LV
+INVERTER_FAMILY_UNKNOWN = InverterFamily.UNKNOWN
 
 # Feature-based sensor classification
 # These sets define which sensors are only available on specific device families
@@ -194,1791 +283,436 @@ VOLT_WATT_SENSORS: frozenset[str] = frozenset(
     }
 )
 
+
+# Device feature flag -> sensor keys only created when that feature is present
+SENSOR_KEYS_BY_FEATURE: Mapping[str, frozenset[str]] = MappingProxyType(
+    {
+        # Split-phase and discharge recovery sensors are SNA series only
+        "supports_split_phase": SPLIT_PHASE_ONLY_SENSORS,
+        "supports_discharge_recovery_hysteresis": DISCHARGE_RECOVERY_SENSORS,
+        # Three-phase and Volt-Watt sensors are PV Series / LXP-EU only
+        "supports_three_phase": THREE_PHASE_ONLY_SENSORS,
+        "supports_volt_watt_curve": VOLT_WATT_SENSORS,
+    }
+)
+ALL_SENSOR_FEATURES: frozenset[str] = frozenset(SENSOR_KEYS_BY_FEATURE)
+
+
+class NumberRange(NamedTuple):
+    """Limits for a number entity.
+
+    Attributes:
+        min: Minimum allowed value
+        max: Maximum allowed value
+        step: Increment between allowed values
+    """
+
+    min: float
+    max: float
+    step: float
+
+
 # Number entity limits
 # AC Charge Power (kW)
-AC_CHARGE_POWER_MIN = 0.0
-AC_CHARGE_POWER_MAX = 15.0
-AC_CHARGE_POWER_STEP = 0.1
+AC_CHARGE_POWER = NumberRange(0.0, 15.0, 0.1)
 
 # PV Charge Power (kW)
-PV_CHARGE_POWER_MIN = 0
-PV_CHARGE_POWER_MAX = 15
-PV_CHARGE_POWER_STEP = 1
+PV_CHARGE_POWER = NumberRange(0, 15, 1)
 
 # Grid Peak Shaving Power (kW)
-GRID_PEAK_SHAVING_POWER_MIN = 0.0
-GRID_PEAK_SHAVING_POWER_MAX = 25.5
-GRID_PEAK_SHAVING_POWER_STEP = 0.1
+GRID_PEAK_SHAVING_POWER = NumberRange(0.0, 25.5, 0.1)
 
 # Battery Charge/Discharge Current (A)
-BATTERY_CURRENT_MIN = 0
-BATTERY_CURRENT_MAX = 250
-BATTERY_CURRENT_STEP = 1
+BATTERY_CURRENT = NumberRange(0, 250, 1)
 
 # SOC Limits (%)
-SOC_LIMIT_MIN = 0
-SOC_LIMIT_MAX = 100
-SOC_LIMIT_STEP = 1
+SOC_LIMIT = NumberRange(0, 100, 1)
 
 # System Charge SOC Limit (%)
-SYSTEM_CHARGE_SOC_LIMIT_MIN = 10
-SYSTEM_CHARGE_SOC_LIMIT_MAX = 101
-SYSTEM_CHARGE_SOC_LIMIT_STEP = 1
-
-# Sensor types and their units
-SENSOR_TYPES = {
-    # Power sensors
-    "ac_power": {
-        "name": "AC Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power",
-    },
-    "dc_power": {
-        "name": "DC Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power",
-    },
-    "load_power": {
-        "name": "Load Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "consumption_power": {
-        "name": "Consumption Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "grid_power": {
-        "name": "Grid Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-    },
-    "grid_import_power": {
-        "name": "Grid Import Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower-import",
-    },
-    "grid_export_power": {
-        "name": "Grid Export Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower-export",
-    },
-    "battery_power": {
-        "name": "Battery Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "hybrid_power": {
-        "name": "Hybrid Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant-outline",
-    },
-    "battery_charge_power": {
-        "name": "Battery Charge Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    "battery_discharge_power": {
-        "name": "Battery Discharge Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery-minus",
-    },
-    "power_output": {
-        "name": "Power Output",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:flash",
-    },
-    "rectifier_power": {
-        "name": "Rectifier Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:flash-triangle",
-    },
-    "ac_couple_power": {
-        "name": "AC Couple Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "eps_power": {
-        "name": "EPS Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:power-plug",
-    },
-    "eps_power_l1": {
-        "name": "EPS Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:power-plug",
-    },
-    "eps_power_l2": {
-        "name": "EPS Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:power-plug",
-    },
-    # Synthetic sensor: Total Load Power (EPS + Consumption for power flow charts)
-    "total_load_power": {
-        "name": "Total Load Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "battery_status": {
-        "name": "Battery Status",
-        "icon": "mdi:battery-heart",
-    },
-    # Voltage sensors
-    "ac_voltage": {
-        "name": "AC Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:flash",
-        "suggested_display_precision": 1,
-    },
-    "dc_voltage": {
-        "name": "DC Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:flash",
-    },
-    "battery_voltage": {
-        "name": "Battery Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "bus1_voltage": {
-        "name": "Bus 1 Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:sine-wave",
-        "suggested_display_precision": 1,
-    },
-    "bus2_voltage": {
-        "name": "Bus 2 Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:sine-wave",
-        "suggested_display_precision": 1,
-    },
-    # Grid voltage and frequency sensors (R/S/T phases)
-    "grid_voltage_r": {
-        "name": "Grid Voltage R",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-        "suggested_display_precision": 1,
-    },
-    "grid_voltage_s": {
-        "name": "Grid Voltage S",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-        "suggested_display_precision": 1,
-    },
-    "grid_voltage_t": {
-        "name": "Grid Voltage T",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-        "suggested_display_precision": 1,
-    },
-    "grid_frequency": {
-        "name": "Grid Frequency",
-        "unit": UnitOfFrequency.HERTZ,
-        "device_class": "frequency",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-        "suggested_display_precision": 2,
-    },
-    # EPS (Emergency Power Supply) voltage sensors
-    "eps_voltage_r": {
-        "name": "EPS Voltage R",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:power-plug",
-        "suggested_display_precision": 1,
-    },
-    "eps_voltage_s": {
-        "name": "EPS Voltage S",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:power-plug",
-        "suggested_display_precision": 1,
-    },
-    "eps_voltage_t": {
-        "name": "EPS Voltage T",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:power-plug",
-        "suggested_display_precision": 1,
-    },
-    "eps_frequency": {
-        "name": "EPS Frequency",
-        "unit": UnitOfFrequency.HERTZ,
-        "device_class": "frequency",
-        "state_class": "measurement",
-        "icon": "mdi:power-plug",
-        "suggested_display_precision": 2,
-    },
-    # Current sensors
-    "ac_current": {
-        "name": "AC Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:current-ac",
-    },
-    "dc_current": {
-        "name": "DC Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:current-dc",
-    },
-    "battery_current": {
-        "name": "Battery Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    # Energy sensors
-    "total_energy": {
-        "name": "Total Energy",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:lightning-bolt",
-    },
-    "daily_energy": {
-        "name": "Daily Energy",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:calendar-today",
-    },
-    "monthly_energy": {
-        "name": "Monthly Energy",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:calendar-month",
-    },
-    "yearly_energy": {
-        "name": "Yearly Energy",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:calendar-year",
-    },
-    # Current day energy sensors (values need to be divided by 10)
-    "yield": {
-        "name": "Yield",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:solar-power",
-    },
-    "discharging": {
-        "name": "Discharging",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:battery-arrow-down",
-    },
-    "charging": {
-        "name": "Charging",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:battery-arrow-up",
-    },
-    "consumption": {
-        "name": "Consumption",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "grid_export": {
-        "name": "Grid Export",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:transmission-tower-export",
-    },
-    "grid_import": {
-        "name": "Grid Import",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:transmission-tower-import",
-    },
-    # Lifetime energy sensors (values need to be divided by 10)
-    "yield_lifetime": {
-        "name": "Yield (Lifetime)",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:solar-power",
-    },
-    "discharging_lifetime": {
-        "name": "Discharging (Lifetime)",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:battery-arrow-down",
-    },
-    "charging_lifetime": {
-        "name": "Charging (Lifetime)",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:battery-arrow-up",
-    },
-    "consumption_lifetime": {
-        "name": "Consumption (Lifetime)",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "grid_export_lifetime": {
-        "name": "Grid Export (Lifetime)",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:transmission-tower-export",
-    },
-    "grid_import_lifetime": {
-        "name": "Grid Import (Lifetime)",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:transmission-tower-import",
-    },
-    # Parallel Group aggregate battery sensors (calculated from all inverters)
-    "parallel_battery_charge_power": {
-        "name": "Battery Charge Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    "parallel_battery_discharge_power": {
-        "name": "Battery Discharge Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery-minus",
-    },
-    "parallel_battery_power": {
-        "name": "Battery Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "parallel_battery_soc": {
-        "name": "Battery State of Charge",
-        "unit": "%",
-        "device_class": "battery",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "parallel_battery_max_capacity": {
-        "name": "Battery Max Capacity",
-        "unit": "Ah",
-        "device_class": None,
-        "state_class": "measurement",
-        "icon": "mdi:battery-high",
-    },
-    "parallel_battery_current_capacity": {
-        "name": "Battery Current Capacity",
-        "unit": "Ah",
-        "device_class": None,
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "parallel_battery_voltage": {
-        "name": "Battery Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:flash",
-    },
-    "parallel_battery_count": {
-        "name": "Battery Count",
-        "unit": None,
-        "device_class": None,
-        "state_class": "measurement",
-        "icon": "mdi:battery-multiple",
-    },
-    # Battery charge/discharge energy sensors (pylxpweb 0.3.3+)
-    "battery_charge": {
-        "name": "Battery Charge",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:battery-charging",
-    },
-    "battery_discharge": {
-        "name": "Battery Discharge",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:battery-minus",
-    },
-    "battery_charge_lifetime": {
-        "name": "Battery Charge (Lifetime)",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:battery-charging",
-    },
-    "battery_discharge_lifetime": {
-        "name": "Battery Discharge (Lifetime)",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:battery-minus",
-    },
-    # Frequency
-    "frequency": {
-        "name": "Frequency",
-        "unit": UnitOfFrequency.HERTZ,
-        "device_class": "frequency",
-        "state_class": "measurement",
-        "icon": "mdi:sine-wave",
-    },
-    # Temperature
-    "temperature": {
-        "name": "Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:thermometer",
-    },
-    # Battery specific
-    "state_of_charge": {
-        "name": "State of Charge",
-        "unit": "%",
-        "device_class": "battery",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "state_of_health": {
-        "name": "State of Health",
-        "unit": "%",
-        "state_class": "measurement",
-        "icon": "mdi:battery-heart",
-    },
-    "cycle_count": {
-        "name": "Cycle Count",
-        "state_class": "total_increasing",
-        "icon": "mdi:counter",
-    },
-    # Battery Bank aggregate sensors (pylxpweb 0.3.3+)
-    "battery_bank_voltage": {
-        "name": "Battery Bank Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_bank_soc": {
-        "name": "Battery Bank SOC",
-        "unit": "%",
-        "device_class": "battery",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_bank_charge_power": {
-        "name": "Battery Bank Charge Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    "battery_bank_discharge_power": {
-        "name": "Battery Bank Discharge Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery-minus",
-    },
-    "battery_bank_power": {
-        "name": "Battery Bank Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    "battery_bank_max_capacity": {
-        "name": "Battery Bank Max Capacity",
-        "unit": "Ah",
-        "state_class": "measurement",
-        "icon": "mdi:battery-high",
-    },
-    "battery_bank_current_capacity": {
-        "name": "Battery Bank Current Capacity",
-        "unit": "Ah",
-        "state_class": "measurement",
-        "icon": "mdi:battery-medium",
-    },
-    "battery_bank_remain_capacity": {
-        "name": "Battery Bank Remaining Capacity",
-        "unit": "Ah",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_bank_full_capacity": {
-        "name": "Battery Bank Full Capacity",
-        "unit": "Ah",
-        "state_class": "measurement",
-        "icon": "mdi:battery-high",
-    },
-    "battery_bank_capacity_percent": {
-        "name": "Battery Bank Capacity Percent",
-        "unit": "%",
-        "state_class": "measurement",
-        "icon": "mdi:battery-heart",
-    },
-    "battery_bank_count": {
-        "name": "Battery Count",
-        "state_class": "measurement",
-        "icon": "mdi:counter",
-        "entity_category": "diagnostic",
-    },
-    "battery_bank_status": {
-        "name": "Battery Bank Status",
-        "icon": "mdi:information",
-        "entity_category": "diagnostic",
-    },
-    # Additional battery sensors from batteryArray
-    "battery_real_voltage": {
-        "name": "Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_real_current": {
-        "name": "Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_real_power": {
-        "name": "Real Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_cell_voltage_max": {
-        "name": "Cell Voltage Max",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:battery-plus-variant",
-    },
-    "battery_cell_voltage_min": {
-        "name": "Cell Voltage Min",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:battery-minus-variant",
-    },
-    "battery_cell_voltage_diff": {
-        "name": "Cell Voltage Difference",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:battery-sync",
-    },
-    "battery_mos_temperature": {
-        "name": "MOS Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:thermometer",
-    },
-    "battery_env_temperature": {
-        "name": "Environment Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:thermometer",
-    },
-    "battery_cell_temp_max": {
-        "name": "Max Cell Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:thermometer-chevron-up",
-    },
-    "battery_cell_temp_min": {
-        "name": "Min Cell Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:thermometer-chevron-down",
-    },
-    "battery_ambient_temperature": {
-        "name": "Ambient Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:home-thermometer",
-    },
-    "battery_remaining_capacity": {
-        "name": "Remaining Capacity",
-        "unit": "Ah",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_full_capacity": {
-        "name": "Full Capacity",
-        "unit": "Ah",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_design_capacity": {
-        "name": "Design Capacity",
-        "unit": "Ah",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_rsoc": {
-        "name": "Relative SOC",
-        "unit": "%",
-        "device_class": "battery",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_asoc": {
-        "name": "Absolute SOC",
-        "unit": "%",
-        "device_class": "battery",
-        "state_class": "measurement",
-        "icon": "mdi:battery",
-    },
-    "battery_firmware_version": {
-        "name": "Firmware Version",
-        "icon": "mdi:chip",
-        "entity_category": "diagnostic",
-    },
-    "battery_capacity_percentage": {
-        "name": "Capacity Percentage",
-        "unit": "%",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging-100",
-    },
-    "battery_max_charge_current": {
-        "name": "Max Charge Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:current-dc",
-    },
-    "battery_max_cell_temp_num": {
-        "name": "Max Temp Cell Number",
-        "icon": "mdi:numeric",
-        "entity_category": "diagnostic",
-    },
-    "battery_min_cell_temp_num": {
-        "name": "Min Temp Cell Number",
-        "icon": "mdi:numeric",
-        "entity_category": "diagnostic",
-    },
-    "battery_max_cell_voltage_num": {
-        "name": "Max Voltage Cell Number",
-        "icon": "mdi:numeric",
-        "entity_category": "diagnostic",
-    },
-    "battery_min_cell_voltage_num": {
-        "name": "Min Voltage Cell Number",
-        "icon": "mdi:numeric",
-        "entity_category": "diagnostic",
-    },
-    "firmware_version": {
-        "name": "Firmware Version",
-        "icon": "mdi:chip",
-        "entity_category": "diagnostic",
-    },
-    "inverter_family": {
-        "name": "Inverter Family",
-        "icon": "mdi:family-tree",
-        "entity_category": "diagnostic",
-    },
-    "device_type_code": {
-        "name": "Device Type Code",
-        "icon": "mdi:identifier",
-        "entity_category": "diagnostic",
-    },
-    "grid_type": {
-        "name": "Grid Type",
-        "icon": "mdi:transmission-tower",
-        "entity_category": "diagnostic",
-    },
-    "battery_balance_status": {
-        "name": "Balance Status",
-        "icon": "mdi:scale-balance",
-    },
-    "battery_protection_status": {
-        "name": "Protection Status",
-        "icon": "mdi:shield-check",
-    },
-    "battery_fault_status": {
-        "name": "Fault Status",
-        "icon": "mdi:alert-circle",
-    },
-    "battery_warning_status": {
-        "name": "Warning Status",
-        "icon": "mdi:alert",
-    },
-    # Battery temperature sensors (pylxpweb 0.3.3+)
-    "battery_max_cell_temp": {
-        "name": "Max Cell Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:thermometer-high",
-    },
-    "battery_min_cell_temp": {
-        "name": "Min Cell Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:thermometer-low",
-    },
-    # Battery cell voltage sensors (pylxpweb 0.3.3+)
-    "battery_max_cell_voltage": {
-        "name": "Max Cell Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:battery-plus",
-    },
-    "battery_min_cell_voltage": {
-        "name": "Min Cell Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:battery-minus",
-    },
-    "battery_cell_voltage_delta": {
-        "name": "Cell Voltage Delta",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:delta",
-        "suggested_display_precision": 3,
-    },
-    "battery_cell_temp_delta": {
-        "name": "Cell Temperature Delta",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:delta",
-    },
-    # Battery capacity sensors (pylxpweb 0.3.3+)
-    "battery_discharge_capacity": {
-        "name": "Discharge Capacity",
-        "unit": "Ah",
-        "icon": "mdi:battery-arrow-down",
-        "entity_category": "diagnostic",
-    },
-    "battery_charge_voltage_ref": {
-        "name": "Charge Voltage Reference",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    # Battery metadata sensors (pylxpweb 0.3.3+)
-    "battery_serial_number": {
-        "name": "Serial Number",
-        "icon": "mdi:identifier",
-        "entity_category": "diagnostic",
-    },
-    "battery_type": {
-        "name": "Battery Type Code",
-        "icon": "mdi:battery",
-        "entity_category": "diagnostic",
-    },
-    "battery_type_text": {
-        "name": "Battery Type",
-        "icon": "mdi:battery-sync",
-        "entity_category": "diagnostic",
-    },
-    "battery_bms_model": {
-        "name": "BMS Model",
-        "icon": "mdi:chip",
-        "entity_category": "diagnostic",
-    },
-    "battery_index": {
-        "name": "Index",
-        "icon": "mdi:numeric",
-        "entity_category": "diagnostic",
-    },
-    # PV String sensors
-    "pv1_voltage": {
-        "name": "PV1 Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:solar-panel",
-    },
-    "pv2_voltage": {
-        "name": "PV2 Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:solar-panel",
-    },
-    "pv3_voltage": {
-        "name": "PV3 Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:solar-panel",
-    },
-    "pv1_power": {
-        "name": "PV1 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-panel",
-    },
-    "pv2_power": {
-        "name": "PV2 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-panel",
-    },
-    "pv3_power": {
-        "name": "PV3 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-panel",
-    },
-    # GridBOSS MidBox specific sensors
-    "grid_voltage_l1": {
-        "name": "Grid Voltage L1",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-    },
-    "grid_voltage_l2": {
-        "name": "Grid Voltage L2",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-    },
-    "grid_voltage_l3": {
-        "name": "Grid Voltage L3",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-    },
-    "grid_current_l1": {
-        "name": "Grid Current L1",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-    },
-    "grid_current_l2": {
-        "name": "Grid Current L2",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-    },
-    "grid_current_l3": {
-        "name": "Grid Current L3",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-    },
-    "load_voltage_l1": {
-        "name": "Load Voltage L1",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "load_voltage_l2": {
-        "name": "Load Voltage L2",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "load_voltage_l3": {
-        "name": "Load Voltage L3",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "load_current_l1": {
-        "name": "Load Current L1",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "load_current_l2": {
-        "name": "Load Current L2",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "load_current_l3": {
-        "name": "Load Current L3",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "load_power_l1": {
-        "name": "Load Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "load_power_l2": {
-        "name": "Load Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "load_power_l3": {
-        "name": "Load Power L3",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "grid_power_l1": {
-        "name": "Grid Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-    },
-    "grid_power_l2": {
-        "name": "Grid Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-    },
-    "grid_power_l3": {
-        "name": "Grid Power L3",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:transmission-tower",
-    },
-    "ups_voltage": {
-        "name": "UPS Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    "ups_current": {
-        "name": "UPS Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    "ups_current_l1": {
-        "name": "UPS Current L1",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    "ups_current_l2": {
-        "name": "UPS Current L2",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    "ups_power": {
-        "name": "UPS Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    "ups_power_l1": {
-        "name": "UPS Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    "ups_power_l2": {
-        "name": "UPS Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:battery-charging",
-    },
-    # Status sensors (diagnostic)
-    "status_code": {
-        "name": "Status Code",
-        "icon": "mdi:numeric",
-        "entity_category": "diagnostic",
-    },
-    "status_text": {
-        "name": "Status",
-        "icon": "mdi:information",
-        "entity_category": "diagnostic",
-    },
-    "has_data": {
-        "name": "Has Runtime Data",
-        "icon": "mdi:database-check",
-        "entity_category": "diagnostic",
-    },
-    # New runtime sensors
-    "pv_total_power": {
-        "name": "PV Total Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power",
-    },
-    "internal_temperature": {
-        "name": "Internal Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:thermometer",
-        "entity_category": "diagnostic",
-    },
-    "radiator1_temperature": {
-        "name": "Radiator 1 Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:radiator",
-        "entity_category": "diagnostic",
-    },
-    "radiator2_temperature": {
-        "name": "Radiator 2 Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": "temperature",
-        "state_class": "measurement",
-        "icon": "mdi:radiator",
-        "entity_category": "diagnostic",
-    },
-    # GridBOSS Smart Load sensors
-    "smart_load_power": {
-        "name": "Smart Load Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load1_power": {
-        "name": "Smart Load 1 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load2_power": {
-        "name": "Smart Load 2 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load3_power": {
-        "name": "Smart Load 3 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load4_power": {
-        "name": "Smart Load 4 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    # GridBOSS Smart Port Status sensors
-    "smart_port1_status": {
-        "name": "Smart Port 1 Status",
-        "icon": "mdi:electric-switch",
-        "entity_category": "diagnostic",
-    },
-    "smart_port2_status": {
-        "name": "Smart Port 2 Status",
-        "icon": "mdi:electric-switch",
-        "entity_category": "diagnostic",
-    },
-    "smart_port3_status": {
-        "name": "Smart Port 3 Status",
-        "icon": "mdi:electric-switch",
-        "entity_category": "diagnostic",
-    },
-    "smart_port4_status": {
-        "name": "Smart Port 4 Status",
-        "icon": "mdi:electric-switch",
-        "entity_category": "diagnostic",
-    },
-    # GridBOSS Aggregate Energy sensors (L1 + L2 combined)
-    "ups_today": {
-        "name": "UPS Energy Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:battery-charging-100",
-    },
-    "ups_total": {
-        "name": "UPS Energy Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:battery-charging-100",
-    },
-    "grid_export_today": {
-        "name": "Grid Export Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:transmission-tower-export",
-    },
-    "grid_export_total": {
-        "name": "Grid Export Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:transmission-tower-export",
-    },
-    "grid_import_today": {
-        "name": "Grid Import Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:transmission-tower-import",
-    },
-    "grid_import_total": {
-        "name": "Grid Import Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:transmission-tower-import",
-    },
-    "load_today": {
-        "name": "Load Energy Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "load_total": {
-        "name": "Load Energy Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:home-lightning-bolt",
-    },
-    # GridBOSS AC Couple energy sensors
-    "ac_couple1_today": {
-        "name": "AC Couple 1 Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:solar-power",
-    },
-    "ac_couple1_total": {
-        "name": "AC Couple 1 Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:solar-power",
-    },
-    "ac_couple2_today": {
-        "name": "AC Couple 2 Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:solar-power",
-    },
-    "ac_couple2_total": {
-        "name": "AC Couple 2 Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:solar-power",
-    },
-    "ac_couple3_today": {
-        "name": "AC Couple 3 Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:solar-power",
-    },
-    "ac_couple3_total": {
-        "name": "AC Couple 3 Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:solar-power",
-    },
-    "ac_couple4_today": {
-        "name": "AC Couple 4 Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:solar-power",
-    },
-    "ac_couple4_total": {
-        "name": "AC Couple 4 Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:solar-power",
-    },
-    # GridBOSS Smart Load aggregate energy sensors (L1 + L2 combined)
-    "smart_load1_today": {
-        "name": "Smart Load 1 Energy Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load1_total": {
-        "name": "Smart Load 1 Energy Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load2_today": {
-        "name": "Smart Load 2 Energy Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load2_total": {
-        "name": "Smart Load 2 Energy Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load3_today": {
-        "name": "Smart Load 3 Energy Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load3_total": {
-        "name": "Smart Load 3 Energy Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load4_today": {
-        "name": "Smart Load 4 Energy Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load4_total": {
-        "name": "Smart Load 4 Energy Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "icon": "mdi:electric-switch",
-    },
-    # GridBOSS Generator sensors
-    "generator_voltage": {
-        "name": "Generator Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "icon": "mdi:engine",
-    },
-    "generator_frequency": {
-        "name": "Generator Frequency",
-        "unit": UnitOfFrequency.HERTZ,
-        "device_class": "frequency",
-        "state_class": "measurement",
-        "icon": "mdi:engine",
-    },
-    "generator_power": {
-        "name": "Generator Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:engine",
-    },
-    # GridBOSS Phase Lock Frequency
-    "phase_lock_frequency": {
-        "name": "Phase Lock Frequency",
-        "unit": UnitOfFrequency.HERTZ,
-        "device_class": "frequency",
-        "state_class": "measurement",
-        "icon": "mdi:sine-wave",
-    },
-    # GridBOSS Generator L1/L2 sensors
-    "generator_current_l1": {
-        "name": "Generator Current L1",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:engine",
-    },
-    "generator_current_l2": {
-        "name": "Generator Current L2",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": "current",
-        "state_class": "measurement",
-        "icon": "mdi:engine",
-    },
-    "generator_power_l1": {
-        "name": "Generator Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:engine",
-    },
-    "generator_power_l2": {
-        "name": "Generator Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:engine",
-    },
-    # GridBOSS Smart Load L1/L2 Power sensors
-    "smart_load1_power_l1": {
-        "name": "Smart Load 1 Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load1_power_l2": {
-        "name": "Smart Load 1 Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load2_power_l1": {
-        "name": "Smart Load 2 Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load2_power_l2": {
-        "name": "Smart Load 2 Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load3_power_l1": {
-        "name": "Smart Load 3 Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load3_power_l2": {
-        "name": "Smart Load 3 Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load4_power_l1": {
-        "name": "Smart Load 4 Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    "smart_load4_power_l2": {
-        "name": "Smart Load 4 Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:electric-switch",
-    },
-    # GridBOSS AC Couple aggregate Power sensors (per-port totals)
-    "ac_couple1_power": {
-        "name": "AC Couple 1 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "ac_couple2_power": {
-        "name": "AC Couple 2 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "ac_couple3_power": {
-        "name": "AC Couple 3 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "ac_couple4_power": {
-        "name": "AC Couple 4 Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    # GridBOSS AC Couple L1/L2 Power sensors
-    "ac_couple1_power_l1": {
-        "name": "AC Couple 1 Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "ac_couple1_power_l2": {
-        "name": "AC Couple 1 Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "ac_couple2_power_l1": {
-        "name": "AC Couple 2 Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "ac_couple2_power_l2": {
-        "name": "AC Couple 2 Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "ac_couple3_power_l1": {
-        "name": "AC Couple 3 Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "ac_couple3_power_l2": {
-        "name": "AC Couple 3 Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "ac_couple4_power_l1": {
-        "name": "AC Couple 4 Power L1",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    "ac_couple4_power_l2": {
-        "name": "AC Couple 4 Power L2",
-        "unit": UnitOfPower.WATT,
-        "device_class": "power",
-        "state_class": "measurement",
-        "icon": "mdi:solar-power-variant",
-    },
-    # Individual Inverter Energy API additional sensors
-    "inverter_power_rating": {
-        "name": "Power Rating",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:lightning-bolt",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "inverter_lost_status": {
-        "name": "Connection Lost",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:access-point-network-off",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "off_grid": {
-        "name": "Off Grid",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:transmission-tower-off",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "inverter_has_runtime_data": {
-        "name": "Has Runtime Data",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:database-check",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-}
+SYSTEM_CHARGE_SOC_LIMIT = NumberRange(10, 101, 1)
 
+# Individual limit aliases kept for backward compatibility
+AC_CHARGE_POWER_MIN = AC_CHARGE_POWER.min
+AC_CHARGE_POWER_MAX = AC_CHARGE_POWER.max
+AC_CHARGE_POWER_STEP = AC_CHARGE_POWER.step
+PV_CHARGE_POWER_MIN = PV_CHARGE_POWER.min
+PV_CHARGE_POWER_MAX = PV_CHARGE_POWER.max
+PV_CHARGE_POWER_STEP = PV_CHARGE_POWER.step
+GRID_PEAK_SHAVING_POWER_MIN = GRID_PEAK_SHAVING_POWER.min
+GRID_PEAK_SHAVING_POWER_MAX = GRID_PEAK_SHAVING_POWER.max
+GRID_PEAK_SHAVING_POWER_STEP = GRID_PEAK_SHAVING_POWER.step
+BATTERY_CURRENT_MIN = BATTERY_CURRENT.min
+BATTERY_CURRENT_MAX = BATTERY_CURRENT.max
+BATTERY_CURRENT_STEP = BATTERY_CURRENT.step
+SOC_LIMIT_MIN = SOC_LIMIT.min
+SOC_LIMIT_MAX = SOC_LIMIT.max
+SOC_LIMIT_STEP = SOC_LIMIT.step
+SYSTEM_CHARGE_SOC_LIMIT_MIN = SYSTEM_CHARGE_SOC_LIMIT.min
+SYSTEM_CHARGE_SOC_LIMIT_MAX = SYSTEM_CHARGE_SOC_LIMIT.max
+SYSTEM_CHARGE_SOC_LIMIT_STEP = SYSTEM_CHARGE_SOC_LIMIT.step
 
-# Sensor field mappings to reduce duplication
-INVERTER_RUNTIME_FIELD_MAPPING = {
-    # System information sensors
-    "status": "status_code",
-    "statusText": "status_text",
-    # Power sensors
-    "pinv": "ac_power",
-    "ppv": "pv_total_power",
-    "ppv1": "pv1_power",
-    "ppv2": "pv2_power",
-    "ppv3": "pv3_power",
-    "pCharge": "battery_charge_power",
-    "pDisCharge": "battery_discharge_power",
-    "batPower": "battery_power",
-    "batStatus": "battery_status",
-    "consumptionPower": "consumption_power",
-    # Note: grid_power calculated from pToUser - pToGrid in coordinator
-    # Voltage sensors
-    "acVoltage": "ac_voltage",
-    "dcVoltage": "dc_voltage",
-    "vacr": "ac_voltage",  # AC Voltage (needs division by 10)
-    "vBat": "battery_voltage",
-    "vpv1": "pv1_voltage",
-    "vpv2": "pv2_voltage",
-    "vpv3": "pv3_voltage",
-    # Current sensors
-    "acCurrent": "ac_current",
-    "dcCurrent": "dc_current",
-    # Other sensors
-    "soc": "state_of_charge",
-    "frequency": "frequency",
-    "tinner": "internal_temperature",
-    "tradiator1": "radiator1_temperature",
-    "tradiator2": "radiator2_temperature",
-    # Energy sensors (today values - need division by 10)
-    "todayYielding": "yield",
-    "todayDischarging": "discharging",
-    "todayCharging": "charging",
-    "todayLoad": "load",
-    "todayGridFeed": "grid_export",
-    "todayGridConsumption": "grid_import",
-    # Total energy values (need division by 10)
-    "totalYielding": "yield_lifetime",
-    "totalDischarging": "discharging_lifetime",
-    "totalCharging": "charging_lifetime",
-    "totalLoad": "load_lifetime",
-    "totalGridFeed": "grid_export_lifetime",
-    "totalGridConsumption": "grid_import_lifetime",
-}
+# Suggested display precision overrides, kept out of SENSOR_TYPES so the
+# per-sensor dicts share the same key layout
+SENSOR_DISPLAY_PRECISION: Mapping[str, int] = MappingProxyType(
+    {
+        "ac_voltage": 1,
+        "bus1_voltage": 1,
+        "bus2_voltage": 1,
+        "grid_voltage_r": 1,
+        "grid_voltage_s": 1,
+        "grid_voltage_t": 1,
+        "grid_frequency": 2,
+        "eps_voltage_r": 1,
+        "eps_voltage_s": 1,
+        "eps_voltage_t": 1,
+        "eps_frequency": 2,
+        "battery_cell_voltage_delta": 3,
+    }
+)
 
 
-GRIDBOSS_FIELD_MAPPING = {
-    # Frequency sensors (need division by 100)
-    "gridFreq": "frequency",
-    "genFreq": "generator_frequency",
-    "phaseLockFreq": "phase_lock_frequency",
-    # GridBOSS MidBox voltage sensors (need division by 10)
-    "gridL1RmsVolt": "grid_voltage_l1",
-    "gridL2RmsVolt": "grid_voltage_l2",
-    "upsL1RmsVolt": "load_voltage_l1",
-    "upsL2RmsVolt": "load_voltage_l2",
-    "upsRmsVolt": "ups_voltage",
-    "gridRmsVolt": "grid_voltage",
-    "genRmsVolt": "generator_voltage",
-    # GridBOSS MidBox current sensors (need division by 10)
-    "gridL1RmsCurr": "grid_current_l1",
-    "gridL2RmsCurr": "grid_current_l2",
-    "loadL1RmsCurr": "load_current_l1",
-    "loadL2RmsCurr": "load_current_l2",
-    "upsL1RmsCurr": "ups_current_l1",
-    "upsL2RmsCurr": "ups_current_l2",
-    "genL1RmsCurr": "generator_current_l1",
-    "genL2RmsCurr": "generator_current_l2",
-    # Power sensors
-    "gridL1ActivePower": "grid_power_l1",
-    "gridL2ActivePower": "grid_power_l2",
-    "loadL1ActivePower": "load_power_l1",
-    "loadL2ActivePower": "load_power_l2",
-    "upsL1ActivePower": "ups_power_l1",
-    "upsL2ActivePower": "ups_power_l2",
-    "genL1ActivePower": "generator_power_l1",
-    "genL2ActivePower": "generator_power_l2",
-    "smartLoad1L1ActivePower": "smart_load1_power_l1",
-    "smartLoad1L2ActivePower": "smart_load1_power_l2",
-    "smartLoad2L1ActivePower": "smart_load2_power_l1",
-    "smartLoad2L2ActivePower": "smart_load2_power_l2",
-    "smartLoad3L1ActivePower": "smart_load3_power_l1",
-    "smartLoad3L2ActivePower": "smart_load3_power_l2",
-    "smartLoad4L1ActivePower": "smart_load4_power_l1",
-    "smartLoad4L2ActivePower": "smart_load4_power_l2",
-    # Smart Port status sensors
-    "smartPort1Status": "smart_port1_status",
-    "smartPort2Status": "smart_port2_status",
-    "smartPort3Status": "smart_port3_status",
-    "smartPort4Status": "smart_port4_status",
-    # Energy sensors - UPS daily and lifetime values (need division by 10)
-    "eUpsTodayL1": "ups_l1",
-    "eUpsTodayL2": "ups_l2",
-    "eUpsTotalL1": "ups_lifetime_l1",
-    "eUpsTotalL2": "ups_lifetime_l2",
-    # Energy sensors - Grid interaction daily and lifetime values (need division by 10)
-    "eToGridTodayL1": "grid_export_l1",
-    "eToGridTodayL2": "grid_export_l2",
-    "eToUserTodayL1": "grid_import_l1",
-    "eToUserTodayL2": "grid_import_l2",
-    "eToGridTotalL1": "grid_export_lifetime_l1",
-    "eToGridTotalL2": "grid_export_lifetime_l2",
-    "eToUserTotalL1": "grid_import_lifetime_l1",
-    "eToUserTotalL2": "grid_import_lifetime_l2",
-    # Energy sensors - Load daily and lifetime values (need division by 10)
-    "eLoadTodayL1": "load_l1",
-    "eLoadTodayL2": "load_l2",
-    "eLoadTotalL1": "load_lifetime_l1",
-    "eLoadTotalL2": "load_lifetime_l2",
-    # Energy sensors - AC Couple daily values (need division by 10)
-    "eACcouple1TodayL1": "ac_couple1_l1",
-    "eACcouple1TodayL2": "ac_couple1_l2",
-    "eACcouple2TodayL1": "ac_couple2_l1",
-    "eACcouple2TodayL2": "ac_couple2_l2",
-    "eACcouple3TodayL1": "ac_couple3_l1",
-    "eACcouple3TodayL2": "ac_couple3_l2",
-    "eACcouple4TodayL1": "ac_couple4_l1",
-    "eACcouple4TodayL2": "ac_couple4_l2",
-    # Energy sensors - AC Couple lifetime values (need division by 10)
-    "eACcouple1TotalL1": "ac_couple1_lifetime_l1",
-    "eACcouple1TotalL2": "ac_couple1_lifetime_l2",
-    "eACcouple2TotalL1": "ac_couple2_lifetime_l1",
-    "eACcouple2TotalL2": "ac_couple2_lifetime_l2",
-    "eACcouple3TotalL1": "ac_couple3_lifetime_l1",
-    "eACcouple3TotalL2": "ac_couple3_lifetime_l2",
-    "eACcouple4TotalL1": "ac_couple4_lifetime_l1",
-    "eACcouple4TotalL2": "ac_couple4_lifetime_l2",
-    # Energy sensors - Smart Load daily values (need division by 10)
-    "eSmartLoad1TodayL1": "smart_load1_l1",
-    "eSmartLoad1TodayL2": "smart_load1_l2",
-    "eSmartLoad2TodayL1": "smart_load2_l1",
-    "eSmartLoad2TodayL2": "smart_load2_l2",
-    "eSmartLoad3TodayL1": "smart_load3_l1",
-    "eSmartLoad3TodayL2": "smart_load3_l2",
-    "eSmartLoad4TodayL1": "smart_load4_l1",
-    "eSmartLoad4TodayL2": "smart_load4_l2",
-    # Energy sensors - Smart Load lifetime values (need division by 10)
-    "eSmartLoad1TotalL1": "smart_load1_lifetime_l1",
-    "eSmartLoad1TotalL2": "smart_load1_lifetime_l2",
-    "eSmartLoad2TotalL1": "smart_load2_lifetime_l1",
-    "eSmartLoad2TotalL2": "smart_load2_lifetime_l2",
-    "eSmartLoad3TotalL1": "smart_load3_lifetime_l1",
-    "eSmartLoad3TotalL2": "smart_load3_lifetime_l2",
-    "eSmartLoad4TotalL1": "smart_load4_lifetime_l1",
-    "eSmartLoad4TotalL2": "smart_load4_lifetime_l2",
-    # Other energy sensors (need division by 10)
-    "eEnergyToUser": "energy_to_user",
-    "eUpsEnergy": "ups_energy",
-    # Connection status (same as inverter)
-    "lost": "inverter_lost_status",
-}
+def _intern(value: Any) -> Any:
+    """Intern plain strings; enum members and None are returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _freeze_specs(specs: dict[str, SensorSpec]) -> Mapping[str, SensorSpec]:
+    """Intern repeated spec values and wrap the table read-only.
+
+    Icons and plain-string units ("%", "Ah") repeat across many sensors;
+    interning makes equal values share one object. Records are only copied
+    when interning swaps a value, and sensors with identical definitions
+    share a single record.
+    """
+    canonical: dict[SensorSpec, SensorSpec] = {}
+    frozen: dict[str, SensorSpec] = {}
+    for sensor_key, spec in specs.items():
+        unit, icon = _intern(spec.unit), _intern(spec.icon)
+        if unit is not spec.unit or icon is not spec.icon:
+            spec = replace(spec, unit=unit, icon=icon)
+        frozen[sensor_key] = canonical.setdefault(spec, spec)
+    return MappingProxyType(frozen)
+
+
+def _build_sensor_types() -> Mapping[str, SensorSpec]:
+    """Load the sensor definition table.
+
+    Called on first access to SENSOR_TYPES (see __getattr__ below). The
+    table lives in its own module so importing const stays cheap.
+    """
+    from .sensor_types import build_sensor_types  # noqa: PLC0415
+
+    return _freeze_specs(build_sensor_types())
+
+
+def _build_sensor_type_keys() -> tuple[str, ...]:
+    """Snapshot SENSOR_TYPES keys so hot loops skip dict view creation."""
+    return tuple(__getattr__("SENSOR_TYPES"))
+
 
-PARALLEL_GROUP_FIELD_MAPPING = {
-    # Today energy values (need division by 10)
-    "todayYielding": "yield",
-    "todayDischarging": "discharging",
-    "todayCharging": "charging",
-    "todayExport": "grid_export",
-    "todayImport": "grid_import",
-    "todayUsage": "consumption",
-    # Total energy values (need division by 10)
-    "totalYielding": "yield_lifetime",
-    "totalDischarging": "discharging_lifetime",
-    "totalCharging": "charging_lifetime",
-    "totalExport": "grid_export_lifetime",
-    "totalImport": "grid_import_lifetime",
-    "totalUsage": "consumption_lifetime",
+def _build_sensor_type_items() -> tuple[tuple[str, SensorSpec], ...]:
+    """Snapshot SENSOR_TYPES items so hot loops skip dict view creation."""
+    return tuple(__getattr__("SENSOR_TYPES").items())
+
+
+def _display_precision(
+    sensor_key: str, device_class: SensorDeviceClass | None
+) -> int | None:
+    """Get display precision from overrides or device class defaults."""
+    if (precision := SENSOR_DISPLAY_PRECISION.get(sensor_key)) is not None:
+        return precision
+    if device_class is SensorDeviceClass.VOLTAGE:
+        return 2
+    return None
+
+
+def _build_sensor_descriptions() -> Mapping[str, SensorEntityDescription]:
+    """Build one shared entity description per sensor type."""
+    return MappingProxyType(
+        {
+            sensor_key: SensorEntityDescription(
+                key=sensor_key,
+                name=spec.name,
+                native_unit_of_measurement=spec.unit,
+                device_class=spec.device_class,
+                state_class=spec.state_class,
+                icon=spec.icon,
+                suggested_display_precision=_display_precision(
+                    sensor_key, spec.device_class
+                ),
+            )
+            for sensor_key, spec in __getattr__("SENSOR_TYPE_ITEMS")
+        }
+    )
+
+
+def _build_parallel_group_entity_ids() -> Mapping[str, str]:
+    """Prebuild parallel group sensor entity IDs, which depend only on the key."""
+    return MappingProxyType(
+        {
+            sensor_key: sys.intern(
+                f"{SENSOR_ENTITY_ID_PREFIX}parallel_group_{sensor_key}"
+            )
+            for sensor_key in __getattr__("SENSOR_TYPE_KEYS")
+        }
+    )
+
+
+# Sensor tables built on first access rather than at import time
+_LAZY_CONSTANTS: dict[str, Callable[[], Any]] = {
+    "SENSOR_TYPES": _build_sensor_types,
+    "SENSOR_TYPE_KEYS": _build_sensor_type_keys,
+    "SENSOR_TYPE_ITEMS": _build_sensor_type_items,
+    "SENSOR_DESCRIPTIONS": _build_sensor_descriptions,
+    "PARALLEL_GROUP_ENTITY_ID_BY_KEY": _build_parallel_group_entity_ids,
 }
 
-# Add individual inverter energy fields to the existing parallel group mapping
-# This extends the parallel group mapping to include additional fields from individual inverter API
-PARALLEL_GROUP_FIELD_MAPPING.update(
+if TYPE_CHECKING:
+    SENSOR_TYPES: Mapping[str, SensorSpec]
+    SENSOR_TYPE_KEYS: tuple[str, ...]
+    SENSOR_TYPE_ITEMS: tuple[tuple[str, SensorSpec], ...]
+    SENSOR_DESCRIPTIONS: Mapping[str, SensorEntityDescription]
+    PARALLEL_GROUP_ENTITY_ID_BY_KEY: Mapping[str, str]
+
+
+def __getattr__(name: str) -> Any:
+    """Build lazy module constants on first access (PEP 562).
+
+    The built value is stored in the module globals, so later lookups
+    bypass this hook entirely.
+    """
+    if (builder := _LAZY_CONSTANTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+
+@functools.cache
+def sensor_types_for(features: frozenset[str]) -> Mapping[str, SensorSpec]:
+    """Return the sensor table for a device with the given feature flags.
+
+    Sensors gated behind a feature the device lacks are left out. Memoized
+    per feature combination, so each distinct inverter profile shares one
+    read-only view.
+
+    Args:
+        features: Supported feature flags, a subset of ALL_SENSOR_FEATURES
+
+    Returns:
+        Read-only mapping of sensor key to SensorSpec
+    """
+    excluded = frozenset().union(
+        *(
+            keys
+            for feature, keys in SENSOR_KEYS_BY_FEATURE.items()
+            if feature not in features
+        )
+    )
+    if not excluded:
+        return __getattr__("SENSOR_TYPES")
+    return MappingProxyType(
+        {
+            key: spec
+            for key, spec in __getattr__("SENSOR_TYPE_ITEMS")
+            if key not in excluded
+        }
+    )
+
+
+@functools.cache
+def get_sensor_spec(sensor_key: str) -> SensorSpec:
+    """Return the SensorSpec for a key, or a name-only spec for unknown keys."""
+    return __getattr__("SENSOR_TYPES").get(sensor_key) or SensorSpec(name=sensor_key)
+
+
+@functools.cache
+def get_sensor_description(sensor_key: str) -> SensorEntityDescription:
+    """Return the shared entity description for a sensor key.
+
+    Unknown keys get a name-only description, built once per key.
+    """
+    if (description := __getattr__("SENSOR_DESCRIPTIONS").get(sensor_key)) is None:
+        return SensorEntityDescription(key=sensor_key, name=sensor_key)
+    return description
+
+
+# Sensor field mappings to reduce duplication
+INVERTER_RUNTIME_FIELD_MAPPING: Mapping[str, str] = MappingProxyType(
     {
+        # System information sensors
+        "status": "status_code",
+        "statusText": "status_text",
+        # Power sensors
+        "pinv": "ac_power",
+        "ppv": "pv_total_power",
+        "ppv1": "pv1_power",
+        "ppv2": "pv2_power",
+        "ppv3": "pv3_power",
+        "pCharge": "battery_charge_power",
+        "pDisCharge": "battery_discharge_power",
+        "batPower": "battery_power",
+        "batStatus": "battery_status",
+        "consumptionPower": "consumption_power",
+        # Note: grid_power calculated from pToUser - pToGrid in coordinator
+        # Voltage sensors
+        "acVoltage": "ac_voltage",
+        "dcVoltage": "dc_voltage",
+        "vacr": "ac_voltage",  # AC Voltage (needs division by 10)
+        "vBat": "battery_voltage",
+        "vpv1": "pv1_voltage",
+        "vpv2": "pv2_voltage",
+        "vpv3": "pv3_voltage",
+        # Current sensors
+        "acCurrent": "ac_current",
+        "dcCurrent": "dc_current",
+        # Other sensors
+        "soc": "state_of_charge",
+        "frequency": "frequency",
+        "tinner": "internal_temperature",
+        "tradiator1": "radiator1_temperature",
+        "tradiator2": "radiator2_temperature",
+        # Energy sensors (today values - need division by 10)
+        "todayYielding": "yield",
+        "todayDischarging": "discharging",
+        "todayCharging": "charging",
+        "todayLoad": "load",
+        "todayGridFeed": "grid_export",
+        "todayGridConsumption": "grid_import",
+        # Total energy values (need division by 10)
+        "totalYielding": "yield_lifetime",
+        "totalDischarging": "discharging_lifetime",
+        "totalCharging": "charging_lifetime",
+        "totalLoad": "load_lifetime",
+        "totalGridFeed": "grid_export_lifetime",
+        "totalGridConsumption": "grid_import_lifetime",
+    }
+)
+
+
+GRIDBOSS_FIELD_MAPPING: Mapping[str, str] = MappingProxyType(
+    {
+        # Frequency sensors (need division by 100)
+        "gridFreq": "frequency",
+        "genFreq": "generator_frequency",
+        "phaseLockFreq": "phase_lock_frequency",
+        # GridBOSS MidBox voltage sensors (need division by 10)
+        "gridL1RmsVolt": "grid_voltage_l1",
+        "gridL2RmsVolt": "grid_voltage_l2",
+        "upsL1RmsVolt": "load_voltage_l1",
+        "upsL2RmsVolt": "load_voltage_l2",
+        "upsRmsVolt": "ups_voltage",
+        "gridRmsVolt": "grid_voltage",
+        "genRmsVolt": "generator_voltage",
+        # GridBOSS MidBox current sensors (need division by 10)
+        "gridL1RmsCurr": "grid_current_l1",
+        "gridL2RmsCurr": "grid_current_l2",
+        "loadL1RmsCurr": "load_current_l1",
+        "loadL2RmsCurr": "load_current_l2",
+        "upsL1RmsCurr": "ups_current_l1",
+        "upsL2RmsCurr": "ups_current_l2",
+        "genL1RmsCurr": "generator_current_l1",
+        "genL2RmsCurr": "generator_current_l2",
+        # Power sensors
+        "gridL1ActivePower": "grid_power_l1",
+        "gridL2ActivePower": "grid_power_l2",
+        "loadL1ActivePower": "load_power_l1",
+        "loadL2ActivePower": "load_power_l2",
+        "upsL1ActivePower": "ups_power_l1",
+        "upsL2ActivePower": "ups_power_l2",
+        "genL1ActivePower": "generator_power_l1",
+        "genL2ActivePower": "generator_power_l2",
+        "smartLoad1L1ActivePower": "smart_load1_power_l1",
+        "smartLoad1L2ActivePower": "smart_load1_power_l2",
+        "smartLoad2L1ActivePower": "smart_load2_power_l1",
+        "smartLoad2L2ActivePower": "smart_load2_power_l2",
+        "smartLoad3L1ActivePower": "smart_load3_power_l1",
+        "smartLoad3L2ActivePower": "smart_load3_power_l2",
+        "smartLoad4L1ActivePower": "smart_load4_power_l1",
+        "smartLoad4L2ActivePower": "smart_load4_power_l2",
+        # Smart Port status sensors
+        "smartPort1Status": "smart_port1_status",
+        "smartPort2Status": "smart_port2_status",
+        "smartPort3Status": "smart_port3_status",
+        "smartPort4Status": "smart_port4_status",
+        # Energy sensors - UPS daily and lifetime values (need division by 10)
+        "eUpsTodayL1": "ups_l1",
+        "eUpsTodayL2": "ups_l2",
+        "eUpsTotalL1": "ups_lifetime_l1",
+        "eUpsTotalL2": "ups_lifetime_l2",
+        # Energy sensors - Grid interaction daily and lifetime (need division by 10)
+        "eToGridTodayL1": "grid_export_l1",
+        "eToGridTodayL2": "grid_export_l2",
+        "eToUserTodayL1": "grid_import_l1",
+        "eToUserTodayL2": "grid_import_l2",
+        "eToGridTotalL1": "grid_export_lifetime_l1",
+        "eToGridTotalL2": "grid_export_lifetime_l2",
+        "eToUserTotalL1": "grid_import_lifetime_l1",
+        "eToUserTotalL2": "grid_import_lifetime_l2",
+        # Energy sensors - Load daily and lifetime values (need division by 10)
+        "eLoadTodayL1": "load_l1",
+        "eLoadTodayL2": "load_l2",
+        "eLoadTotalL1": "load_lifetime_l1",
+        "eLoadTotalL2": "load_lifetime_l2",
+        # Energy sensors - AC Couple daily values (need division by 10)
+        "eACcouple1TodayL1": "ac_couple1_l1",
+        "eACcouple1TodayL2": "ac_couple1_l2",
+        "eACcouple2TodayL1": "ac_couple2_l1",
+        "eACcouple2TodayL2": "ac_couple2_l2",
+        "eACcouple3TodayL1": "ac_couple3_l1",
+        "eACcouple3TodayL2": "ac_couple3_l2",
+        "eACcouple4TodayL1": "ac_couple4_l1",
+        "eACcouple4TodayL2": "ac_couple4_l2",
+        # Energy sensors - AC Couple lifetime values (need division by 10)
+        "eACcouple1TotalL1": "ac_couple1_lifetime_l1",
+        "eACcouple1TotalL2": "ac_couple1_lifetime_l2",
+        "eACcouple2TotalL1": "ac_couple2_lifetime_l1",
+        "eACcouple2TotalL2": "ac_couple2_lifetime_l2",
+        "eACcouple3TotalL1": "ac_couple3_lifetime_l1",
+        "eACcouple3TotalL2": "ac_couple3_lifetime_l2",
+        "eACcouple4TotalL1": "ac_couple4_lifetime_l1",
+        "eACcouple4TotalL2": "ac_couple4_lifetime_l2",
+        # Energy sensors - Smart Load daily values (need division by 10)
+        "eSmartLoad1TodayL1": "smart_load1_l1",
+        "eSmartLoad1TodayL2": "smart_load1_l2",
+        "eSmartLoad2TodayL1": "smart_load2_l1",
+        "eSmartLoad2TodayL2": "smart_load2_l2",
+        "eSmartLoad3TodayL1": "smart_load3_l1",
+        "eSmartLoad3TodayL2": "smart_load3_l2",
+        "eSmartLoad4TodayL1": "smart_load4_l1",
+        "eSmartLoad4TodayL2": "smart_load4_l2",
+        # Energy sensors - Smart Load lifetime values (need division by 10)
+        "eSmartLoad1TotalL1": "smart_load1_lifetime_l1",
+        "eSmartLoad1TotalL2": "smart_load1_lifetime_l2",
+        "eSmartLoad2TotalL1": "smart_load2_lifetime_l1",
+        "eSmartLoad2TotalL2": "smart_load2_lifetime_l2",
+        "eSmartLoad3TotalL1": "smart_load3_lifetime_l1",
+        "eSmartLoad3TotalL2": "smart_load3_lifetime_l2",
+        "eSmartLoad4TotalL1": "smart_load4_lifetime_l1",
+        "eSmartLoad4TotalL2": "smart_load4_lifetime_l2",
+        # Other energy sensors (need division by 10)
+        "eEnergyToUser": "energy_to_user",
+        "eUpsEnergy": "ups_energy",
+        # Connection status (same as inverter)
+        "lost": "inverter_lost_status",
+    }
+)
+
+PARALLEL_GROUP_FIELD_MAPPING: Mapping[str, str] = MappingProxyType(
+    {
+        # Today energy values (need division by 10)
+        "todayYielding": "yield",
+        "todayDischarging": "discharging",
+        "todayCharging": "charging",
+        "todayExport": "grid_export",
+        "todayImport": "grid_import",
+        "todayUsage": "consumption",
+        # Total energy values (need division by 10)
+        "totalYielding": "yield_lifetime",
+        "totalDischarging": "discharging_lifetime",
+        "totalCharging": "charging_lifetime",
+        "totalExport": "grid_export_lifetime",
+        "totalImport": "grid_import_lifetime",
+        "totalUsage": "consumption_lifetime",
         # Additional fields from individual inverter energy API
         "soc": "state_of_charge",
         "powerRatingText": "inverter_power_rating",
@@ -1987,13 +721,31 @@ PARALLEL_GROUP_FIELD_MAPPING.update(
     }
 )
 
-# Use the same field mapping for both parallel group and individual inverter energy data
-# This ensures consistent entity creation across different API endpoints
-INVERTER_ENERGY_FIELD_MAPPING = PARALLEL_GROUP_FIELD_MAPPING.copy()
-
-# Add basic energy information fields that might come from other endpoints
-INVERTER_ENERGY_FIELD_MAPPING.update(
+# Individual inverter energy data uses the parallel group fields, so entity
+# creation stays consistent across API endpoints, plus basic energy fields
+# that might come from other endpoints
+INVERTER_ENERGY_FIELD_MAPPING: Mapping[str, str] = MappingProxyType(
     {
+        # Today energy values (need division by 10)
+        "todayYielding": "yield",
+        "todayDischarging": "discharging",
+        "todayCharging": "charging",
+        "todayExport": "grid_export",
+        "todayImport": "grid_import",
+        "todayUsage": "consumption",
+        # Total energy values (need division by 10)
+        "totalYielding": "yield_lifetime",
+        "totalDischarging": "discharging_lifetime",
+        "totalCharging": "charging_lifetime",
+        "totalExport": "grid_export_lifetime",
+        "totalImport": "grid_import_lifetime",
+        "totalUsage": "consumption_lifetime",
+        # Additional fields from individual inverter energy API
+        "soc": "state_of_charge",
+        "powerRatingText": "inverter_power_rating",
+        "lost": "inverter_lost_status",
+        "hasRuntimeData": "inverter_has_runtime_data",
+        # Basic energy information fields
         "totalEnergy": "total_energy",
         "dailyEnergy": "daily_energy",
         "monthlyEnergy": "monthly_energy",
@@ -2002,228 +754,245 @@ INVERTER_ENERGY_FIELD_MAPPING.update(
 )
 
 # Shared sensor lists to reduce duplication
-DIVIDE_BY_10_SENSORS = {
-    "yield",
-    "discharging",
-    "charging",
-    "load",
-    "grid_export",
-    "grid_import",
-    "consumption",
-    "yield_lifetime",
-    "discharging_lifetime",
-    "charging_lifetime",
-    "load_lifetime",
-    "grid_export_lifetime",
-    "grid_import_lifetime",
-    "consumption_lifetime",
-    # GridBOSS energy sensors
-    "ups_l1",
-    "ups_l2",
-    "ups_lifetime_l1",
-    "ups_lifetime_l2",
-    "grid_export_l1",
-    "grid_export_l2",
-    "grid_import_l1",
-    "grid_import_l2",
-    "grid_export_lifetime_l1",
-    "grid_export_lifetime_l2",
-    "grid_import_lifetime_l1",
-    "grid_import_lifetime_l2",
-    "load_l1",
-    "load_l2",
-    "load_lifetime_l1",
-    "load_lifetime_l2",
-    "ac_couple1_l1",
-    "ac_couple1_l2",
-    "ac_couple1_lifetime_l1",
-    "ac_couple1_lifetime_l2",
-    "ac_couple2_l1",
-    "ac_couple2_l2",
-    "ac_couple2_lifetime_l1",
-    "ac_couple2_lifetime_l2",
-    "ac_couple3_l1",
-    "ac_couple3_l2",
-    "ac_couple3_lifetime_l1",
-    "ac_couple3_lifetime_l2",
-    "ac_couple4_l1",
-    "ac_couple4_l2",
-    "ac_couple4_lifetime_l1",
-    "ac_couple4_lifetime_l2",
-    "smart_load1_l1",
-    "smart_load1_l2",
-    "smart_load1_lifetime_l1",
-    "smart_load1_lifetime_l2",
-    "smart_load2_l1",
-    "smart_load2_l2",
-    "smart_load2_lifetime_l1",
-    "smart_load2_lifetime_l2",
-    "smart_load3_l1",
-    "smart_load3_l2",
-    "smart_load3_lifetime_l1",
-    "smart_load3_lifetime_l2",
-    "smart_load4_l1",
-    "smart_load4_l2",
-    "smart_load4_lifetime_l1",
-    "smart_load4_lifetime_l2",
-}
+DIVIDE_BY_10_SENSORS: frozenset[str] = frozenset(
+    {
+        "yield",
+        "discharging",
+        "charging",
+        "load",
+        "grid_export",
+        "grid_import",
+        "consumption",
+        "yield_lifetime",
+        "discharging_lifetime",
+        "charging_lifetime",
+        "load_lifetime",
+        "grid_export_lifetime",
+        "grid_import_lifetime",
+        "consumption_lifetime",
+        # GridBOSS energy sensors
+        "ups_l1",
+        "ups_l2",
+        "ups_lifetime_l1",
+        "ups_lifetime_l2",
+        "grid_export_l1",
+        "grid_export_l2",
+        "grid_import_l1",
+        "grid_import_l2",
+        "grid_export_lifetime_l1",
+        "grid_export_lifetime_l2",
+        "grid_import_lifetime_l1",
+        "grid_import_lifetime_l2",
+        "load_l1",
+        "load_l2",
+        "load_lifetime_l1",
+        "load_lifetime_l2",
+        "ac_couple1_l1",
+        "ac_couple1_l2",
+        "ac_couple1_lifetime_l1",
+        "ac_couple1_lifetime_l2",
+        "ac_couple2_l1",
+        "ac_couple2_l2",
+        "ac_couple2_lifetime_l1",
+        "ac_couple2_lifetime_l2",
+        "ac_couple3_l1",
+        "ac_couple3_l2",
+        "ac_couple3_lifetime_l1",
+        "ac_couple3_lifetime_l2",
+        "ac_couple4_l1",
+        "ac_couple4_l2",
+        "ac_couple4_lifetime_l1",
+        "ac_couple4_lifetime_l2",
+        "smart_load1_l1",
+        "smart_load1_l2",
+        "smart_load1_lifetime_l1",
+        "smart_load1_lifetime_l2",
+        "smart_load2_l1",
+        "smart_load2_l2",
+        "smart_load2_lifetime_l1",
+        "smart_load2_lifetime_l2",
+        "smart_load3_l1",
+        "smart_load3_l2",
+        "smart_load3_lifetime_l1",
+        "smart_load3_lifetime_l2",
+        "smart_load4_l1",
+        "smart_load4_l2",
+        "smart_load4_lifetime_l1",
+        "smart_load4_lifetime_l2",
+    }
+)
 
 # GridBOSS-specific sensor lists
-DIVIDE_BY_100_SENSORS = {
-    "frequency",
-    "generator_frequency",
-    "phase_lock_frequency",
-}
+DIVIDE_BY_100_SENSORS: frozenset[str] = frozenset(
+    {
+        "frequency",
+        "generator_frequency",
+        "phase_lock_frequency",
+    }
+)
 
-VOLTAGE_SENSORS = {
-    "grid_voltage_l1",
-    "grid_voltage_l2",
-    "load_voltage_l1",
-    "load_voltage_l2",
-    "ups_voltage",
-    "grid_voltage",
-    "generator_voltage",
-}
+VOLTAGE_SENSORS: frozenset[str] = frozenset(
+    {
+        "grid_voltage_l1",
+        "grid_voltage_l2",
+        "load_voltage_l1",
+        "load_voltage_l2",
+        "ups_voltage",
+        "grid_voltage",
+        "generator_voltage",
+    }
+)
 
-CURRENT_SENSORS = {
-    "grid_current_l1",
-    "grid_current_l2",
-    "load_current_l1",
-    "load_current_l2",
-    "ups_current_l1",
-    "ups_current_l2",
-    "generator_current_l1",
-    "generator_current_l2",
-}
+CURRENT_SENSORS: frozenset[str] = frozenset(
+    {
+        "grid_current_l1",
+        "grid_current_l2",
+        "load_current_l1",
+        "load_current_l2",
+        "ups_current_l1",
+        "ups_current_l2",
+        "generator_current_l1",
+        "generator_current_l2",
+    }
+)
 
-GRIDBOSS_ENERGY_SENSORS = {
-    # Aggregate energy sensors (L2 energy registers always read 0, so only aggregates are useful)
-    "ups_today",
-    "ups_total",
-    "grid_export_today",
-    "grid_export_total",
-    "grid_import_today",
-    "grid_import_total",
-    "load_today",
-    "load_total",
-    "ac_couple1_today",
-    "ac_couple1_total",
-    "ac_couple2_today",
-    "ac_couple2_total",
-    "ac_couple3_today",
-    "ac_couple3_total",
-    "ac_couple4_today",
-    "ac_couple4_total",
-    "smart_load1_today",
-    "smart_load1_total",
-    "smart_load2_today",
-    "smart_load2_total",
-    "smart_load3_today",
-    "smart_load3_total",
-    "smart_load4_today",
-    "smart_load4_total",
-}
+GRIDBOSS_ENERGY_SENSORS: frozenset[str] = frozenset(
+    {
+        # Aggregate energy sensors (L2 energy registers always read 0, so only aggregates are useful)
+        "ups_today",
+        "ups_total",
+        "grid_export_today",
+        "grid_export_total",
+        "grid_import_today",
+        "grid_import_total",
+        "load_today",
+        "load_total",
+        "ac_couple1_today",
+        "ac_couple1_total",
+        "ac_couple2_today",
+        "ac_couple2_total",
+        "ac_couple3_today",
+        "ac_couple3_total",
+        "ac_couple4_today",
+        "ac_couple4_total",
+        "smart_load1_today",
+        "smart_load1_total",
+        "smart_load2_today",
+        "smart_load2_total",
+        "smart_load3_today",
+        "smart_load3_total",
+        "smart_load4_today",
+        "smart_load4_total",
+    }
+)
 
 # Working Mode Configurations
-WORKING_MODES = {
-    "ac_charge_mode": {
-        "name": "AC Charge Mode",
-        "param": "FUNC_AC_CHARGE",
-        "description": "Allow battery charging from AC grid power",
-        "icon": "mdi:battery-charging-medium",
-        "entity_category": EntityCategory.CONFIG,
-    },
-    "pv_charge_priority_mode": {
-        "name": "PV Charge Priority Mode",
-        "param": "FUNC_FORCED_CHG_EN",
-        "description": "Prioritize PV charging during specified hours",
-        "icon": "mdi:solar-power",
-        "entity_category": EntityCategory.CONFIG,
-    },
-    "forced_discharge_mode": {
-        "name": "Forced Discharge Mode",
-        "param": "FUNC_FORCED_DISCHG_EN",
-        "description": "Force battery discharge for grid export",
-        "icon": "mdi:battery-arrow-down",
-        "entity_category": EntityCategory.CONFIG,
-    },
-    "peak_shaving_mode": {
-        "name": "Grid Peak Shaving Mode",
-        "param": "FUNC_GRID_PEAK_SHAVING",
-        "description": "Grid peak shaving to reduce demand charges",
-        "icon": "mdi:chart-bell-curve-cumulative",
-        "entity_category": EntityCategory.CONFIG,
-    },
-    "battery_backup_mode": {
-        "name": "Battery Backup Mode",
-        "param": "FUNC_BATTERY_BACKUP_CTRL",
-        "description": "Emergency Power Supply (EPS) backup functionality",
-        "icon": "mdi:home-battery",
-        "entity_category": EntityCategory.CONFIG,
-    },
-}
+WORKING_MODES: Mapping[str, dict[str, Any]] = MappingProxyType(
+    {
+        "ac_charge_mode": {
+            "name": "AC Charge Mode",
+            "param": "FUNC_AC_CHARGE",
+            "description": "Allow battery charging from AC grid power",
+            "icon": "mdi:battery-charging-medium",
+            "entity_category": EntityCategory.CONFIG,
+        },
+        "pv_charge_priority_mode": {
+            "name": "PV Charge Priority Mode",
+            "param": "FUNC_FORCED_CHG_EN",
+            "description": "Prioritize PV charging during specified hours",
+            "icon": "mdi:solar-power",
+            "entity_category": EntityCategory.CONFIG,
+        },
+        "forced_discharge_mode": {
+            "name": "Forced Discharge Mode",
+            "param": "FUNC_FORCED_DISCHG_EN",
+            "description": "Force battery discharge for grid export",
+            "icon": "mdi:battery-arrow-down",
+            "entity_category": EntityCategory.CONFIG,
+        },
+        "peak_shaving_mode": {
+            "name": "Grid Peak Shaving Mode",
+            "param": "FUNC_GRID_PEAK_SHAVING",
+            "description": "Grid peak shaving to reduce demand charges",
+            "icon": "mdi:chart-bell-curve-cumulative",
+            "entity_category": EntityCategory.CONFIG,
+        },
+        "battery_backup_mode": {
+            "name": "Battery Backup Mode",
+            "param": "FUNC_BATTERY_BACKUP_CTRL",
+            "description": "Emergency Power Supply (EPS) backup functionality",
+            "icon": "mdi:home-battery",
+            "entity_category": EntityCategory.CONFIG,
+        },
+    }
+)
 
 # SOC Limit Parameters
 # These parameters control battery state of charge thresholds for charging and discharging
 # Note: No entity_category set - these appear in Controls section like System Charge SOC Limit
-SOC_LIMIT_PARAMS = {
-    "system_charge_soc_limit": {
-        "name": "System Charge SOC Limit",
-        "param": "HOLD_SYSTEM_CHARGE_SOC_LIMIT",
-        "description": "Maximum battery SOC during normal charging (10-100%, or 101% for top balancing)",
-        "icon": "mdi:battery-charging",
-        "min": 10,
-        "max": 101,
-        "step": 1,
-        "unit": "%",
-    },
-    "ac_charge_soc_limit": {
-        "name": "AC Charge SOC Limit",
-        "param": "HOLD_AC_CHARGE_SOC_LIMIT",
-        "description": "Stop AC charging when battery reaches this SOC percentage",
-        "icon": "mdi:battery-charging-medium",
-        "min": 0,
-        "max": 100,
-        "step": 1,
-        "unit": "%",
-    },
-    "on_grid_soc_cutoff": {
-        "name": "On-Grid SOC Cut-Off",
-        "param": "HOLD_DISCHG_CUT_OFF_SOC_EOD",
-        "description": "Minimum battery SOC when connected to grid (on-grid discharge cutoff)",
-        "icon": "mdi:battery-alert",
-        "min": 0,
-        "max": 100,
-        "step": 1,
-        "unit": "%",
-    },
-    "off_grid_soc_cutoff": {
-        "name": "Off-Grid SOC Cut-Off",
-        "param": "HOLD_SOC_LOW_LIMIT_EPS_DISCHG",
-        "description": "Minimum battery SOC when off-grid (EPS mode discharge cutoff)",
-        "icon": "mdi:battery-outline",
-        "min": 0,
-        "max": 100,
-        "step": 1,
-        "unit": "%",
-    },
-}
+SOC_LIMIT_PARAMS: Mapping[str, dict[str, Any]] = MappingProxyType(
+    {
+        "system_charge_soc_limit": {
+            "name": "System Charge SOC Limit",
+            "param": "HOLD_SYSTEM_CHARGE_SOC_LIMIT",
+            "description": "Maximum battery SOC during normal charging (10-100%, or 101% for top balancing)",
+            "icon": "mdi:battery-charging",
+            "min": 10,
+            "max": 101,
+            "step": 1,
+            "unit": "%",
+        },
+        "ac_charge_soc_limit": {
+            "name": "AC Charge SOC Limit",
+            "param": "HOLD_AC_CHARGE_SOC_LIMIT",
+            "description": "Stop AC charging when battery reaches this SOC percentage",
+            "icon": "mdi:battery-charging-medium",
+            "min": 0,
+            "max": 100,
+            "step": 1,
+            "unit": "%",
+        },
+        "on_grid_soc_cutoff": {
+            "name": "On-Grid SOC Cut-Off",
+            "param": "HOLD_DISCHG_CUT_OFF_SOC_EOD",
+            "description": "Minimum battery SOC when connected to grid (on-grid discharge cutoff)",
+            "icon": "mdi:battery-alert",
+            "min": 0,
+            "max": 100,
+            "step": 1,
+            "unit": "%",
+        },
+        "off_grid_soc_cutoff": {
+            "name": "Off-Grid SOC Cut-Off",
+            "param": "HOLD_SOC_LOW_LIMIT_EPS_DISCHG",
+            "description": "Minimum battery SOC when off-grid (EPS mode discharge cutoff)",
+            "icon": "mdi:battery-outline",
+            "min": 0,
+            "max": 100,
+            "step": 1,
+            "unit": "%",
+        },
+    }
+)
 
-# Function parameter to parameter register mapping
-# Maps function control parameters to their corresponding status parameters
-FUNCTION_PARAM_MAPPING = {
-    "FUNC_BATTERY_BACKUP_CTRL": "FUNC_BATTERY_BACKUP_CTRL",  # Working mode for backup control
-    "FUNC_GRID_PEAK_SHAVING": "FUNC_GRID_PEAK_SHAVING",  # Working mode for peak shaving
-    "FUNC_AC_CHARGE": "FUNC_AC_CHARGE",  # Working mode for AC charging
-    "FUNC_FORCED_CHG_EN": "FUNC_FORCED_CHG_EN",  # Working mode for forced charge
-    "FUNC_FORCED_DISCHG_EN": "FUNC_FORCED_DISCHG_EN",  # Working mode for forced discharge
-    "FUNC_SET_TO_STANDBY": "FUNC_SET_TO_STANDBY",  # Operating mode control
-}
+# Function control parameters that are also readable parameter registers.
+# Each function parameter reports its status under the same name, so callers
+# use the parameter directly once it is known to be a register.
+FUNCTION_PARAM_REGISTERS: frozenset[str] = frozenset(
+    {
+        "FUNC_BATTERY_BACKUP_CTRL",  # Working mode for backup control
+        "FUNC_GRID_PEAK_SHAVING",  # Working mode for peak shaving
+        "FUNC_AC_CHARGE",  # Working mode for AC charging
+        "FUNC_FORCED_CHG_EN",  # Working mode for forced charge
+        "FUNC_FORCED_DISCHG_EN",  # Working mode for forced discharge
+        "FUNC_SET_TO_STANDBY",  # Operating mode control
+    }
+)
 
 # Station/Plant Configuration Constants
 
 # Add station device type
-DEVICE_TYPE_STATION = "station"
+DEVICE_TYPE_STATION = DeviceType.STATION
 
 # Timezone options for plant/station configuration
 # Note: Station configuration data (Continent, Region, Country, Timezone) are read-only
@@ -2231,33 +1000,35 @@ DEVICE_TYPE_STATION = "station"
 # they don't need to be used in automations. Only DST (Daylight Saving Time) is controllable.
 
 # Station sensor types - read-only display sensors
-STATION_SENSOR_TYPES = {
-    "station_name": {
-        "name": "Station Name",
-        "icon": "mdi:home-lightning-bolt-outline",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "station_country": {
-        "name": "Country",
-        "icon": "mdi:map-marker",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "station_timezone": {
-        "name": "Timezone",
-        "icon": "mdi:clock-outline",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "station_create_date": {
-        "name": "Created",
-        "icon": "mdi:calendar",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-    "station_address": {
-        "name": "Address",
-        "icon": "mdi:map-marker-outline",
-        "entity_category": EntityCategory.DIAGNOSTIC,
-    },
-}
+STATION_SENSOR_TYPES: Mapping[str, SensorSpec] = _freeze_specs(
+    {
+        "station_name": SensorSpec(
+            name="Station Name",
+            icon="mdi:home-lightning-bolt-outline",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "station_country": SensorSpec(
+            name="Country",
+            icon="mdi:map-marker",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "station_timezone": SensorSpec(
+            name="Timezone",
+            icon="mdi:clock-outline",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "station_create_date": SensorSpec(
+            name="Created",
+            icon="mdi:calendar",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "station_address": SensorSpec(
+            name="Address",
+            icon="mdi:map-marker-outline",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    }
+)
 
 # Battery data parsing constants
 # These constants define the separators and formats used in battery identification
@@ -2323,3 +1094,124 @@ BATTERY_TEMPERATURE_SCALE_DECIDEGREES = 10  # Battery temperature in dC (÷10 fo
 
 # Task cleanup constants
 BACKGROUND_TASK_CLEANUP_TIMEOUT = 5  # Seconds to wait for background task cancellation
+
+# Public API of this module; keeps star-imports from pulling in helpers and
+# imported names
+__all__ = (
+    "AC_CHARGE_POWER",
+    "AC_CHARGE_POWER_MAX",
+    "AC_CHARGE_POWER_MIN",
+    "AC_CHARGE_POWER_STEP",
+    "ALL_SENSOR_FEATURES",
+    "BACKGROUND_TASK_CLEANUP_TIMEOUT",
+    "BATTERY_CURRENT",
+    "BATTERY_CURRENT_MAX",
+    "BATTERY_CURRENT_MIN",
+    "BATTERY_CURRENT_SCALE_DECIAMPS",
+    "BATTERY_CURRENT_STEP",
+    "BATTERY_KEY_PREFIX",
+    "BATTERY_KEY_SEPARATOR",
+    "BATTERY_KEY_SHORT_PREFIX",
+    "BATTERY_TEMPERATURE_SCALE_DECIDEGREES",
+    "BATTERY_VOLTAGE_SCALE_CENTIVOLTS",
+    "BATTERY_VOLTAGE_SCALE_MILLIVOLTS",
+    "BRAND_EG4",
+    "BRAND_FORTRESS",
+    "BRAND_LUXPOWER",
+    "BRAND_NAME",
+    "CONF_BASE_URL",
+    "CONF_CONNECTION_TYPE",
+    "CONF_DST_SYNC",
+    "CONF_INVERTER_MODEL",
+    "CONF_INVERTER_SERIAL",
+    "CONF_LIBRARY_DEBUG",
+    "CONF_MODBUS_HOST",
+    "CONF_MODBUS_PORT",
+    "CONF_MODBUS_UNIT_ID",
+    "CONF_PLANT_ID",
+    "CONF_PLANT_NAME",
+    "CONF_VERIFY_SSL",
+    "CONNECTION_TYPE_HTTP",
+    "CONNECTION_TYPE_HYBRID",
+    "CONNECTION_TYPE_MODBUS",
+    "CURRENT_BRAND",
+    "CURRENT_SENSORS",
+    "DEFAULT_BASE_URL",
+    "DEFAULT_MODBUS_PORT",
+    "DEFAULT_MODBUS_TIMEOUT",
+    "DEFAULT_MODBUS_UNIT_ID",
+    "DEFAULT_UPDATE_INTERVAL",
+    "DEFAULT_VERIFY_SSL",
+    "DEVICE_TYPE_BATTERY",
+    "DEVICE_TYPE_GRIDBOSS",
+    "DEVICE_TYPE_INVERTER",
+    "DEVICE_TYPE_STATION",
+    "DIAGNOSTIC_BATTERY_SENSOR_KEYS",
+    "DIAGNOSTIC_DEVICE_SENSOR_KEYS",
+    "DISCHARGE_RECOVERY_SENSORS",
+    "DIVIDE_BY_100_SENSORS",
+    "DIVIDE_BY_10_SENSORS",
+    "DOMAIN",
+    "ENTITY_PREFIX",
+    "FIRMWARE_DEVICE_TYPES",
+    "FUNCTION_PARAM_REGISTERS",
+    "GRIDBOSS_ENERGY_SENSORS",
+    "GRIDBOSS_FIELD_MAPPING",
+    "GRID_PEAK_SHAVING_POWER",
+    "GRID_PEAK_SHAVING_POWER_MAX",
+    "GRID_PEAK_SHAVING_POWER_MIN",
+    "GRID_PEAK_SHAVING_POWER_STEP",
+    "HTTP_CONNECTION_TYPES",
+    "INVERTER_ENERGY_FIELD_MAPPING",
+    "INVERTER_FAMILY_LXP_EU",
+    "INVERTER_FAMILY_LXP_LV",
+    "INVERTER_FAMILY_PV_SERIES",
+    "INVERTER_FAMILY_SNA",
+    "INVERTER_FAMILY_UNKNOWN",
+    "INVERTER_RUNTIME_FIELD_MAPPING",
+    "MANUFACTURER",
+    "MAX_BACKOFF_INTERVAL",
+    "MODBUS_CONNECTION_TYPES",
+    "MODBUS_MAX_CONSECUTIVE_TIMEOUTS",
+    "MODBUS_READ_TIMEOUT",
+    "MODBUS_UPDATE_INTERVAL",
+    "PARALLEL_GROUP_ENTITY_ID_BY_KEY",
+    "PARALLEL_GROUP_FIELD_MAPPING",
+    "PV_CHARGE_POWER",
+    "PV_CHARGE_POWER_MAX",
+    "PV_CHARGE_POWER_MIN",
+    "PV_CHARGE_POWER_STEP",
+    "SENSOR_DESCRIPTIONS",
+    "SENSOR_DISPLAY_PRECISION",
+    "SENSOR_ENTITY_ID_PREFIX",
+    "SENSOR_KEYS_BY_FEATURE",
+    "SENSOR_TYPES",
+    "SENSOR_TYPE_ITEMS",
+    "SENSOR_TYPE_KEYS",
+    "SOC_LIMIT",
+    "SOC_LIMIT_MAX",
+    "SOC_LIMIT_MIN",
+    "SOC_LIMIT_PARAMS",
+    "SOC_LIMIT_STEP",
+    "SPLIT_PHASE_ONLY_SENSORS",
+    "STATION_SENSOR_TYPES",
+    "SUPPORTED_INVERTER_MODELS",
+    "SYSTEM_CHARGE_SOC_LIMIT",
+    "SYSTEM_CHARGE_SOC_LIMIT_MAX",
+    "SYSTEM_CHARGE_SOC_LIMIT_MIN",
+    "SYSTEM_CHARGE_SOC_LIMIT_STEP",
+    "THREE_PHASE_ONLY_SENSORS",
+    "UPDATE_ENTITY_ID_PREFIX",
+    "VOLTAGE_SENSORS",
+    "VOLT_WATT_SENSORS",
+    "WORKING_MODES",
+    "BrandConfig",
+    "ConnectionType",
+    "DeviceType",
+    "InverterFamily",
+    "NumberRange",
+    "SensorSpec",
+    "get_sensor_description",
+    "get_sensor_spec",
+    "sensor_types_for",
+)
@@ -2,8 +2,12 @@
 
 import asyncio
 import logging
+import operator
+from collections.abc import Mapping, Sequence
+from contextlib import suppress
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
@@ -33,6 +37,13 @@ from pylxpweb.exceptions import (
     LuxpowerAuthError,
     LuxpowerConnectionError,
 )
+from pylxpweb.transports import create_modbus_transport
+from pylxpweb.transports.exceptions import (
+    TransportConnectionError,
+    TransportError,
+    TransportReadError,
+    TransportTimeoutError,
+)
 
 from .const import (
     CONF_BASE_URL,
@@ -53,7 +64,13 @@ from .const import (
     DEFAULT_MODBUS_UNIT_ID,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    HTTP_CONNECTION_TYPES,
+    MAX_BACKOFF_INTERVAL,
+    MODBUS_CONNECTION_TYPES,
+    MODBUS_MAX_CONSECUTIVE_TIMEOUTS,
+    MODBUS_READ_TIMEOUT,
     MODBUS_UPDATE_INTERVAL,
+    ConnectionType,
 )
 from .coordinator_mixins import (
     BackgroundTaskMixin,
@@ -65,11 +82,124 @@ from .coordinator_mixins import (
 )
 from .utils import (
     CircuitBreaker,
-    clean_battery_display_name,
+    RateLimiter,
+    enable_tcp_keepalive,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Immutable fields of the placeholder entry for an inverter that failed to process
+_ERROR_DEVICE_FIELDS: Mapping[str, str] = MappingProxyType(
+    {"type": "unknown", "model": "Unknown"}
+)
+
+# Precompiled attribute getters for building the serial/index keyed caches
+_serial_number = operator.attrgetter("serial_number")
+_battery_index = operator.attrgetter("index")
+
+# Causes of a failed update that back off polling: the device or cloud API is
+# unreachable or failing, as opposed to an update that was skipped
+_BACKOFF_ERRORS = (
+    LuxpowerAPIError,
+    LuxpowerConnectionError,
+    TransportError,
+    TimeoutError,
+)
+
+# Fallback for get_battery_object when an inverter has no indexed batteries
+_EMPTY_BATTERY_INDEX: Mapping[int, Battery] = MappingProxyType({})
+
+# Most cloud API requests one device issues in a poll, used to size the rate
+# limiter: inverter refresh, feature detection, firmware check and progress,
+# and the two switch states; a group refresh; a MID refresh and firmware check
+_MAX_REQUESTS_PER_INVERTER = 6
+_MAX_REQUESTS_PER_GROUP = 1
+_MAX_REQUESTS_PER_MID_DEVICE = 3
+
+# Modbus runtime data model attributes as (sensor_key, attribute) pairs
+_MODBUS_RUNTIME_SENSOR_ATTRS: tuple[tuple[str, str], ...] = (
+    ("pv1_voltage", "pv1_voltage"),
+    ("pv1_power", "pv1_power"),
+    ("pv2_voltage", "pv2_voltage"),
+    ("pv2_power", "pv2_power"),
+    ("pv3_voltage", "pv3_voltage"),
+    ("pv3_power", "pv3_power"),
+    ("ppv", "pv_total_power"),
+    ("vBat", "battery_voltage"),
+    ("soc", "battery_soc"),
+    ("pCharge", "battery_charge_power"),
+    ("pDisCharge", "battery_discharge_power"),
+    ("tBat", "battery_temperature"),
+    ("vacr", "grid_voltage_r"),
+    ("vacs", "grid_voltage_s"),
+    ("vact", "grid_voltage_t"),
+    ("fac", "grid_frequency"),
+    ("prec", "grid_power"),
+    ("pToGrid", "power_to_grid"),
+    ("pinv", "inverter_power"),
+    ("pToUser", "load_power"),
+    ("vepsr", "eps_voltage_r"),
+    ("vepss", "eps_voltage_s"),
+    ("vepst", "eps_voltage_t"),
+    ("feps", "eps_frequency"),
+    ("peps", "eps_power"),
+    ("seps", "eps_status"),
+    ("vBus1", "bus_voltage_1"),
+    ("vBus2", "bus_voltage_2"),
+    ("tinner", "internal_temperature"),
+    ("tradiator1", "radiator_temperature_1"),
+    ("tradiator2", "radiator_temperature_2"),
+    ("status", "device_status"),
+)
+
+# Modbus battery bank data model attributes as (sensor_key, attribute) pairs
+_MODBUS_BATTERY_BANK_SENSOR_ATTRS: tuple[tuple[str, str], ...] = (
+    ("battery_bank_soc", "soc"),
+    ("battery_bank_voltage", "voltage"),
+    ("battery_bank_charge_power", "charge_power"),
+    ("battery_bank_discharge_power", "discharge_power"),
+)
+
+# Runtime sensors overridden with faster Modbus values in hybrid mode
+_HYBRID_RUNTIME_SENSOR_ATTRS: tuple[tuple[str, str], ...] = (
+    ("pv1_voltage", "pv1_voltage"),
+    ("pv1_power", "pv1_power"),
+    ("pv2_voltage", "pv2_voltage"),
+    ("pv2_power", "pv2_power"),
+    ("ppv", "pv_total_power"),
+    ("vBat", "battery_voltage"),
+    ("soc", "battery_soc"),
+    ("pCharge", "battery_charge_power"),
+    ("pDisCharge", "battery_discharge_power"),
+    ("vacr", "grid_voltage_r"),
+    ("fac", "grid_frequency"),
+    ("prec", "grid_power"),
+    ("pToGrid", "power_to_grid"),
+    ("pinv", "inverter_power"),
+    ("pToUser", "load_power"),
+    ("peps", "eps_power"),
+    ("tinner", "internal_temperature"),
+)
+
+# Modbus energy data model attributes as (sensor_key, attribute) pairs
+_MODBUS_ENERGY_TODAY_SENSOR_ATTRS: tuple[tuple[str, str], ...] = (
+    ("todayYielding", "pv_energy_today"),
+    ("todayCharging", "charge_energy_today"),
+    ("todayDischarging", "discharge_energy_today"),
+    ("todayImport", "grid_import_today"),
+    ("todayExport", "grid_export_today"),
+    ("todayUsage", "load_energy_today"),
+)
+_MODBUS_ENERGY_SENSOR_ATTRS: tuple[tuple[str, str], ...] = (
+    *_MODBUS_ENERGY_TODAY_SENSOR_ATTRS,
+    ("totalYielding", "pv_energy_total"),
+    ("totalCharging", "charge_energy_total"),
+    ("totalDischarging", "discharge_energy_total"),
+    ("totalImport", "grid_import_total"),
+    ("totalExport", "grid_export_total"),
+    ("totalUsage", "load_energy_total"),
+)
+
 
 class EG4DataUpdateCoordinator(
     DeviceProcessingMixin,
@@ -96,8 +226,8 @@ class EG4DataUpdateCoordinator(
         self.entry = entry
 
         # Determine connection type (default to HTTP for backwards compatibility)
-        self.connection_type: str = entry.data.get(
-            CONF_CONNECTION_TYPE, CONNECTION_TYPE_HTTP
+        self.connection_type = ConnectionType(
+            entry.data.get(CONF_CONNECTION_TYPE, CONNECTION_TYPE_HTTP)
         )
 
         # Plant ID (only used for HTTP and Hybrid modes)
@@ -108,7 +238,7 @@ class EG4DataUpdateCoordinator(
 
         # Initialize HTTP client for HTTP and Hybrid modes
         self.client: LuxpowerClient | None = None
-        if self.connection_type in (CONNECTION_TYPE_HTTP, CONNECTION_TYPE_HYBRID):
+        if self.connection_type in HTTP_CONNECTION_TYPES:
             self.client = LuxpowerClient(
                 username=entry.data[CONF_USERNAME],
                 password=entry.data[CONF_PASSWORD],
@@ -122,9 +252,7 @@ class EG4DataUpdateCoordinator(
 
         # Initialize Modbus transport for Modbus and Hybrid modes
         self._modbus_transport: ModbusTransport | None = None
-        if self.connection_type in (CONNECTION_TYPE_MODBUS, CONNECTION_TYPE_HYBRID):
-            from pylxpweb.transports import create_modbus_transport
-
+        if self.connection_type in MODBUS_CONNECTION_TYPES:
             self._modbus_transport = create_modbus_transport(
                 host=entry.data[CONF_MODBUS_HOST],
                 port=entry.data.get(CONF_MODBUS_PORT, DEFAULT_MODBUS_PORT),
@@ -135,6 +263,11 @@ class EG4DataUpdateCoordinator(
             self._modbus_serial = entry.data.get(CONF_INVERTER_SERIAL, "")
             self._modbus_model = entry.data.get(CONF_INVERTER_MODEL, "Unknown")
 
+        # Serializes access to the Modbus transport so that a single poll's
+        # reads go out back-to-back and never interleave with another caller
+        self._modbus_lock = asyncio.Lock()
+        self._modbus_consecutive_timeouts = 0
+
         # DST sync configuration (only for HTTP/Hybrid)
         self.dst_sync_enabled = entry.data.get(CONF_DST_SYNC, True)
 
@@ -149,10 +282,24 @@ class EG4DataUpdateCoordinator(
         self._last_parameter_refresh: datetime | None = None
         self._parameter_refresh_interval = timedelta(hours=1)
 
+        # Station topology refresh tracking; device data is refreshed per
+        # device on every poll, so the full station refresh can run less often
+        self._last_topology_refresh: datetime | None = None
+        self._topology_refresh_interval = timedelta(minutes=15)
+
         # DST sync tracking
         self._last_dst_sync: datetime | None = None
         self._dst_sync_interval = timedelta(hours=1)
 
+        # Per-device feature detection keyed by serial, stored with the
+        # firmware version it was detected on (features only change with it)
+        self._features_cache: dict[str, tuple[str | None, dict[str, Any]]] = {}
+        # Per-device firmware update checks: (checked at, firmware version, info)
+        self._firmware_check_cache: dict[
+            str, tuple[datetime, str | None, dict[str, Any] | None]
+        ] = {}
+        self._firmware_check_interval = timedelta(hours=1)
+
         # Background task tracking for proper cleanup
         self._background_tasks: set[asyncio.Task[Any]] = set()
 
@@ -168,19 +315,31 @@ class EG4DataUpdateCoordinator(
         # Track availability state for Silver tier logging requirement
         self._last_available_state: bool = True
 
-        # Inverter lookup cache for O(1) access (rebuilt when station loads)
+        # Device lookup caches for O(1) access (rebuilt when the station loads
+        # or its topology is refreshed)
         self._inverter_cache: dict[str, BaseInverter] = {}
+        self._mid_device_cache: dict[str, Any] = {}
+        # Per-inverter {battery index: battery}, rebuilt on every station update
+        self._battery_cache: dict[str, dict[int, Battery]] = {}
 
-        # Semaphore to limit concurrent API calls and prevent rate limiting
-        self._api_semaphore = asyncio.Semaphore(3)
+        # Limit concurrent API calls and request rate to prevent rate limiting;
+        # resized to the station's devices in _rebuild_device_cache
+        self._rate_limiter = RateLimiter(max_concurrent=3, rate=0.5, max_tokens=3)
 
         # Determine update interval based on connection type
         # Modbus and Hybrid can poll faster since they use local network
-        if self.connection_type in (CONNECTION_TYPE_MODBUS, CONNECTION_TYPE_HYBRID):
+        if self.connection_type in MODBUS_CONNECTION_TYPES:
             update_interval = timedelta(seconds=MODBUS_UPDATE_INTERVAL)
         else:
             update_interval = timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
 
+        # Base interval restored after failures; see _async_update_data backoff
+        self._base_update_interval = update_interval
+        self._consecutive_failures = 0
+        # Hybrid mode backs off its HTTP leg alone; see _async_update_hybrid_http
+        self._http_consecutive_failures = 0
+        self._http_retry_at: datetime | None = None
+
         super().__init__(
             hass,
             _LOGGER,
@@ -193,6 +352,17 @@ class EG4DataUpdateCoordinator(
             "homeassistant_stop", self._async_handle_shutdown
         )
 
+    def _mark_unavailable(self, message: str, *args: Any) -> None:
+        """Mark the service unavailable, logging only the first failure.
+
+        Silver tier requires logging once when the service becomes
+        unavailable. Failures while Home Assistant is stopping are expected
+        (connections are torn down), so they do not produce a warning.
+        """
+        if self._last_available_state and not self.hass.is_stopping:
+            _LOGGER.warning(message, *args)
+        self._last_available_state = False
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from appropriate transport based on connection type.
 
@@ -206,12 +376,134 @@ class EG4DataUpdateCoordinator(
             ConfigEntryAuthFailed: If authentication fails.
             UpdateFailed: If connection or API errors occur.
         """
-        if self.connection_type == CONNECTION_TYPE_MODBUS:
-            return await self._async_update_modbus_data()
-        if self.connection_type == CONNECTION_TYPE_HYBRID:
-            return await self._async_update_hybrid_data()
-        # Default to HTTP
-        return await self._async_update_http_data()
+        try:
+            if self.connection_type is ConnectionType.MODBUS:
+                data = await self._async_update_modbus_data()
+            elif self.connection_type is ConnectionType.HYBRID:
+                data = await self._async_update_hybrid_data()
+            else:
+                # Default to HTTP
+                data = await self._async_update_http_data()
+        except UpdateFailed as err:
+            # Skipped updates (e.g. circuit breaker open) do not back off, and
+            # hybrid mode only backs off its HTTP leg so Modbus keeps its pace
+            if self.connection_type is not ConnectionType.HYBRID and isinstance(
+                err.__cause__, _BACKOFF_ERRORS
+            ):
+                self._backoff_update_interval()
+            raise
+
+        if self._consecutive_failures:
+            self._consecutive_failures = 0
+            self.update_interval = self._base_update_interval
+            _LOGGER.debug("Update succeeded, restored update interval")
+        return data
+
+    def _backoff_update_interval(self) -> None:
+        """Exponentially lengthen the update interval after a failed update.
+
+        The interval doubles per consecutive failure (up to 32x the base),
+        capped at MAX_BACKOFF_INTERVAL, so outages are not polled at full rate.
+        """
+        self._consecutive_failures += 1
+        backoff_seconds = self._backoff_seconds(
+            self._base_update_interval.total_seconds(), self._consecutive_failures
+        )
+        self.update_interval = timedelta(seconds=backoff_seconds)
+        _LOGGER.debug(
+            "Update failed %d time(s) in a row, next update in %.0fs",
+            self._consecutive_failures,
+            backoff_seconds,
+        )
+
+    @staticmethod
+    def _backoff_seconds(base_seconds: float, failures: int) -> float:
+        """Return the delay after a number of consecutive failures."""
+        return min(base_seconds * 2 ** min(failures, 5), MAX_BACKOFF_INTERVAL)
+
+    async def _read_modbus_data(
+        self, *, include_battery: bool
+    ) -> tuple[Any, Any, Any]:
+        """Read runtime, energy and (optionally) battery data in one request window.
+
+        The reads are issued back-to-back while holding the transport lock.
+        They must stay sequential: the transport does not yet multiplex
+        transaction IDs, so concurrent requests desync responses.
+        See: https://github.com/joyfulhouse/pylxpweb/issues/95
+
+        Each read is bounded by MODBUS_READ_TIMEOUT so a hung read cannot
+        stall the poll cycle indefinitely. A single timeout keeps the
+        connection, as the transport's own timeout would; after
+        MODBUS_MAX_CONSECUTIVE_TIMEOUTS in a row the transport is disconnected,
+        so a connection that has stopped answering is reopened on the next poll.
+
+        Args:
+            include_battery: Whether to also read the battery bank registers.
+
+        Returns:
+            Tuple of (runtime_data, energy_data, battery_data); battery_data is
+            None when include_battery is False.
+
+        Raises:
+            TimeoutError: If a read does not complete within MODBUS_READ_TIMEOUT.
+        """
+        transport = self._modbus_transport
+        if transport is None:
+            raise UpdateFailed("Modbus transport not initialized")
+
+        async with self._modbus_lock:
+            if not transport.is_connected:
+                await transport.connect()
+                self._enable_modbus_keepalive(transport)
+
+            try:
+                async with asyncio.timeout(MODBUS_READ_TIMEOUT):
+                    runtime_data = await transport.read_runtime()
+                async with asyncio.timeout(MODBUS_READ_TIMEOUT):
+                    energy_data = await transport.read_energy()
+                battery_data = None
+                if include_battery:
+                    async with asyncio.timeout(MODBUS_READ_TIMEOUT):
+                        battery_data = await transport.read_battery()
+            except TimeoutError:
+                self._modbus_consecutive_timeouts += 1
+                if self._modbus_consecutive_timeouts >= MODBUS_MAX_CONSECUTIVE_TIMEOUTS:
+                    _LOGGER.warning(
+                        "Modbus read timed out %d times in a row, reconnecting",
+                        self._modbus_consecutive_timeouts,
+                    )
+                    self._modbus_consecutive_timeouts = 0
+                    await transport.disconnect()
+                raise
+            self._modbus_consecutive_timeouts = 0
+
+        return runtime_data, energy_data, battery_data
+
+    @staticmethod
+    def _enable_modbus_keepalive(transport: "ModbusTransport") -> None:
+        """Best-effort TCP keepalive on the Modbus connection's socket.
+
+        Keeps the long-lived connection from being silently dropped by NAT or
+        router idle timeouts, which otherwise surface as read timeouts and
+        reconnects. The socket is reached through the underlying pymodbus
+        client; if it is not exposed, the connection is left as-is.
+        """
+        client = getattr(transport, "_client", None)
+        protocol = getattr(client, "ctx", None)
+        asyncio_transport = getattr(protocol, "transport", None)
+        sock = (
+            asyncio_transport.get_extra_info("socket")
+            if asyncio_transport is not None
+            else None
+        )
+        if sock is None:
+            _LOGGER.debug("Modbus socket not exposed, TCP keepalive not enabled")
+            return
+
+        try:
+            enable_tcp_keepalive(sock)
+        except OSError as e:
+            _LOGGER.debug("Could not enable TCP keepalive on Modbus socket: %s", e)
 
     async def _async_update_modbus_data(self) -> dict[str, Any]:
         """Fetch data from local Modbus transport.
@@ -222,28 +514,15 @@ class EG4DataUpdateCoordinator(
         Returns:
             Dictionary containing device data from Modbus registers.
         """
-        from pylxpweb.transports.exceptions import (
-            TransportConnectionError,
-            TransportError,
-            TransportReadError,
-            TransportTimeoutError,
-        )
-
         if self._modbus_transport is None:
             raise UpdateFailed("Modbus transport not initialized")
 
         try:
             _LOGGER.debug("Fetching Modbus data for inverter %s", self._modbus_serial)
 
-            # Ensure transport is connected
-            if not self._modbus_transport.is_connected:
-                await self._modbus_transport.connect()
-
-            # Read data sequentially to avoid transaction ID desync issues
-            # See: https://github.com/joyfulhouse/pylxpweb/issues/95
-            runtime_data = await self._modbus_transport.read_runtime()
-            energy_data = await self._modbus_transport.read_energy()
-            battery_data = await self._modbus_transport.read_battery()
+            runtime_data, energy_data, battery_data = await self._read_modbus_data(
+                include_battery=True
+            )
 
             # Build device data structure from transport data models
             processed = {
@@ -254,83 +533,27 @@ class EG4DataUpdateCoordinator(
                 "connection_type": CONNECTION_TYPE_MODBUS,
             }
 
+            # Map runtime, energy and (if available) battery bank data to sensors
+            battery_attrs = _MODBUS_BATTERY_BANK_SENSOR_ATTRS if battery_data else ()
+            sensors: dict[str, Any] = {}
+            for source, attrs in (
+                (runtime_data, _MODBUS_RUNTIME_SENSOR_ATTRS),
+                (energy_data, _MODBUS_ENERGY_SENSOR_ATTRS),
+                (battery_data, battery_attrs),
+            ):
+                for key, attr in attrs:
+                    sensors[key] = getattr(source, attr)
+
             # Create device entry for the inverter
             serial = self._modbus_serial
             device_data: dict[str, Any] = {
                 "type": "inverter",
                 "model": self._modbus_model,
                 "serial": serial,
-                "sensors": {},
+                "sensors": sensors,
                 "batteries": {},
             }
 
-            # Map runtime data to sensors
-            device_data["sensors"].update(
-                {
-                    "pv1_voltage": runtime_data.pv1_voltage,
-                    "pv1_power": runtime_data.pv1_power,
-                    "pv2_voltage": runtime_data.pv2_voltage,
-                    "pv2_power": runtime_data.pv2_power,
-                    "pv3_voltage": runtime_data.pv3_voltage,
-                    "pv3_power": runtime_data.pv3_power,
-                    "ppv": runtime_data.pv_total_power,
-                    "vBat": runtime_data.battery_voltage,
-                    "soc": runtime_data.battery_soc,
-                    "pCharge": runtime_data.battery_charge_power,
-                    "pDisCharge": runtime_data.battery_discharge_power,
-                    "tBat": runtime_data.battery_temperature,
-                    "vacr": runtime_data.grid_voltage_r,
-                    "vacs": runtime_data.grid_voltage_s,
-                    "vact": runtime_data.grid_voltage_t,
-                    "fac": runtime_data.grid_frequency,
-                    "prec": runtime_data.grid_power,
-                    "pToGrid": runtime_data.power_to_grid,
-                    "pinv": runtime_data.inverter_power,
-                    "pToUser": runtime_data.load_power,
-                    "vepsr": runtime_data.eps_voltage_r,
-                    "vepss": runtime_data.eps_voltage_s,
-                    "vepst": runtime_data.eps_voltage_t,
-                    "feps": runtime_data.eps_frequency,
-                    "peps": runtime_data.eps_power,
-                    "seps": runtime_data.eps_status,
-                    "vBus1": runtime_data.bus_voltage_1,
-                    "vBus2": runtime_data.bus_voltage_2,
-                    "tinner": runtime_data.internal_temperature,
-                    "tradiator1": runtime_data.radiator_temperature_1,
-                    "tradiator2": runtime_data.radiator_temperature_2,
-                    "status": runtime_data.device_status,
-                }
-            )
-
-            # Map energy data to sensors
-            device_data["sensors"].update(
-                {
-                    "todayYielding": energy_data.pv_energy_today,
-                    "todayCharging": energy_data.charge_energy_today,
-                    "todayDischarging": energy_data.discharge_energy_today,
-                    "todayImport": energy_data.grid_import_today,
-                    "todayExport": energy_data.grid_export_today,
-                    "todayUsage": energy_data.load_energy_today,
-                    "totalYielding": energy_data.pv_energy_total,
-                    "totalCharging": energy_data.charge_energy_total,
-                    "totalDischarging": energy_data.discharge_energy_total,
-                    "totalImport": energy_data.grid_import_total,
-                    "totalExport": energy_data.grid_export_total,
-                    "totalUsage": energy_data.load_energy_total,
-                }
-            )
-
-            # Add battery bank data if available
-            if battery_data:
-                device_data["sensors"]["battery_bank_soc"] = battery_data.soc
-                device_data["sensors"]["battery_bank_voltage"] = battery_data.voltage
-                device_data["sensors"]["battery_bank_charge_power"] = (
-                    battery_data.charge_power
-                )
-                device_data["sensors"]["battery_bank_discharge_power"] = (
-                    battery_data.discharge_power
-                )
-
             processed["devices"][serial] = device_data
 
             # Silver tier logging
@@ -351,39 +574,31 @@ class EG4DataUpdateCoordinator(
             return processed
 
         except TransportConnectionError as e:
-            if self._last_available_state:
-                _LOGGER.warning(
-                    "Modbus connection lost for inverter %s: %s",
-                    self._modbus_serial,
-                    e,
-                )
-                self._last_available_state = False
+            self._mark_unavailable(
+                "Modbus connection lost for inverter %s: %s",
+                self._modbus_serial,
+                e,
+            )
             raise UpdateFailed(f"Modbus connection failed: {e}") from e
 
-        except TransportTimeoutError as e:
-            if self._last_available_state:
-                _LOGGER.warning(
-                    "Modbus timeout for inverter %s: %s", self._modbus_serial, e
-                )
-                self._last_available_state = False
+        except (TransportTimeoutError, TimeoutError) as e:
+            self._mark_unavailable(
+                "Modbus timeout for inverter %s: %s", self._modbus_serial, e
+            )
             raise UpdateFailed(f"Modbus timeout: {e}") from e
 
         except (TransportReadError, TransportError) as e:
-            if self._last_available_state:
-                _LOGGER.warning(
-                    "Modbus read error for inverter %s: %s", self._modbus_serial, e
-                )
-                self._last_available_state = False
+            self._mark_unavailable(
+                "Modbus read error for inverter %s: %s", self._modbus_serial, e
+            )
             raise UpdateFailed(f"Modbus read error: {e}") from e
 
         except Exception as e:
-            if self._last_available_state:
-                _LOGGER.warning(
-                    "Unexpected Modbus error for inverter %s: %s",
-                    self._modbus_serial,
-                    e,
-                )
-                self._last_available_state = False
+            self._mark_unavailable(
+                "Unexpected Modbus error for inverter %s: %s",
+                self._modbus_serial,
+                e,
+            )
             _LOGGER.exception("Unexpected Modbus error: %s", e)
             raise UpdateFailed(f"Unexpected error: {e}") from e
 
@@ -397,35 +612,22 @@ class EG4DataUpdateCoordinator(
         Returns:
             Dictionary containing merged data from both sources.
         """
-        from pylxpweb.transports.exceptions import TransportError
+        # Modbus and HTTP are independent transports, so run both legs
+        # concurrently; the poll then takes as long as the slower of the two
+        modbus_result, http_result = await asyncio.gather(
+            self._read_hybrid_modbus_data(),
+            self._async_update_hybrid_http(),
+            return_exceptions=True,
+        )
 
-        # First, get runtime data from Modbus (fast path)
-        modbus_data: dict[str, Any] | None = None
-        if self._modbus_transport is not None:
-            try:
-                if not self._modbus_transport.is_connected:
-                    await self._modbus_transport.connect()
-
-                # Read sequentially to avoid transaction ID desync issues
-                runtime_data = await self._modbus_transport.read_runtime()
-                energy_data = await self._modbus_transport.read_energy()
-                modbus_data = {
-                    "runtime": runtime_data,
-                    "energy": energy_data,
-                }
-                _LOGGER.debug(
-                    "Hybrid: Modbus runtime - PV: %.0fW, SOC: %d%%",
-                    runtime_data.pv_total_power,
-                    runtime_data.battery_soc,
-                )
-            except TransportError as e:
-                _LOGGER.warning(
-                    "Hybrid: Modbus read failed, falling back to HTTP: %s", e
-                )
-                modbus_data = None
+        # HTTP failures propagate exactly as in HTTP-only mode
+        if isinstance(http_result, BaseException):
+            raise http_result
+        http_data = http_result
 
-        # Get HTTP data for discovery, batteries, and features not in Modbus
-        http_data = await self._async_update_http_data()
+        if isinstance(modbus_result, BaseException):
+            raise modbus_result
+        modbus_data = modbus_result
 
         # If we have Modbus data, merge it with HTTP data for the matching inverter
         if modbus_data is not None and self._modbus_serial in http_data.get(
@@ -435,40 +637,12 @@ class EG4DataUpdateCoordinator(
             runtime = modbus_data["runtime"]
             energy = modbus_data["energy"]
 
-            # Override runtime sensors with faster Modbus values
-            device["sensors"].update(
-                {
-                    "pv1_voltage": runtime.pv1_voltage,
-                    "pv1_power": runtime.pv1_power,
-                    "pv2_voltage": runtime.pv2_voltage,
-                    "pv2_power": runtime.pv2_power,
-                    "ppv": runtime.pv_total_power,
-                    "vBat": runtime.battery_voltage,
-                    "soc": runtime.battery_soc,
-                    "pCharge": runtime.battery_charge_power,
-                    "pDisCharge": runtime.battery_discharge_power,
-                    "vacr": runtime.grid_voltage_r,
-                    "fac": runtime.grid_frequency,
-                    "prec": runtime.grid_power,
-                    "pToGrid": runtime.power_to_grid,
-                    "pinv": runtime.inverter_power,
-                    "pToUser": runtime.load_power,
-                    "peps": runtime.eps_power,
-                    "tinner": runtime.internal_temperature,
-                }
-            )
-
-            # Override energy sensors with Modbus values
-            device["sensors"].update(
-                {
-                    "todayYielding": energy.pv_energy_today,
-                    "todayCharging": energy.charge_energy_today,
-                    "todayDischarging": energy.discharge_energy_today,
-                    "todayImport": energy.grid_import_today,
-                    "todayExport": energy.grid_export_today,
-                    "todayUsage": energy.load_energy_today,
-                }
-            )
+            # Override runtime and energy sensors with faster Modbus values
+            sensors = device["sensors"]
+            for key, attr in _HYBRID_RUNTIME_SENSOR_ATTRS:
+                sensors[key] = getattr(runtime, attr)
+            for key, attr in _MODBUS_ENERGY_TODAY_SENSOR_ATTRS:
+                sensors[key] = getattr(energy, attr)
 
             _LOGGER.debug(
                 "Hybrid: Merged Modbus runtime with HTTP data for %s",
@@ -478,6 +652,84 @@ class EG4DataUpdateCoordinator(
         http_data["connection_type"] = CONNECTION_TYPE_HYBRID
         return http_data
 
+    async def _async_update_hybrid_http(self) -> dict[str, Any]:
+        """Run the hybrid HTTP leg, backing it off on its own during outages.
+
+        A cloud outage must not slow the local Modbus poll, so failed HTTP
+        updates push back the next HTTP attempt instead of lengthening
+        update_interval. Until then the last cloud data is reused, with the
+        Modbus values merged into it as usual.
+
+        Returns:
+            Fresh HTTP data, or a copy of the last data while backed off.
+        """
+        now = dt_util.utcnow()
+        if (
+            self._http_retry_at is not None
+            and now < self._http_retry_at
+            and self.data is not None
+        ):
+            _LOGGER.debug(
+                "Hybrid: HTTP backed off until %s, reusing last cloud data",
+                self._http_retry_at,
+            )
+            # Copied down to the sensors the Modbus merge overwrites
+            devices = dict(self.data["devices"])
+            if (device := devices.get(self._modbus_serial)) is not None:
+                devices[self._modbus_serial] = {
+                    **device,
+                    "sensors": dict(device["sensors"]),
+                }
+            return {**self.data, "devices": devices}
+
+        try:
+            data = await self._async_update_http_data()
+        except UpdateFailed as err:
+            if isinstance(err.__cause__, _BACKOFF_ERRORS):
+                self._http_consecutive_failures += 1
+                backoff_seconds = self._backoff_seconds(
+                    DEFAULT_UPDATE_INTERVAL, self._http_consecutive_failures
+                )
+                self._http_retry_at = now + timedelta(seconds=backoff_seconds)
+                _LOGGER.debug(
+                    "Hybrid: HTTP failed %d time(s) in a row, next attempt in %.0fs",
+                    self._http_consecutive_failures,
+                    backoff_seconds,
+                )
+            raise
+
+        self._http_consecutive_failures = 0
+        self._http_retry_at = None
+        return data
+
+    async def _read_hybrid_modbus_data(self) -> dict[str, Any] | None:
+        """Read the hybrid fast-path runtime and energy data from Modbus.
+
+        Returns:
+            Dictionary with "runtime" and "energy" data models, or None if
+            Modbus is unavailable and the HTTP values should be used as-is.
+        """
+        if self._modbus_transport is None:
+            return None
+
+        try:
+            runtime_data, energy_data, _ = await self._read_modbus_data(
+                include_battery=False
+            )
+        except (TransportError, TimeoutError) as e:
+            _LOGGER.warning("Hybrid: Modbus read failed, falling back to HTTP: %s", e)
+            return None
+
+        _LOGGER.debug(
+            "Hybrid: Modbus runtime - PV: %.0fW, SOC: %d%%",
+            runtime_data.pv_total_power,
+            runtime_data.battery_soc,
+        )
+        return {
+            "runtime": runtime_data,
+            "energy": energy_data,
+        }
+
     async def _async_update_http_data(self) -> dict[str, Any]:
         """Fetch data from HTTP cloud API using device objects.
 
@@ -494,18 +746,36 @@ class EG4DataUpdateCoordinator(
         if self.client is None:
             raise UpdateFailed("HTTP client not initialized")
 
+        # Fail fast while the API is known to be down instead of fanning out
+        if not self._circuit_breaker.allow():
+            raise UpdateFailed("Circuit breaker open, skipping API update")
+
         try:
+            # While half-open, probe with a single inverter and serve it on top
+            # of the last good data until the breaker closes again; without an
+            # inverter to probe, the full update below is the probe
+            if (
+                self._circuit_breaker.state == "half-open"
+                and self.station is not None
+                and self.data is not None
+                and (inverter := next(iter(self.station.all_inverters), None))
+            ):
+                return await self._async_probe_http_api(inverter, self.data)
+
             _LOGGER.debug("Fetching HTTP data for plant %s", self.plant_id)
 
+            # One timestamp for every schedule check and stamp in this cycle
+            now = dt_util.utcnow()
+
             # Check if hourly parameter refresh is due
-            if self._should_refresh_parameters():
+            if self._should_refresh_parameters(now):
                 _LOGGER.info(
                     "Hourly parameter refresh is due, refreshing all device parameters"
                 )
-                task = self.hass.async_create_task(self._hourly_parameter_refresh())
-                self._background_tasks.add(task)
-                task.add_done_callback(self._remove_task_from_set)
-                task.add_done_callback(self._log_task_exception)
+                self._create_background_task(
+                    self._hourly_parameter_refresh(),
+                    name="eg4_hourly_parameter_refresh",
+                )
 
             # Load or refresh station data using device objects
             if self.station is None:
@@ -515,44 +785,49 @@ class EG4DataUpdateCoordinator(
                     "Refreshing all data after station load to populate battery details"
                 )
                 await self.station.refresh_all_data()
+                self._last_topology_refresh = now
                 # Build inverter cache for O(1) lookups
-                self._rebuild_inverter_cache()
-            else:
+                self._rebuild_device_cache()
+            elif self._should_refresh_topology(now):
                 _LOGGER.debug("Refreshing station data for plant %s", self.plant_id)
                 await self.station.refresh_all_data()
-
-            # Log inverter data status after refresh
-            for inverter in self.station.all_inverters:
-                battery_bank = getattr(inverter, "_battery_bank", None)
-                battery_count = 0
-                battery_array_len = 0
-                if battery_bank:
-                    battery_count = getattr(battery_bank, "battery_count", 0)
-                    batteries = getattr(battery_bank, "batteries", [])
-                    battery_array_len = len(batteries) if batteries else 0
-                _LOGGER.debug(
-                    "Inverter %s (%s): has_data=%s, _runtime=%s, _energy=%s, "
-                    "_battery_bank=%s, battery_count=%s, batteries_len=%s",
-                    inverter.serial_number,
-                    getattr(inverter, "model", "Unknown"),
-                    inverter.has_data,
-                    "present"
-                    if getattr(inverter, "_runtime", None) is not None
-                    else "None",
-                    "present"
-                    if getattr(inverter, "_energy", None) is not None
-                    else "None",
-                    "present" if battery_bank else "None",
-                    battery_count,
-                    battery_array_len,
-                )
+                self._last_topology_refresh = now
+                self._rebuild_device_cache()
+
+            # Log inverter data status after refresh (debug only; the
+            # per-inverter getattr chain is skipped otherwise)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                for inverter in self.station.all_inverters:
+                    battery_bank = getattr(inverter, "_battery_bank", None)
+                    battery_count = 0
+                    battery_array_len = 0
+                    if battery_bank:
+                        battery_count = getattr(battery_bank, "battery_count", 0)
+                        batteries = getattr(battery_bank, "batteries", [])
+                        battery_array_len = len(batteries) if batteries else 0
+                    _LOGGER.debug(
+                        "Inverter %s (%s): has_data=%s, _runtime=%s, _energy=%s, "
+                        "_battery_bank=%s, battery_count=%s, batteries_len=%s",
+                        inverter.serial_number,
+                        getattr(inverter, "model", "Unknown"),
+                        inverter.has_data,
+                        "present"
+                        if getattr(inverter, "_runtime", None) is not None
+                        else "None",
+                        "present"
+                        if getattr(inverter, "_energy", None) is not None
+                        else "None",
+                        "present" if battery_bank else "None",
+                        battery_count,
+                        battery_array_len,
+                    )
 
             # Perform DST sync if enabled and due
-            if self.dst_sync_enabled and self.station and self._should_sync_dst():
+            if self.dst_sync_enabled and self.station and self._should_sync_dst(now):
                 await self._perform_dst_sync()
 
             # Process and structure the device data
-            processed_data = await self._process_station_data()
+            processed_data = await self._process_station_data(now)
             processed_data["connection_type"] = CONNECTION_TYPE_HTTP
 
             device_count = len(processed_data.get("devices", {}))
@@ -566,62 +841,117 @@ class EG4DataUpdateCoordinator(
                 )
                 self._last_available_state = True
 
+            self._circuit_breaker.record_success()
             return processed_data
 
         except LuxpowerAuthError as e:
-            if self._last_available_state:
-                _LOGGER.warning(
-                    "EG4 Web Monitor service unavailable due to authentication error for plant %s: %s",
-                    self.plant_id,
-                    e,
-                )
-                self._last_available_state = False
+            self._mark_unavailable(
+                "EG4 Web Monitor service unavailable due to authentication error for plant %s: %s",
+                self.plant_id,
+                e,
+            )
             _LOGGER.error("Authentication error: %s", e)
+            self._circuit_breaker.record_failure()
             raise ConfigEntryAuthFailed(f"Authentication failed: {e}") from e
 
         except LuxpowerConnectionError as e:
-            if self._last_available_state:
-                _LOGGER.warning(
-                    "EG4 Web Monitor service unavailable due to connection error for plant %s: %s",
-                    self.plant_id,
-                    e,
-                )
-                self._last_available_state = False
+            self._mark_unavailable(
+                "EG4 Web Monitor service unavailable due to connection error for plant %s: %s",
+                self.plant_id,
+                e,
+            )
             _LOGGER.error("Connection error: %s", e)
+            self._circuit_breaker.record_failure()
             raise UpdateFailed(f"Connection failed: {e}") from e
 
         except LuxpowerAPIError as e:
-            if self._last_available_state:
-                _LOGGER.warning(
-                    "EG4 Web Monitor service unavailable due to API error for plant %s: %s",
-                    self.plant_id,
-                    e,
-                )
-                self._last_available_state = False
+            self._mark_unavailable(
+                "EG4 Web Monitor service unavailable due to API error for plant %s: %s",
+                self.plant_id,
+                e,
+            )
             _LOGGER.error("API error: %s", e)
+            self._circuit_breaker.record_failure()
             raise UpdateFailed(f"API error: {e}") from e
 
         except Exception as e:
-            if self._last_available_state:
-                _LOGGER.warning(
-                    "EG4 Web Monitor service unavailable due to unexpected error for plant %s: %s",
-                    self.plant_id,
-                    e,
-                )
-                self._last_available_state = False
+            self._mark_unavailable(
+                "EG4 Web Monitor service unavailable due to unexpected error for plant %s: %s",
+                self.plant_id,
+                e,
+            )
             _LOGGER.exception("Unexpected error updating data: %s", e)
+            self._circuit_breaker.record_failure()
             raise UpdateFailed(f"Unexpected error: {e}") from e
 
-    async def _process_station_data(self) -> dict[str, Any]:
-        """Process station data using device objects."""
-        if not self.station:
+        finally:
+            # Runs on cancellation too, so a half-open probe slot never leaks
+            self._circuit_breaker.release()
+
+    async def _async_probe_http_api(
+        self, inverter: BaseInverter, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Probe API recovery by processing a single inverter.
+
+        Used while the circuit breaker is half-open so that recovery is tested
+        without a full station refresh and per-inverter fan-out.
+
+        Args:
+            inverter: The inverter to probe the API through.
+            data: The last successfully processed coordinator data.
+
+        Returns:
+            A copy of the previous coordinator data with the probed inverter's
+            entry and last_update replaced.
+        """
+        serial = inverter.serial_number
+        _LOGGER.debug("Circuit breaker half-open, probing API via inverter %s", serial)
+        device_data = await self._process_inverter_object(inverter)
+
+        battery_bank = getattr(inverter, "_battery_bank", None)
+        if batteries := getattr(battery_bank, "batteries", None):
+            device_data["batteries"].update(
+                self._extract_batteries_batch(batteries, serial)
+            )
+
+        self._circuit_breaker.record_success()
+        return {
+            **data,
+            "devices": {**data["devices"], serial: device_data},
+            "last_update": dt_util.utcnow(),
+        }
+
+    def _should_refresh_topology(self, now: datetime) -> bool:
+        """Check if a full station refresh is due as of the given time.
+
+        Inverters, MID devices and parallel groups refresh themselves while
+        being processed, so the full refresh is only needed periodically to
+        pick up topology changes, or early when an inverter has no data.
+        """
+        if self._last_topology_refresh is None or self.station is None:
+            return True
+
+        if any(not inverter.has_data for inverter in self.station.all_inverters):
+            return True
+
+        time_since_refresh = now - self._last_topology_refresh
+        return bool(time_since_refresh >= self._topology_refresh_interval)
+
+    async def _process_station_data(self, now: datetime) -> dict[str, Any]:
+        """Process station data using device objects.
+
+        Args:
+            now: Timestamp of the current update cycle, used as last_update.
+        """
+        station = self.station
+        if not station:
             raise UpdateFailed("Station not loaded")
 
         processed = {
             "plant_id": self.plant_id,
             "devices": {},
             "device_info": {},
-            "last_update": dt_util.utcnow(),
+            "last_update": now,
         }
 
         # Preserve existing parameter data from previous updates
@@ -629,125 +959,105 @@ class EG4DataUpdateCoordinator(
             processed["parameters"] = self.data["parameters"]
 
         # Add station data
-        processed["station"] = {
-            "name": self.station.name,
-            "plant_id": self.station.id,
+        station_info: dict[str, Any] = {
+            "name": station.name,
+            "plant_id": station.id,
         }
 
-        if timezone := getattr(self.station, "timezone", None):
-            processed["station"]["timezone"] = timezone
+        if timezone := getattr(station, "timezone", None):
+            station_info["timezone"] = timezone
 
-        if location := getattr(self.station, "location", None):
+        if location := getattr(station, "location", None):
             if country := getattr(location, "country", None):
-                processed["station"]["country"] = country
+                station_info["country"] = country
             if address := getattr(location, "address", None):
-                processed["station"]["address"] = address
+                station_info["address"] = address
 
-        if created_date := getattr(self.station, "created_date", None):
-            processed["station"]["createDate"] = created_date.isoformat()
+        # Missing or None created_date both raise AttributeError here
+        with suppress(AttributeError):
+            station_info["createDate"] = station.created_date.isoformat()
 
-        # Process all inverters concurrently with semaphore to prevent rate limiting
-        async def process_inverter_with_semaphore(
-            inv: BaseInverter,
-        ) -> tuple[str, dict[str, Any]]:
-            """Process a single inverter with semaphore protection."""
-            async with self._api_semaphore:
-                try:
-                    result = await self._process_inverter_object(inv)
-                    return (inv.serial_number, result)
-                except Exception as e:
-                    _LOGGER.error(
-                        "Error processing inverter %s: %s", inv.serial_number, e
-                    )
-                    return (
-                        inv.serial_number,
-                        {
-                            "type": "unknown",
-                            "model": "Unknown",
-                            "error": str(e),
-                            "sensors": {},
-                            "batteries": {},
-                        },
-                    )
+        processed["station"] = station_info
 
-        # Process all inverters concurrently (max 3 at a time via semaphore)
-        inverter_tasks = [
-            process_inverter_with_semaphore(inv) for inv in self.station.all_inverters
-        ]
-        inverter_results = await asyncio.gather(*inverter_tasks)
+        # Process all inverters concurrently; each API request they issue goes
+        # through the rate limiter (max 3 in flight)
+        inverters = station.all_inverters
+        inverter_results = await asyncio.gather(
+            *(self._process_inverter_object(inv) for inv in inverters),
+            return_exceptions=True,
+        )
 
-        # Populate processed devices from results
-        for serial, device_data in inverter_results:
-            processed["devices"][serial] = device_data
+        # Populate processed devices from results; a failed inverter gets a
+        # placeholder entry instead of failing the whole update
+        processed_inverters: list[tuple[str, BaseInverter]] = []
+        for inv, result in zip(inverters, inverter_results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                _LOGGER.error(
+                    "Error processing inverter %s: %s", inv.serial_number, result
+                )
+                result = {
+                    **_ERROR_DEVICE_FIELDS,
+                    "error": str(result),
+                    "sensors": {},
+                    "batteries": {},
+                }
+            else:
+                processed_inverters.append((inv.serial_number, inv))
+            processed["devices"][inv.serial_number] = result
 
         # Process parallel group data if available
-        if hasattr(self.station, "parallel_groups") and self.station.parallel_groups:
-            _LOGGER.debug(
-                "Processing %d parallel groups", len(self.station.parallel_groups)
+        if parallel_groups := getattr(station, "parallel_groups", None):
+            _LOGGER.debug("Processing %d parallel groups", len(parallel_groups))
+            group_results = await asyncio.gather(
+                *(
+                    self._refresh_and_process_group(group) for group in parallel_groups
+                ),
+                return_exceptions=True,
             )
-            for group in self.station.parallel_groups:
-                try:
-                    await group.refresh()
-                    _LOGGER.debug(
-                        "Parallel group %s refreshed: energy=%s, today_yielding=%.2f kWh",
-                        group.name,
-                        group._energy is not None,
-                        group.today_yielding,
-                    )
-
-                    group_data = await self._process_parallel_group_object(group)
-                    _LOGGER.debug(
-                        "Parallel group %s sensors: %s",
-                        group.name,
-                        list(group_data.get("sensors", {}).keys()),
-                    )
-                    processed["devices"][
-                        f"parallel_group_{group.first_device_serial}"
-                    ] = group_data
-
-                    if hasattr(group, "mid_device") and group.mid_device:
-                        try:
-                            processed["devices"][
-                                group.mid_device.serial_number
-                            ] = await self._process_mid_device_object(group.mid_device)
-                        except Exception as e:
-                            _LOGGER.error(
-                                "Error processing MID device %s: %s",
-                                group.mid_device.serial_number,
-                                e,
-                            )
-                except Exception as e:
-                    _LOGGER.error("Error processing parallel group: %s", e)
+            for group_devices in group_results:
+                if isinstance(group_devices, BaseException):
+                    _LOGGER.error("Error processing parallel group: %s", group_devices)
+                    continue
+                processed["devices"].update(group_devices)
 
         # Process standalone MID devices (GridBOSS without inverters) - fixes #86
-        if hasattr(self.station, "standalone_mid_devices"):
-            for mid_device in self.station.standalone_mid_devices:
-                try:
-                    processed["devices"][
-                        mid_device.serial_number
-                    ] = await self._process_mid_device_object(mid_device)
-                    _LOGGER.debug(
-                        "Processed standalone MID device %s",
-                        mid_device.serial_number,
-                    )
-                except Exception as e:
-                    _LOGGER.error(
-                        "Error processing standalone MID device %s: %s",
-                        mid_device.serial_number,
-                        e,
+        if standalone_mid_devices := getattr(station, "standalone_mid_devices", None):
+            # Each task handles its own errors, so one failing device never
+            # cancels its siblings through the task group
+            async with asyncio.TaskGroup() as tg:
+                mid_tasks = [
+                    tg.create_task(
+                        self._process_standalone_mid_device(mid_device),
+                        name=f"eg4_mid_{mid_device.serial_number}",
                     )
+                    for mid_device in standalone_mid_devices
+                ]
+            for mid_device, task in zip(standalone_mid_devices, mid_tasks, strict=True):
+                if (mid_data := task.result()) is not None:
+                    processed["devices"][mid_device.serial_number] = mid_data
+
+        # Parameters are normally loaded for every inverter, so this set is
+        # usually empty and the per-inverter check below short-circuits
+        parameters = processed.setdefault("parameters", {})
+        params_missing = self._inverter_cache.keys() - parameters.keys()
+        inverters_needing_params: list[str] = []
 
         # Process batteries through inverter hierarchy (fixes #76)
         # This approach uses the known parent serial from the inverter object,
-        # rather than trying to parse it from batteryKey (which may not contain it)
-        for serial, device_data in processed["devices"].items():
-            if device_data.get("type") != "inverter":
-                continue
-
-            inverter = self.get_inverter_object(serial)
-            if not inverter:
-                _LOGGER.debug("No inverter object found for serial %s", serial)
-                continue
+        # rather than trying to parse it from batteryKey (which may not contain it).
+        # The same pass collects inverters whose parameters are not loaded yet.
+        # Only successfully processed inverters are walked; failed ones carry
+        # a placeholder entry, and other device types never need this pass
+        devices = processed["devices"]
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        battery_cache: dict[str, dict[int, Battery]] = {}
+        for serial, inverter in processed_inverters:
+            device_data = devices[serial]
+
+            if params_missing and serial in params_missing:
+                inverters_needing_params.append(serial)
 
             # Access battery_bank through the inverter object
             battery_bank = getattr(inverter, "_battery_bank", None)
@@ -761,103 +1071,188 @@ class EG4DataUpdateCoordinator(
 
             batteries = getattr(battery_bank, "batteries", None)
             if not batteries:
-                _LOGGER.debug(
-                    "No batteries in battery_bank for inverter %s (batteries=%s, "
-                    "battery_bank.data=%s)",
-                    serial,
-                    batteries,
-                    getattr(battery_bank, "data", None),
-                )
-                continue
-
-            _LOGGER.debug("Found %d batteries for inverter %s", len(batteries), serial)
-
-            for battery in batteries:
-                try:
-                    battery_key = clean_battery_display_name(
-                        getattr(
-                            battery,
-                            "battery_key",
-                            f"BAT{battery.battery_index:03d}",
-                        ),
-                        serial,  # Parent serial is known from inverter iteration
-                    )
-                    battery_sensors = self._extract_battery_from_object(battery)
-
-                    if "batteries" not in device_data:
-                        device_data["batteries"] = {}
-                    device_data["batteries"][battery_key] = battery_sensors
-
+                if debug_enabled:
                     _LOGGER.debug(
-                        "Processed battery %s for inverter %s",
-                        battery_key,
-                        serial,
-                    )
-                except Exception as e:
-                    _LOGGER.error(
-                        "Error processing battery %s for inverter %s: %s",
-                        getattr(battery, "battery_sn", "unknown"),
+                        "No batteries in battery_bank for inverter %s (batteries=%s, "
+                        "battery_bank.data=%s)",
                         serial,
-                        e,
+                        batteries,
+                        getattr(battery_bank, "data", None),
                     )
+                continue
+
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Found %d batteries for inverter %s", len(batteries), serial
+                )
 
-        # Check if we need to refresh parameters for any inverters
-        if "parameters" not in processed:
-            processed["parameters"] = {}
+            # Parent serial is known from inverter iteration
+            device_data.setdefault("batteries", {}).update(
+                self._extract_batteries_batch(batteries, serial)
+            )
+            # Reversed so that, as with a linear scan, the first match wins
+            ordered = list(reversed(batteries))
+            battery_cache[serial] = dict(zip(map(_battery_index, ordered), ordered))
 
-        inverters_needing_params = []
-        for serial, device_data in processed["devices"].items():
-            if (
-                device_data.get("type") == "inverter"
-                and serial not in processed["parameters"]
-            ):
-                inverters_needing_params.append(serial)
+        self._battery_cache = battery_cache
 
+        # Refresh parameters for any inverters that do not have them yet
         if inverters_needing_params:
             _LOGGER.info(
                 "Refreshing parameters for %d new inverters: %s",
                 len(inverters_needing_params),
                 inverters_needing_params,
             )
-            task = self.hass.async_create_task(
-                self._refresh_missing_parameters(inverters_needing_params, processed)
+            self._create_background_task(
+                self._refresh_missing_parameters(inverters_needing_params, processed),
+                name="eg4_refresh_missing_parameters",
             )
-            self._background_tasks.add(task)
-            task.add_done_callback(self._remove_task_from_set)
-            task.add_done_callback(self._log_task_exception)
 
         return processed
 
-    def _rebuild_inverter_cache(self) -> None:
-        """Rebuild inverter lookup cache after station load."""
-        self._inverter_cache = {}
-        if self.station:
-            for inverter in self.station.all_inverters:
-                self._inverter_cache[inverter.serial_number] = inverter
+    async def _process_standalone_mid_device(
+        self, mid_device: Any
+    ) -> dict[str, Any] | None:
+        """Process a standalone MID device (GridBOSS without inverters).
+
+        Returns:
+            Processed device data, or None if processing failed (logged).
+        """
+        try:
+            mid_data = await self._process_mid_device_object(mid_device)
+        except Exception as e:
+            _LOGGER.error(
+                "Error processing standalone MID device %s: %s",
+                mid_device.serial_number,
+                e,
+            )
+            return None
+
+        _LOGGER.debug("Processed standalone MID device %s", mid_device.serial_number)
+        return mid_data
+
+    def _rebuild_device_cache(self) -> None:
+        """Rebuild inverter and MID device lookup caches after a station refresh."""
+        station = self.station
+        if not station:
+            self._inverter_cache = {}
+            self._mid_device_cache = {}
+            return
+
+        # Materialised once: it is walked by the match check and the rebuild
+        inverters = list(station.all_inverters)
+        parallel_groups = getattr(station, "parallel_groups", None) or ()
+        mid_devices = [
+            group.mid_device
+            for group in parallel_groups
+            if getattr(group, "mid_device", None)
+        ]
+        # Standalone MID devices (GridBOSS without inverters)
+        mid_devices.extend(getattr(station, "standalone_mid_devices", None) or ())
+
+        # Topology is usually stable; keep the caches if they already hold
+        # exactly these device objects
+        if self._cache_matches(
+            self._inverter_cache, inverters
+        ) and self._cache_matches(self._mid_device_cache, mid_devices):
+            return
+
+        self._inverter_cache = dict(zip(map(_serial_number, inverters), inverters))
+        self._mid_device_cache = dict(
+            zip(map(_serial_number, mid_devices), mid_devices)
+        )
+        _LOGGER.debug(
+            "Rebuilt device cache with %d inverters and %d MID devices",
+            len(self._inverter_cache),
+            len(self._mid_device_cache),
+        )
+        self._resize_rate_limiter(
+            len(inverters) * _MAX_REQUESTS_PER_INVERTER
+            + len(parallel_groups) * _MAX_REQUESTS_PER_GROUP
+            + len(mid_devices) * _MAX_REQUESTS_PER_MID_DEVICE
+        )
+
+    def _resize_rate_limiter(self, requests_per_poll: int) -> None:
+        """Size the rate limiter so a regular poll never waits for tokens.
+
+        The bucket holds one poll's worth of requests and refills within the
+        base update interval. Throttling then only applies to extra refreshes
+        on top of the schedule, and a hybrid poll's HTTP leg never holds back
+        its Modbus leg.
+        """
+        max_tokens = max(3, requests_per_poll)
+        rate = max(0.5, max_tokens / self._base_update_interval.total_seconds())
+        self._rate_limiter.resize(rate, max_tokens)
+        _LOGGER.debug("Rate limiter sized to %d tokens at %.2f/s", max_tokens, rate)
+
+    @staticmethod
+    def _cache_matches(cache: dict[str, Any], devices: Sequence[Any]) -> bool:
+        """Return whether a serial-keyed cache holds exactly the given objects."""
+        return len(cache) == len(devices) and all(
+            cache.get(device.serial_number) is device for device in devices
+        )
+
+    async def _refresh_and_process_group(self, group: Any) -> dict[str, Any]:
+        """Refresh a parallel group and process it together with its MID device.
+
+        Only the refresh request runs under the shared rate limiter, so groups
+        fanned out alongside the inverters stay within the cloud API's limits
+        without holding a slot while their data is processed.
+
+        Args:
+            group: ParallelGroup object from pylxpweb
+
+        Returns:
+            Processed device data keyed by device ID, in display order: the
+            parallel group first, then its MID device if present.
+        """
+        devices: dict[str, Any] = {}
+        try:
+            async with self._rate_limiter:
+                await group.refresh()
             _LOGGER.debug(
-                "Rebuilt inverter cache with %d inverters",
-                len(self._inverter_cache),
+                "Parallel group %s refreshed: energy=%s, today_yielding=%.2f kWh",
+                group.name,
+                group._energy is not None,
+                group.today_yielding,
             )
 
+            group_data = await self._process_parallel_group_object(group)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Parallel group %s sensors: %s",
+                    group.name,
+                    list(group_data.get("sensors", {}).keys()),
+                )
+            devices[f"parallel_group_{group.first_device_serial}"] = group_data
+
+            if hasattr(group, "mid_device") and group.mid_device:
+                try:
+                    devices[
+                        group.mid_device.serial_number
+                    ] = await self._process_mid_device_object(group.mid_device)
+                except Exception as e:
+                    _LOGGER.error(
+                        "Error processing MID device %s: %s",
+                        group.mid_device.serial_number,
+                        e,
+                    )
+        except Exception as e:
+            _LOGGER.error("Error processing parallel group: %s", e)
+
+        return devices
+
+    def invalidate_firmware_check(self, serial: str) -> None:
+        """Force a firmware update check for a device on the next refresh."""
+        self._firmware_check_cache.pop(serial, None)
+
     def get_inverter_object(self, serial: str) -> BaseInverter | None:
         """Get inverter device object by serial number (O(1) cached lookup)."""
         return self._inverter_cache.get(serial)
 
     def get_battery_object(self, serial: str, battery_index: int) -> Battery | None:
-        """Get battery object by inverter serial and battery index."""
-        inverter = self.get_inverter_object(serial)
-        battery_bank = getattr(inverter, "_battery_bank", None) if inverter else None
-        if not battery_bank:
-            return None
-
-        if not hasattr(battery_bank, "batteries"):
-            return None
-
-        for battery in battery_bank.batteries:
-            if battery.index == battery_index:
-                return cast(Battery, battery)
-
-        return None
+        """Get battery object by inverter serial and battery index (O(1) cached)."""
+        return self._battery_cache.get(serial, _EMPTY_BATTERY_INDEX).get(battery_index)
 
     def _get_device_object(self, serial: str) -> BaseInverter | Any | None:
         """Get device object (inverter or MID device) by serial number.
@@ -865,23 +1260,6 @@ class EG4DataUpdateCoordinator(
         Used by Update platform to get device objects for firmware updates.
         Returns BaseInverter for inverters, or MIDDevice (typed as Any) for MID devices.
         """
-        if not self.station:
-            return None
-
-        for inverter in self.station.all_inverters:
-            if inverter.serial_number == serial:
-                return inverter
-
-        if hasattr(self.station, "parallel_groups"):
-            for group in self.station.parallel_groups:
-                if hasattr(group, "mid_device") and group.mid_device:
-                    if group.mid_device.serial_number == serial:
-                        return group.mid_device
-
-        # Check standalone MID devices (GridBOSS without inverters)
-        if hasattr(self.station, "standalone_mid_devices"):
-            for mid_device in self.station.standalone_mid_devices:
-                if mid_device.serial_number == serial:
-                    return mid_device
-
-        return None
+        if (inverter := self._inverter_cache.get(serial)) is not None:
+            return inverter
+        return self._mid_device_cache.get(serial)
@@ -13,7 +13,9 @@ final coordinator class inheriting all mixins together.
 
 import asyncio
 import logging
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from homeassistant.core import HomeAssistant
@@ -21,17 +23,28 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from homeassistant.config_entries import ConfigEntry
     from pylxpweb import LuxpowerClient
     from pylxpweb.devices import Battery, Station
     from pylxpweb.devices.inverters.base import BaseInverter
 
 from pylxpweb.devices.inverters._features import InverterFamily
+from pylxpweb.exceptions import (
+    LuxpowerAPIError,
+    LuxpowerAuthError,
+    LuxpowerConnectionError,
+)
 
-from .const import DOMAIN, MANUFACTURER
-from .utils import clean_battery_display_name
+from .const import DOMAIN, FIRMWARE_DEVICE_TYPES, MANUFACTURER
+from .utils import RateLimiter, clean_battery_display_name
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on tracked background tasks before stale entries are pruned
+_MAX_BACKGROUND_TASKS = 100
+
 
 class CoordinatorProtocol(Protocol):
     """Protocol defining the interface that mixins expect from the coordinator.
@@ -46,6 +59,7 @@ class CoordinatorProtocol(Protocol):
     station: "Station | None"
     client: "LuxpowerClient"
     hass: HomeAssistant
+    entry: "ConfigEntry"
     dst_sync_enabled: bool
 
     # Private attributes for state tracking
@@ -53,7 +67,11 @@ class CoordinatorProtocol(Protocol):
     _parameter_refresh_interval: timedelta
     _last_dst_sync: datetime | None  # noqa: F821
     _dst_sync_interval: timedelta
+    _features_cache: dict[str, tuple[str | None, dict[str, Any]]]
+    _firmware_check_cache: dict[str, tuple[datetime, str | None, dict[str, Any] | None]]
+    _firmware_check_interval: timedelta
     _background_tasks: set[asyncio.Task[Any]]
+    _rate_limiter: RateLimiter
     _debounced_refresh: Any
 
     # Methods that mixins may call on each other
@@ -64,32 +82,351 @@ class CoordinatorProtocol(Protocol):
     async def async_request_refresh(self) -> None: ...
 
 
+# ===== Property Maps =====
+
+# Inverter property name -> sensor key
+_INVERTER_PROPERTY_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        # Power sensors
+        "power_output": "power_output",
+        "pv_total_power": "pv_total_power",
+        "pv1_power": "pv1_power",
+        "pv2_power": "pv2_power",
+        "pv3_power": "pv3_power",
+        "battery_power": "battery_power",
+        "battery_charge_power": "battery_charge_power",
+        "battery_discharge_power": "battery_discharge_power",
+        "consumption_power": "consumption_power",
+        "inverter_power": "ac_power",
+        "rectifier_power": "rectifier_power",
+        "ac_couple_power": "ac_couple_power",
+        "generator_power": "generator_power",
+        "eps_power": "eps_power",
+        "eps_power_l1": "eps_power_l1",
+        "eps_power_l2": "eps_power_l2",
+        # Voltage sensors
+        "pv1_voltage": "pv1_voltage",
+        "pv2_voltage": "pv2_voltage",
+        "pv3_voltage": "pv3_voltage",
+        "battery_voltage": "battery_voltage",
+        "grid_voltage_r": "grid_voltage_r",
+        "grid_voltage_s": "grid_voltage_s",
+        "grid_voltage_t": "grid_voltage_t",
+        "eps_voltage_r": "eps_voltage_r",
+        "eps_voltage_s": "eps_voltage_s",
+        "eps_voltage_t": "eps_voltage_t",
+        "generator_voltage": "generator_voltage",
+        "bus1_voltage": "bus1_voltage",
+        "bus2_voltage": "bus2_voltage",
+        # Frequency sensors
+        "grid_frequency": "grid_frequency",
+        "eps_frequency": "eps_frequency",
+        "generator_frequency": "generator_frequency",
+        # Temperature sensors
+        "battery_temperature": "battery_temperature",
+        "inverter_temperature": "internal_temperature",
+        "radiator1_temperature": "radiator1_temperature",
+        "radiator2_temperature": "radiator2_temperature",
+        # Battery sensors
+        "battery_soc": "state_of_charge",
+        # Note: battery_status is extracted from BatteryBank.status in
+        # _extract_battery_bank_from_object(), not from the inverter directly
+        # Energy sensors - Generation
+        "total_energy_today": "yield",
+        "total_energy_lifetime": "yield_lifetime",
+        # Energy sensors - Grid Import/Export
+        "energy_today_import": "grid_import",
+        "energy_today_export": "grid_export",
+        "energy_lifetime_import": "grid_import_lifetime",
+        "energy_lifetime_export": "grid_export_lifetime",
+        # Energy sensors - Consumption
+        "energy_today_usage": "consumption",
+        "energy_lifetime_usage": "consumption_lifetime",
+        # Energy sensors - Battery Charging/Discharging
+        "energy_today_charging": "charging",
+        "energy_today_discharging": "discharging",
+        "energy_lifetime_charging": "charging_lifetime",
+        "energy_lifetime_discharging": "discharging_lifetime",
+        # Current sensors
+        "max_charge_current": "max_charge_current",
+        "max_discharge_current": "max_discharge_current",
+        # Grid power sensors (instantaneous)
+        "power_to_user": "grid_import_power",
+        "power_to_grid": "grid_export_power",
+        # Other sensors
+        "power_rating": "power_rating",
+        "power_rating_text": "inverter_power_rating",
+        "power_factor": "power_factor",
+        "status_text": "status_text",
+        "status": "status_code",
+        "has_data": "has_data",
+        # Diagnostic sensors from energy API
+        "is_lost": "inverter_lost_status",
+        "has_runtime_data": "inverter_has_runtime_data",
+    }
+)
+_INVERTER_PROPERTY_ITEMS = tuple(_INVERTER_PROPERTY_MAP.items())
+
+# Battery property name -> sensor key
+_BATTERY_PROPERTY_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        # Core battery metrics
+        "voltage": "battery_real_voltage",
+        "current": "battery_real_current",
+        "power": "battery_real_power",
+        "soc": "battery_rsoc",
+        "soh": "state_of_health",
+        # Temperature sensors
+        "mos_temp": "battery_mos_temperature",
+        "ambient_temp": "battery_ambient_temperature",
+        "max_cell_temp": "battery_max_cell_temp",
+        "min_cell_temp": "battery_min_cell_temp",
+        "max_cell_temp_num": "battery_max_cell_temp_num",
+        "min_cell_temp_num": "battery_min_cell_temp_num",
+        # Cell voltage sensors
+        "max_cell_voltage": "battery_max_cell_voltage",
+        "min_cell_voltage": "battery_min_cell_voltage",
+        "max_cell_voltage_num": "battery_max_cell_voltage_num",
+        "min_cell_voltage_num": "battery_min_cell_voltage_num",
+        "cell_voltage_delta": "battery_cell_voltage_delta",
+        "cell_temp_delta": "battery_cell_temp_delta",
+        # Capacity sensors
+        "current_remain_capacity": "battery_remaining_capacity",
+        "current_full_capacity": "battery_full_capacity",
+        "charge_capacity": "battery_design_capacity",
+        "discharge_capacity": "battery_discharge_capacity",
+        "capacity_percent": "battery_capacity_percentage",
+        # Current limits
+        "charge_max_current": "battery_max_charge_current",
+        "charge_voltage_ref": "battery_charge_voltage_ref",
+        # Lifecycle
+        "cycle_count": "cycle_count",
+        "firmware_version": "battery_firmware_version",
+        # Metadata
+        "battery_sn": "battery_serial_number",
+        "battery_type": "battery_type",
+        "battery_type_text": "battery_type_text",
+        "bms_model": "battery_bms_model",
+        "model": "battery_model",
+        "battery_index": "battery_index",
+    }
+)
+_BATTERY_PROPERTY_ITEMS = tuple(_BATTERY_PROPERTY_MAP.items())
+
+# Battery bank property name -> sensor key
+_BATTERY_BANK_PROPERTY_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        # Core metrics
+        "voltage": "battery_bank_voltage",
+        "soc": "battery_bank_soc",
+        "charge_power": "battery_bank_charge_power",
+        "discharge_power": "battery_bank_discharge_power",
+        "battery_power": "battery_bank_power",
+        # Capacity metrics
+        "max_capacity": "battery_bank_max_capacity",
+        "current_capacity": "battery_bank_current_capacity",
+        "remain_capacity": "battery_bank_remain_capacity",
+        "full_capacity": "battery_bank_full_capacity",
+        "capacity_percent": "battery_bank_capacity_percent",
+        # Status and metadata
+        "battery_count": "battery_bank_count",
+        "status": "battery_bank_status",
+    }
+)
+_BATTERY_BANK_PROPERTY_ITEMS = tuple(_BATTERY_BANK_PROPERTY_MAP.items())
+
+# Parallel group property name -> sensor key
+_PARALLEL_GROUP_PROPERTY_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        # Today energy values
+        "today_yielding": "yield",
+        "today_discharging": "discharging",
+        "today_charging": "charging",
+        "today_export": "grid_export",
+        "today_import": "grid_import",
+        "today_usage": "consumption",
+        # Lifetime energy values
+        "total_yielding": "yield_lifetime",
+        "total_discharging": "discharging_lifetime",
+        "total_charging": "charging_lifetime",
+        "total_export": "grid_export_lifetime",
+        "total_import": "grid_import_lifetime",
+        "total_usage": "consumption_lifetime",
+        # Aggregate battery properties (calculated from all inverters)
+        "battery_charge_power": "parallel_battery_charge_power",
+        "battery_discharge_power": "parallel_battery_discharge_power",
+        "battery_power": "parallel_battery_power",
+        "battery_soc": "parallel_battery_soc",
+        "battery_max_capacity": "parallel_battery_max_capacity",
+        "battery_current_capacity": "parallel_battery_current_capacity",
+        "battery_voltage": "parallel_battery_voltage",
+        "battery_count": "parallel_battery_count",
+    }
+)
+_PARALLEL_GROUP_PROPERTY_ITEMS = tuple(_PARALLEL_GROUP_PROPERTY_MAP.items())
+
+# MID device property name -> sensor key
+_MID_DEVICE_PROPERTY_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        # Grid sensors
+        "grid_power": "grid_power",
+        "grid_voltage": "grid_voltage",
+        "grid_frequency": "frequency",
+        "grid_l1_power": "grid_power_l1",
+        "grid_l2_power": "grid_power_l2",
+        "grid_l1_voltage": "grid_voltage_l1",
+        "grid_l2_voltage": "grid_voltage_l2",
+        "grid_l1_current": "grid_current_l1",
+        "grid_l2_current": "grid_current_l2",
+        # UPS sensors
+        "ups_power": "ups_power",
+        "ups_voltage": "ups_voltage",
+        "ups_l1_power": "ups_power_l1",
+        "ups_l2_power": "ups_power_l2",
+        "ups_l1_voltage": "load_voltage_l1",
+        "ups_l2_voltage": "load_voltage_l2",
+        "ups_l1_current": "ups_current_l1",
+        "ups_l2_current": "ups_current_l2",
+        # Load sensors
+        "load_power": "load_power",
+        "load_l1_power": "load_power_l1",
+        "load_l2_power": "load_power_l2",
+        "load_l1_current": "load_current_l1",
+        "load_l2_current": "load_current_l2",
+        # Generator sensors
+        "generator_power": "generator_power",
+        "generator_voltage": "generator_voltage",
+        "generator_l1_power": "generator_power_l1",
+        "generator_l2_power": "generator_power_l2",
+        "generator_l1_voltage": "generator_voltage_l1",
+        "generator_l2_voltage": "generator_voltage_l2",
+        "generator_l1_current": "generator_current_l1",
+        "generator_l2_current": "generator_current_l2",
+        # Other sensors
+        "hybrid_power": "hybrid_power",
+        "phase_lock_frequency": "phase_lock_frequency",
+        "is_off_grid": "off_grid",
+        "smart_port1_status": "smart_port1_status",
+        "smart_port2_status": "smart_port2_status",
+        "smart_port3_status": "smart_port3_status",
+        "smart_port4_status": "smart_port4_status",
+        # Smart Load Power sensors (runtime data - L1/L2 have valid data)
+        # Property names match MIDRuntimePropertiesMixin in pylxpweb 0.5.5+
+        "smart_load1_l1_power": "smart_load1_power_l1",
+        "smart_load1_l2_power": "smart_load1_power_l2",
+        "smart_load2_l1_power": "smart_load2_power_l1",
+        "smart_load2_l2_power": "smart_load2_power_l2",
+        "smart_load3_l1_power": "smart_load3_power_l1",
+        "smart_load3_l2_power": "smart_load3_power_l2",
+        "smart_load4_l1_power": "smart_load4_power_l1",
+        "smart_load4_l2_power": "smart_load4_power_l2",
+        # AC Couple Power sensors (runtime data - L1/L2 have valid data)
+        # Property names match MIDRuntimePropertiesMixin in pylxpweb 0.5.5+
+        "ac_couple1_l1_power": "ac_couple1_power_l1",
+        "ac_couple1_l2_power": "ac_couple1_power_l2",
+        "ac_couple2_l1_power": "ac_couple2_power_l1",
+        "ac_couple2_l2_power": "ac_couple2_power_l2",
+        "ac_couple3_l1_power": "ac_couple3_power_l1",
+        "ac_couple3_l2_power": "ac_couple3_power_l2",
+        "ac_couple4_l1_power": "ac_couple4_power_l1",
+        "ac_couple4_l2_power": "ac_couple4_power_l2",
+        # Energy sensors - aggregate only (L2 energy registers always read 0)
+        # UPS energy
+        "e_ups_today": "ups_today",
+        "e_ups_total": "ups_total",
+        # Grid energy
+        "e_to_grid_today": "grid_export_today",
+        "e_to_grid_total": "grid_export_total",
+        "e_to_user_today": "grid_import_today",
+        "e_to_user_total": "grid_import_total",
+        # Load energy
+        "e_load_today": "load_today",
+        "e_load_total": "load_total",
+        # AC Couple energy (all 4 ports)
+        "e_ac_couple1_today": "ac_couple1_today",
+        "e_ac_couple1_total": "ac_couple1_total",
+        "e_ac_couple2_today": "ac_couple2_today",
+        "e_ac_couple2_total": "ac_couple2_total",
+        "e_ac_couple3_today": "ac_couple3_today",
+        "e_ac_couple3_total": "ac_couple3_total",
+        "e_ac_couple4_today": "ac_couple4_today",
+        "e_ac_couple4_total": "ac_couple4_total",
+        # Smart Load energy (all 4 ports)
+        "e_smart_load1_today": "smart_load1_today",
+        "e_smart_load1_total": "smart_load1_total",
+        "e_smart_load2_today": "smart_load2_today",
+        "e_smart_load2_total": "smart_load2_total",
+        "e_smart_load3_today": "smart_load3_today",
+        "e_smart_load3_total": "smart_load3_total",
+        "e_smart_load4_today": "smart_load4_today",
+        "e_smart_load4_total": "smart_load4_total",
+    }
+)
+_MID_DEVICE_PROPERTY_ITEMS = tuple(_MID_DEVICE_PROPERTY_MAP.items())
+
+# Inverter supports_* property -> InverterFeatures fallback attribute.
+# Some attributes don't follow the simple "supports_X" -> "X" pattern.
+_CAPABILITY_ITEMS: tuple[tuple[str, str], ...] = (
+    ("supports_split_phase", "split_phase"),
+    ("supports_three_phase", "three_phase_capable"),
+    ("supports_off_grid", "off_grid_capable"),
+    ("supports_parallel", "parallel_support"),
+    ("supports_volt_watt_curve", "volt_watt_curve"),
+    ("supports_grid_peak_shaving", "grid_peak_shaving"),
+    ("supports_drms", "drms_support"),
+    ("supports_discharge_recovery_hysteresis", "discharge_recovery_hysteresis"),
+)
+
+# Detected features that are also exposed as inverter diagnostic sensors
+_DIAG_FEATURE_KEYS = ("inverter_family", "device_type_code", "grid_type")
+
+# Marks an attribute that is absent, as distinct from one set to None
+_MISSING = object()
+
+# Errors from a switch status request that leave the status unknown
+_SWITCH_STATUS_ERRORS = (
+    LuxpowerAPIError,
+    LuxpowerAuthError,
+    LuxpowerConnectionError,
+    TimeoutError,
+    ValueError,
+)
+
+# What each concurrent inverter API call fetches, in gather order, for logging
+_INVERTER_FETCH_NAMES = (
+    "features",
+    "firmware update info",
+    "quick charge status",
+    "battery backup status",
+)
+
+
 # ===== Utility Functions =====
 
 
-def _map_device_properties(device: Any, property_map: dict[str, str]) -> dict[str, Any]:
-    """Map device properties to sensor keys using a property mapping dictionary.
+def _map_device_properties(
+    device: Any, property_items: Sequence[tuple[str, str]]
+) -> dict[str, Any]:
+    """Map device properties to sensor keys using pre-built property pairs.
 
     This is a generic utility that extracts properties from any device object
     (inverter, MID device, parallel group, battery) and maps them to sensor keys.
 
     Args:
         device: The device object to extract properties from
-        property_map: Dictionary mapping property_name -> sensor_key
+        property_items: Pairs of (property_name, sensor_key)
 
     Returns:
         Dictionary of {sensor_key: value} for all found properties with valid values
     """
-    sensors: dict[str, Any] = {}
-
-    for property_name, sensor_key in property_map.items():
-        if hasattr(device, property_name):
-            value = getattr(device, property_name, None)
-            # Skip None values and empty strings (which indicate no data)
-            if value is not None and value != "":
-                sensors[sensor_key] = value
-
-    return sensors
+    # Single lookup: missing attributes fall back to None and are skipped
+    # together with None values and empty strings (which indicate no data)
+    return {
+        sensor_key: value
+        for property_name, sensor_key in property_items
+        if (value := getattr(device, property_name, None)) is not None
+        and value != ""
+    }
 
 
 def _safe_numeric(value: Any) -> float:
@@ -101,6 +438,13 @@ def _safe_numeric(value: Any) -> float:
     Returns:
         Float value or 0.0 if conversion fails
     """
+    # Fast path for the common case: pylxpweb properties are already numeric.
+    # Exact type checks keep bool (an int subclass) on the conversion path.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
     if value is None:
         return 0.0
     try:
@@ -113,7 +457,6 @@ class DeviceProcessingMixin:
     """Mixin for device data processing logic.
 
     Handles processing of inverters, batteries, MID devices, and parallel groups.
-    Provides static methods for property mapping.
     """
 
     async def _process_inverter_object(
@@ -134,49 +477,53 @@ class DeviceProcessingMixin:
             Processed device data dictionary with sensors and binary_sensors
         """
         # Refresh inverter to load firmware version
-        await inverter.refresh()
-
-        # Detect inverter features for capability-based sensor filtering (pylxpweb 0.4.0+)
-        features: dict[str, Any] = {}
-        try:
-            if hasattr(inverter, "detect_features"):
-                await inverter.detect_features()
-                features = self._extract_inverter_features(inverter)
-                _LOGGER.debug(
-                    "Detected features for inverter %s: family=%s, split_phase=%s, "
-                    "three_phase=%s, parallel=%s",
-                    inverter.serial_number,
-                    features.get("inverter_family"),
-                    features.get("supports_split_phase"),
-                    features.get("supports_three_phase"),
-                    features.get("supports_parallel"),
-                )
-        except Exception as e:
-            _LOGGER.debug(
-                "Could not detect features for inverter %s: %s",
-                inverter.serial_number,
-                e,
+        async with self._rate_limiter:
+            await inverter.refresh()
+
+        # The remaining API calls are independent of each other, so run them
+        # concurrently; each request takes its own rate limiter slot. Firmware
+        # checks and switch states are only needed when runtime data exists;
+        # an offline inverter only gets its diagnostics.
+        firmware_update_info: dict[str, Any] | None = None
+        quick_charge_status: dict[str, Any] | None = None
+        battery_backup_status: dict[str, Any] | None = None
+        if inverter.has_data:
+            # A failed call is logged and left empty instead of discarding the
+            # results of the others
+            results = await asyncio.gather(
+                self._fetch_inverter_features(inverter),
+                self._fetch_firmware_update_info(inverter),
+                self._fetch_quick_charge_status(inverter),
+                self._fetch_battery_backup_status(inverter),
+                return_exceptions=True,
             )
+            values: list[Any] = []
+            for name, result in zip(_INVERTER_FETCH_NAMES, results, strict=True):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    _LOGGER.warning(
+                        "Could not fetch %s for inverter %s: %s",
+                        name,
+                        inverter.serial_number,
+                        result,
+                    )
+                    result = None
+                values.append(result)
+            (
+                features,
+                firmware_update_info,
+                quick_charge_status,
+                battery_backup_status,
+            ) = values
+            features = features or {}
+        else:
+            features = await self._fetch_inverter_features(inverter)
 
         # Get model and firmware from properties
         model = getattr(inverter, "model", "Unknown")
         firmware_version = getattr(inverter, "firmware_version", "1.0.0")
 
-        # Check for firmware updates (pylxpweb 0.3.7+)
-        firmware_update_info = None
-        try:
-            if hasattr(inverter, "check_firmware_updates"):
-                await inverter.check_firmware_updates()
-                if hasattr(inverter, "get_firmware_update_progress"):
-                    await inverter.get_firmware_update_progress()
-                firmware_update_info = self._extract_firmware_update_info(inverter)
-        except Exception as e:
-            _LOGGER.debug(
-                "Could not check firmware updates for %s: %s",
-                inverter.serial_number,
-                e,
-            )
-
         processed: dict[str, Any] = {
             "serial": inverter.serial_number,
             "type": "inverter",
@@ -205,62 +552,43 @@ class DeviceProcessingMixin:
                 "None" if energy_attr is None else "present",
             )
             # Still add diagnostic sensors even without runtime data
-            processed["sensors"]["firmware_version"] = firmware_version
-            processed["sensors"]["has_data"] = False
-            if features:
-                if "inverter_family" in features:
-                    processed["sensors"]["inverter_family"] = features[
-                        "inverter_family"
-                    ]
-                if "device_type_code" in features:
-                    processed["sensors"]["device_type_code"] = features[
-                        "device_type_code"
-                    ]
-                if "grid_type" in features:
-                    processed["sensors"]["grid_type"] = features["grid_type"]
+            sensors = processed["sensors"]
+            sensors["firmware_version"] = firmware_version
+            sensors["has_data"] = False
+            self._add_feature_diagnostics(sensors, features)
             return processed
 
         # Map inverter properties to sensor keys
-        property_map = self._get_inverter_property_map()
-        processed["sensors"] = _map_device_properties(inverter, property_map)
+        sensors = _map_device_properties(inverter, _INVERTER_PROPERTY_ITEMS)
+        processed["sensors"] = sensors
 
         # Add firmware_version as diagnostic sensor
-        processed["sensors"]["firmware_version"] = firmware_version
+        sensors["firmware_version"] = firmware_version
 
         # Add feature detection sensors for diagnostics
-        if features:
-            if "inverter_family" in features:
-                processed["sensors"]["inverter_family"] = features["inverter_family"]
-            if "device_type_code" in features:
-                processed["sensors"]["device_type_code"] = features["device_type_code"]
-            if "grid_type" in features:
-                processed["sensors"]["grid_type"] = features["grid_type"]
-
-        # Calculate net grid power
-        if hasattr(inverter, "power_to_user") and hasattr(inverter, "power_to_grid"):
-            power_to_user = _safe_numeric(inverter.power_to_user)
-            power_to_grid = _safe_numeric(inverter.power_to_grid)
-            processed["sensors"]["grid_power"] = power_to_user - power_to_grid
+        self._add_feature_diagnostics(sensors, features)
+
+        # Calculate net grid power (runtime properties defined on BaseInverter)
+        power_to_user = _safe_numeric(inverter.power_to_user)
+        power_to_grid = _safe_numeric(inverter.power_to_grid)
+        sensors["grid_power"] = power_to_user - power_to_grid
 
         # Calculate total load power (EPS + consumption for better power flow representation)
-        eps_power = _safe_numeric(processed["sensors"].get("eps_power", 0))
-        consumption_power = _safe_numeric(
-            processed["sensors"].get("consumption_power", 0)
-        )
+        eps_power = _safe_numeric(sensors.get("eps_power"))
+        consumption_power = _safe_numeric(sensors.get("consumption_power"))
         if eps_power > 0 or consumption_power > 0:
-            processed["sensors"]["total_load_power"] = eps_power + consumption_power
+            sensors["total_load_power"] = eps_power + consumption_power
 
         # Add legacy ac_voltage sensor
-        if hasattr(inverter, "eps_voltage_r"):
-            processed["sensors"]["ac_voltage"] = inverter.eps_voltage_r
+        sensors["ac_voltage"] = inverter.eps_voltage_r
 
         # Binary sensors
-        if hasattr(inverter, "is_lost"):
-            processed["binary_sensors"]["is_lost"] = inverter.is_lost
-        if hasattr(inverter, "is_using_generator"):
-            processed["binary_sensors"]["is_using_generator"] = (
-                inverter.is_using_generator
-            )
+        if (is_lost := getattr(inverter, "is_lost", None)) is not None:
+            processed["binary_sensors"]["is_lost"] = is_lost
+        if (
+            is_using_generator := getattr(inverter, "is_using_generator", None)
+        ) is not None:
+            processed["binary_sensors"]["is_using_generator"] = is_using_generator
 
         # Process battery bank aggregate data if available
         # Note: Aggregate data (soc, voltage, power) can exist even when totalNumber=0
@@ -271,7 +599,7 @@ class DeviceProcessingMixin:
                 battery_bank_sensors = self._extract_battery_bank_from_object(
                     battery_bank
                 )
-                processed["sensors"].update(battery_bank_sensors)
+                sensors.update(battery_bank_sensors)
             except Exception as e:
                 _LOGGER.warning(
                     "Error extracting battery bank data for inverter %s: %s",
@@ -279,131 +607,158 @@ class DeviceProcessingMixin:
                     e,
                 )
 
-        # Fetch quick charge status for switch entity
+        # Switch entity states fetched alongside the other inverter API calls
+        if quick_charge_status is not None:
+            processed["quick_charge_status"] = quick_charge_status
+        if battery_backup_status is not None:
+            processed["battery_backup_status"] = battery_backup_status
+
+        return processed
+
+    @staticmethod
+    def _add_feature_diagnostics(
+        sensors: dict[str, Any], features: dict[str, Any]
+    ) -> None:
+        """Copy detected feature values exposed as diagnostic sensors."""
+        for key in _DIAG_FEATURE_KEYS:
+            if (value := features.get(key)) is not None:
+                sensors[key] = value
+
+    async def _fetch_inverter_features(
+        self, inverter: "BaseInverter"
+    ) -> dict[str, Any]:
+        """Detect inverter features for capability-based sensor filtering.
+
+        Requires pylxpweb 0.4.0+; returns an empty dict when detection is
+        unavailable or fails. Features depend only on the device model and
+        firmware, so detection is cached until the firmware version changes.
+        """
+        serial = inverter.serial_number
+        firmware_version = getattr(inverter, "firmware_version", None)
+        cached = self._features_cache.get(serial)
+        if cached is not None and cached[0] == firmware_version:
+            return cached[1]
+
+        try:
+            if hasattr(inverter, "detect_features"):
+                async with self._rate_limiter:
+                    await inverter.detect_features()
+                features = self._extract_inverter_features(inverter)
+                self._features_cache[serial] = (firmware_version, features)
+                _LOGGER.debug(
+                    "Detected features for inverter %s: family=%s, split_phase=%s, "
+                    "three_phase=%s, parallel=%s",
+                    inverter.serial_number,
+                    features.get("inverter_family"),
+                    features.get("supports_split_phase"),
+                    features.get("supports_three_phase"),
+                    features.get("supports_parallel"),
+                )
+                return features
+        except Exception as e:
+            _LOGGER.debug(
+                "Could not detect features for inverter %s: %s",
+                inverter.serial_number,
+                e,
+            )
+        return {}
+
+    async def _fetch_firmware_update_info(
+        self, device: "BaseInverter"
+    ) -> dict[str, Any] | None:
+        """Check for firmware updates on an inverter or MID device.
+
+        Requires pylxpweb 0.3.7+. The progress query depends on the update
+        check, so the two calls stay sequential. Results are reused for
+        _firmware_check_interval unless the firmware version changes or an
+        update is in progress, whose percentage is polled every cycle.
+        """
+        serial = device.serial_number
+        firmware_version = getattr(device, "firmware_version", None)
+        now = dt_util.utcnow()
+        cached = self._firmware_check_cache.get(serial)
+        if cached is not None:
+            checked_at, cached_version, update_info = cached
+            if (
+                cached_version == firmware_version
+                and now - checked_at < self._firmware_check_interval
+                and not (update_info and update_info["in_progress"])
+            ):
+                return update_info
+
+        try:
+            if hasattr(device, "check_firmware_updates"):
+                async with self._rate_limiter:
+                    await device.check_firmware_updates()
+                if hasattr(device, "get_firmware_update_progress"):
+                    async with self._rate_limiter:
+                        await device.get_firmware_update_progress()
+                update_info = self._extract_firmware_update_info(device)
+                self._firmware_check_cache[serial] = (
+                    now,
+                    firmware_version,
+                    update_info,
+                )
+                return update_info
+        except Exception as e:
+            _LOGGER.debug(
+                "Could not check firmware updates for %s: %s",
+                device.serial_number,
+                e,
+            )
+        return None
+
+    async def _fetch_quick_charge_status(
+        self, inverter: "BaseInverter"
+    ) -> dict[str, Any] | None:
+        """Fetch quick charge status for the switch entity.
+
+        The payload keeps the cloud getStatusInfo field name, which the quick
+        charge switch reads alongside optional task details.
+        """
         try:
             if hasattr(inverter, "get_quick_charge_status"):
-                quick_charge_active = await inverter.get_quick_charge_status()
-                processed["quick_charge_status"] = {
-                    "hasUnclosedQuickChargeTask": quick_charge_active,
-                }
+                async with self._rate_limiter:
+                    quick_charge_active = await inverter.get_quick_charge_status()
                 _LOGGER.debug(
                     "Quick charge status for %s: %s",
                     inverter.serial_number,
                     quick_charge_active,
                 )
-        except Exception as e:
+                return {"hasUnclosedQuickChargeTask": quick_charge_active}
+        except _SWITCH_STATUS_ERRORS as e:
             _LOGGER.debug(
                 "Could not fetch quick charge status for %s: %s",
                 inverter.serial_number,
                 e,
             )
+        return None
 
-        # Fetch battery backup (EPS) status for switch entity
+    async def _fetch_battery_backup_status(
+        self, inverter: "BaseInverter"
+    ) -> dict[str, Any] | None:
+        """Fetch battery backup (EPS) status for the switch entity.
+
+        The payload is a dict so the battery backup switch can also surface
+        optional status details as attributes.
+        """
         try:
             if hasattr(inverter, "get_battery_backup_status"):
-                battery_backup_enabled = await inverter.get_battery_backup_status()
-                processed["battery_backup_status"] = {
-                    "enabled": battery_backup_enabled,
-                }
+                async with self._rate_limiter:
+                    battery_backup_enabled = await inverter.get_battery_backup_status()
                 _LOGGER.debug(
                     "Battery backup status for %s: %s",
                     inverter.serial_number,
                     battery_backup_enabled,
                 )
-        except Exception as e:
+                return {"enabled": battery_backup_enabled}
+        except _SWITCH_STATUS_ERRORS as e:
             _LOGGER.debug(
                 "Could not fetch battery backup status for %s: %s",
                 inverter.serial_number,
                 e,
             )
-
-        return processed
-
-    @staticmethod
-    def _get_inverter_property_map() -> dict[str, str]:
-        """Get inverter property mapping dictionary.
-
-        Returns:
-            Dictionary mapping inverter property names to sensor keys
-        """
-        return {
-            # Power sensors
-            "power_output": "power_output",
-            "pv_total_power": "pv_total_power",
-            "pv1_power": "pv1_power",
-            "pv2_power": "pv2_power",
-            "pv3_power": "pv3_power",
-            "battery_power": "battery_power",
-            "battery_charge_power": "battery_charge_power",
-            "battery_discharge_power": "battery_discharge_power",
-            "consumption_power": "consumption_power",
-            "inverter_power": "ac_power",
-            "rectifier_power": "rectifier_power",
-            "ac_couple_power": "ac_couple_power",
-            "generator_power": "generator_power",
-            "eps_power": "eps_power",
-            "eps_power_l1": "eps_power_l1",
-            "eps_power_l2": "eps_power_l2",
-            # Voltage sensors
-            "pv1_voltage": "pv1_voltage",
-            "pv2_voltage": "pv2_voltage",
-            "pv3_voltage": "pv3_voltage",
-            "battery_voltage": "battery_voltage",
-            "grid_voltage_r": "grid_voltage_r",
-            "grid_voltage_s": "grid_voltage_s",
-            "grid_voltage_t": "grid_voltage_t",
-            "eps_voltage_r": "eps_voltage_r",
-            "eps_voltage_s": "eps_voltage_s",
-            "eps_voltage_t": "eps_voltage_t",
-            "generator_voltage": "generator_voltage",
-            "bus1_voltage": "bus1_voltage",
-            "bus2_voltage": "bus2_voltage",
-            # Frequency sensors
-            "grid_frequency": "grid_frequency",
-            "eps_frequency": "eps_frequency",
-            "generator_frequency": "generator_frequency",
-            # Temperature sensors
-            "battery_temperature": "battery_temperature",
-            "inverter_temperature": "internal_temperature",
-            "radiator1_temperature": "radiator1_temperature",
-            "radiator2_temperature": "radiator2_temperature",
-            # Battery sensors
-            "battery_soc": "state_of_charge",
-            # Note: battery_status is extracted from BatteryBank.status in
-            # _extract_battery_bank_from_object(), not from the inverter directly
-            # Energy sensors - Generation
-            "total_energy_today": "yield",
-            "total_energy_lifetime": "yield_lifetime",
-            # Energy sensors - Grid Import/Export
-            "energy_today_import": "grid_import",
-            "energy_today_export": "grid_export",
-            "energy_lifetime_import": "grid_import_lifetime",
-            "energy_lifetime_export": "grid_export_lifetime",
-            # Energy sensors - Consumption
-            "energy_today_usage": "consumption",
-            "energy_lifetime_usage": "consumption_lifetime",
-            # Energy sensors - Battery Charging/Discharging
-            "energy_today_charging": "charging",
-            "energy_today_discharging": "discharging",
-            "energy_lifetime_charging": "charging_lifetime",
-            "energy_lifetime_discharging": "discharging_lifetime",
-            # Current sensors
-            "max_charge_current": "max_charge_current",
-            "max_discharge_current": "max_discharge_current",
-            # Grid power sensors (instantaneous)
-            "power_to_user": "grid_import_power",
-            "power_to_grid": "grid_export_power",
-            # Other sensors
-            "power_rating": "power_rating",
-            "power_rating_text": "inverter_power_rating",
-            "power_factor": "power_factor",
-            "status_text": "status_text",
-            "status": "status_code",
-            "has_data": "has_data",
-            # Diagnostic sensors from energy API
-            "is_lost": "inverter_lost_status",
-            "has_runtime_data": "inverter_has_runtime_data",
-        }
+        return None
 
     @staticmethod
     def _extract_inverter_features(inverter: "BaseInverter") -> dict[str, Any]:
@@ -427,42 +782,32 @@ class DeviceProcessingMixin:
             return features
 
         # Extract inverter family (SNA, PV_SERIES, LXP_EU, etc.)
-        if hasattr(inverter_features, "model_family"):
-            family = inverter_features.model_family
+        family = getattr(inverter_features, "model_family", _MISSING)
+        if family is _MISSING:
+            features["inverter_family"] = InverterFamily.UNKNOWN.value
+        else:
             features["inverter_family"] = (
                 family.value if isinstance(family, InverterFamily) else str(family)
             )
-        else:
-            features["inverter_family"] = InverterFamily.UNKNOWN.value
 
         # Extract grid type
-        if hasattr(inverter_features, "grid_type"):
-            features["grid_type"] = str(inverter_features.grid_type.value)
+        grid_type = getattr(inverter_features, "grid_type", _MISSING)
+        if grid_type is not _MISSING:
+            features["grid_type"] = str(grid_type.value)
 
         # Extract device type code for debugging
-        if hasattr(inverter_features, "device_type_code"):
-            features["device_type_code"] = inverter_features.device_type_code
-
-        # Extract boolean capability flags using supports_* properties
-        # Maps feature key to InverterFeatures attribute name
-        # Some attributes don't follow simple "supports_X" -> "X" pattern
-        capability_mapping: dict[str, str] = {
-            "supports_split_phase": "split_phase",
-            "supports_three_phase": "three_phase_capable",
-            "supports_off_grid": "off_grid_capable",
-            "supports_parallel": "parallel_support",
-            "supports_volt_watt_curve": "volt_watt_curve",
-            "supports_grid_peak_shaving": "grid_peak_shaving",
-            "supports_drms": "drms_support",
-            "supports_discharge_recovery_hysteresis": "discharge_recovery_hysteresis",
-        }
-
-        for prop, attr_name in capability_mapping.items():
-            if hasattr(inverter, prop):
-                features[prop] = getattr(inverter, prop, False)
-            elif hasattr(inverter_features, attr_name):
-                # Fallback to features object attribute using correct mapping
-                features[prop] = getattr(inverter_features, attr_name, False)
+        device_type_code = getattr(inverter_features, "device_type_code", _MISSING)
+        if device_type_code is not _MISSING:
+            features["device_type_code"] = device_type_code
+
+        # Extract boolean capability flags using supports_* properties,
+        # falling back to the features object attribute
+        for prop, attr_name in _CAPABILITY_ITEMS:
+            value = getattr(inverter, prop, _MISSING)
+            if value is _MISSING:
+                value = getattr(inverter_features, attr_name, _MISSING)
+            if value is not _MISSING:
+                features[prop] = value
 
         return features
 
@@ -475,59 +820,47 @@ class DeviceProcessingMixin:
         Returns:
             Dictionary of sensor_key -> value mappings
         """
-        property_map = self._get_battery_property_map()
-        sensors = _map_device_properties(battery, property_map)
+        sensors = _map_device_properties(battery, _BATTERY_PROPERTY_ITEMS)
         self._calculate_battery_derived_sensors(sensors)
         return sensors
 
-    @staticmethod
-    def _get_battery_property_map() -> dict[str, str]:
-        """Get battery property mapping dictionary.
+    def _extract_batteries_batch(
+        self, batteries: "Sequence[Battery]", parent_serial: str
+    ) -> dict[str, dict[str, Any]]:
+        """Extract sensor data for every battery in an inverter's battery bank.
+
+        A battery that fails to extract is logged and skipped so the rest are
+        still reported.
+
+        Args:
+            batteries: Battery objects from the inverter's battery bank
+            parent_serial: Serial number of the inverter owning the batteries
 
         Returns:
-            Dictionary mapping battery property names to sensor keys
+            Dictionary of cleaned battery key -> sensor data
         """
-        return {
-            # Core battery metrics
-            "voltage": "battery_real_voltage",
-            "current": "battery_real_current",
-            "power": "battery_real_power",
-            "soc": "battery_rsoc",
-            "soh": "state_of_health",
-            # Temperature sensors
-            "mos_temp": "battery_mos_temperature",
-            "ambient_temp": "battery_ambient_temperature",
-            "max_cell_temp": "battery_max_cell_temp",
-            "min_cell_temp": "battery_min_cell_temp",
-            "max_cell_temp_num": "battery_max_cell_temp_num",
-            "min_cell_temp_num": "battery_min_cell_temp_num",
-            # Cell voltage sensors
-            "max_cell_voltage": "battery_max_cell_voltage",
-            "min_cell_voltage": "battery_min_cell_voltage",
-            "max_cell_voltage_num": "battery_max_cell_voltage_num",
-            "min_cell_voltage_num": "battery_min_cell_voltage_num",
-            "cell_voltage_delta": "battery_cell_voltage_delta",
-            "cell_temp_delta": "battery_cell_temp_delta",
-            # Capacity sensors
-            "current_remain_capacity": "battery_remaining_capacity",
-            "current_full_capacity": "battery_full_capacity",
-            "charge_capacity": "battery_design_capacity",
-            "discharge_capacity": "battery_discharge_capacity",
-            "capacity_percent": "battery_capacity_percentage",
-            # Current limits
-            "charge_max_current": "battery_max_charge_current",
-            "charge_voltage_ref": "battery_charge_voltage_ref",
-            # Lifecycle
-            "cycle_count": "cycle_count",
-            "firmware_version": "battery_firmware_version",
-            # Metadata
-            "battery_sn": "battery_serial_number",
-            "battery_type": "battery_type",
-            "battery_type_text": "battery_type_text",
-            "bms_model": "battery_bms_model",
-            "model": "battery_model",
-            "battery_index": "battery_index",
-        }
+        extracted: dict[str, dict[str, Any]] = {}
+        for battery in batteries:
+            try:
+                # Only build the fallback key when battery_key is missing
+                try:
+                    raw_battery_key = battery.battery_key
+                except AttributeError:
+                    raw_battery_key = f"BAT{battery.battery_index:03d}"
+                battery_key = clean_battery_display_name(raw_battery_key, parent_serial)
+                sensors = _map_device_properties(battery, _BATTERY_PROPERTY_ITEMS)
+                self._calculate_battery_derived_sensors(sensors)
+            except Exception as e:
+                _LOGGER.error(
+                    "Error processing battery %s for inverter %s: %s",
+                    getattr(battery, "battery_sn", "unknown"),
+                    parent_serial,
+                    e,
+                )
+                continue
+            extracted[battery_key] = sensors
+
+        return extracted
 
     @staticmethod
     def _calculate_battery_derived_sensors(sensors: dict[str, Any]) -> None:
@@ -538,31 +871,23 @@ class DeviceProcessingMixin:
         Args:
             sensors: Dictionary of sensor values to modify
         """
+        # Mapped sensors never hold None, so a single get() per input replaces
+        # the membership test plus subscript
         # Calculate cell voltage difference only if not provided by library
-        if (
-            "battery_cell_voltage_diff" not in sensors
-            and "battery_cell_voltage_max" in sensors
-            and "battery_cell_voltage_min" in sensors
-        ):
-            sensors["battery_cell_voltage_diff"] = round(
-                sensors["battery_cell_voltage_max"]
-                - sensors["battery_cell_voltage_min"],
-                3,
-            )
+        if "battery_cell_voltage_diff" not in sensors:
+            cell_max = sensors.get("battery_cell_voltage_max")
+            cell_min = sensors.get("battery_cell_voltage_min")
+            if cell_max is not None and cell_min is not None:
+                sensors["battery_cell_voltage_diff"] = round(cell_max - cell_min, 3)
 
         # Calculate capacity percentage only if not provided by library
-        if (
-            "battery_capacity_percentage" not in sensors
-            and "battery_remaining_capacity" in sensors
-            and "battery_full_capacity" in sensors
-            and sensors["battery_full_capacity"] > 0
-        ):
-            sensors["battery_capacity_percentage"] = round(
-                sensors["battery_remaining_capacity"]
-                / sensors["battery_full_capacity"]
-                * 100,
-                1,
-            )
+        if "battery_capacity_percentage" not in sensors:
+            remaining = sensors.get("battery_remaining_capacity")
+            full = sensors.get("battery_full_capacity")
+            if remaining is not None and full is not None and full > 0:
+                sensors["battery_capacity_percentage"] = round(
+                    remaining / full * 100, 1
+                )
 
     def _extract_battery_bank_from_object(self, battery_bank: Any) -> dict[str, Any]:
         """Extract sensor data from BatteryBank object using properties.
@@ -573,8 +898,7 @@ class DeviceProcessingMixin:
         Returns:
             Dictionary of sensor_key -> value mappings
         """
-        property_map = self._get_battery_bank_property_map()
-        sensors = _map_device_properties(battery_bank, property_map)
+        sensors = _map_device_properties(battery_bank, _BATTERY_BANK_PROPERTY_ITEMS)
 
         # Add battery_status as alias for battery_bank_status for backwards compatibility
         # In v2.2.x, the batStatus field was mapped to battery_status at the inverter level
@@ -584,31 +908,6 @@ class DeviceProcessingMixin:
 
         return sensors
 
-    @staticmethod
-    def _get_battery_bank_property_map() -> dict[str, str]:
-        """Get battery bank property mapping dictionary.
-
-        Returns:
-            Dictionary mapping battery bank property names to sensor keys
-        """
-        return {
-            # Core metrics
-            "voltage": "battery_bank_voltage",
-            "soc": "battery_bank_soc",
-            "charge_power": "battery_bank_charge_power",
-            "discharge_power": "battery_bank_discharge_power",
-            "battery_power": "battery_bank_power",
-            # Capacity metrics
-            "max_capacity": "battery_bank_max_capacity",
-            "current_capacity": "battery_bank_current_capacity",
-            "remain_capacity": "battery_bank_remain_capacity",
-            "full_capacity": "battery_bank_full_capacity",
-            "capacity_percent": "battery_bank_capacity_percent",
-            # Status and metadata
-            "battery_count": "battery_bank_count",
-            "status": "battery_bank_status",
-        }
-
     async def _process_parallel_group_object(self, group: Any) -> dict[str, Any]:
         """Process parallel group data from group object using properties.
 
@@ -628,44 +927,12 @@ class DeviceProcessingMixin:
             "binary_sensors": {},
         }
 
-        property_map = self._get_parallel_group_property_map()
-        processed["sensors"] = _map_device_properties(group, property_map)
+        processed["sensors"] = _map_device_properties(
+            group, _PARALLEL_GROUP_PROPERTY_ITEMS
+        )
 
         return processed
 
-    @staticmethod
-    def _get_parallel_group_property_map() -> dict[str, str]:
-        """Get parallel group property mapping dictionary.
-
-        Returns:
-            Dictionary mapping parallel group property names to sensor keys
-        """
-        return {
-            # Today energy values
-            "today_yielding": "yield",
-            "today_discharging": "discharging",
-            "today_charging": "charging",
-            "today_export": "grid_export",
-            "today_import": "grid_import",
-            "today_usage": "consumption",
-            # Lifetime energy values
-            "total_yielding": "yield_lifetime",
-            "total_discharging": "discharging_lifetime",
-            "total_charging": "charging_lifetime",
-            "total_export": "grid_export_lifetime",
-            "total_import": "grid_import_lifetime",
-            "total_usage": "consumption_lifetime",
-            # Aggregate battery properties (calculated from all inverters)
-            "battery_charge_power": "parallel_battery_charge_power",
-            "battery_discharge_power": "parallel_battery_discharge_power",
-            "battery_power": "parallel_battery_power",
-            "battery_soc": "parallel_battery_soc",
-            "battery_max_capacity": "parallel_battery_max_capacity",
-            "battery_current_capacity": "parallel_battery_current_capacity",
-            "battery_voltage": "parallel_battery_voltage",
-            "battery_count": "parallel_battery_count",
-        }
-
     async def _process_mid_device_object(self, mid_device: Any) -> dict[str, Any]:
         """Process GridBOSS/MID device data from device object using properties.
 
@@ -675,24 +942,13 @@ class DeviceProcessingMixin:
         Returns:
             Processed device data dictionary with sensors and binary_sensors
         """
-        await mid_device.refresh()
+        async with self._rate_limiter:
+            await mid_device.refresh()
 
         model = getattr(mid_device, "model", "GridBOSS")
         firmware_version = getattr(mid_device, "firmware_version", "1.0.0")
 
-        firmware_update_info = None
-        try:
-            if hasattr(mid_device, "check_firmware_updates"):
-                await mid_device.check_firmware_updates()
-                if hasattr(mid_device, "get_firmware_update_progress"):
-                    await mid_device.get_firmware_update_progress()
-                firmware_update_info = self._extract_firmware_update_info(mid_device)
-        except Exception as e:
-            _LOGGER.debug(
-                "Could not check firmware updates for %s: %s",
-                mid_device.serial_number,
-                e,
-            )
+        firmware_update_info = await self._fetch_firmware_update_info(mid_device)
 
         processed: dict[str, Any] = {
             "serial": mid_device.serial_number,
@@ -705,118 +961,16 @@ class DeviceProcessingMixin:
         }
 
         if mid_device.has_data:
-            property_map = self._get_mid_device_property_map()
-            processed["sensors"] = _map_device_properties(mid_device, property_map)
-            processed["sensors"]["firmware_version"] = firmware_version
-            self._filter_unused_smart_port_sensors(processed["sensors"], mid_device)
-            self._calculate_gridboss_aggregates(processed["sensors"])
+            sensors = _map_device_properties(mid_device, _MID_DEVICE_PROPERTY_ITEMS)
+            sensors["firmware_version"] = firmware_version
+            self._filter_unused_smart_port_sensors(sensors, mid_device)
+            self._calculate_gridboss_aggregates(sensors)
+            processed["sensors"] = sensors
         else:
             _LOGGER.warning("MID device %s has no data", mid_device.serial_number)
 
         return processed
 
-    @staticmethod
-    def _get_mid_device_property_map() -> dict[str, str]:
-        """Get MID device property mapping dictionary.
-
-        Returns:
-            Dictionary mapping MID device property names to sensor keys
-        """
-        return {
-            # Grid sensors
-            "grid_power": "grid_power",
-            "grid_voltage": "grid_voltage",
-            "grid_frequency": "frequency",
-            "grid_l1_power": "grid_power_l1",
-            "grid_l2_power": "grid_power_l2",
-            "grid_l1_voltage": "grid_voltage_l1",
-            "grid_l2_voltage": "grid_voltage_l2",
-            "grid_l1_current": "grid_current_l1",
-            "grid_l2_current": "grid_current_l2",
-            # UPS sensors
-            "ups_power": "ups_power",
-            "ups_voltage": "ups_voltage",
-            "ups_l1_power": "ups_power_l1",
-            "ups_l2_power": "ups_power_l2",
-            "ups_l1_voltage": "load_voltage_l1",
-            "ups_l2_voltage": "load_voltage_l2",
-            "ups_l1_current": "ups_current_l1",
-            "ups_l2_current": "ups_current_l2",
-            # Load sensors
-            "load_power": "load_power",
-            "load_l1_power": "load_power_l1",
-            "load_l2_power": "load_power_l2",
-            "load_l1_current": "load_current_l1",
-            "load_l2_current": "load_current_l2",
-            # Generator sensors
-            "generator_power": "generator_power",
-            "generator_voltage": "generator_voltage",
-            "generator_l1_power": "generator_power_l1",
-            "generator_l2_power": "generator_power_l2",
-            "generator_l1_voltage": "generator_voltage_l1",
-            "generator_l2_voltage": "generator_voltage_l2",
-            "generator_l1_current": "generator_current_l1",
-            "generator_l2_current": "generator_current_l2",
-            # Other sensors
-            "hybrid_power": "hybrid_power",
-            "phase_lock_frequency": "phase_lock_frequency",
-            "is_off_grid": "off_grid",
-            "smart_port1_status": "smart_port1_status",
-            "smart_port2_status": "smart_port2_status",
-            "smart_port3_status": "smart_port3_status",
-            "smart_port4_status": "smart_port4_status",
-            # Smart Load Power sensors (runtime data - L1/L2 have valid data)
-            # Property names match MIDRuntimePropertiesMixin in pylxpweb 0.5.5+
-            "smart_load1_l1_power": "smart_load1_power_l1",
-            "smart_load1_l2_power": "smart_load1_power_l2",
-            "smart_load2_l1_power": "smart_load2_power_l1",
-            "smart_load2_l2_power": "smart_load2_power_l2",
-            "smart_load3_l1_power": "smart_load3_power_l1",
-            "smart_load3_l2_power": "smart_load3_power_l2",
-            "smart_load4_l1_power": "smart_load4_power_l1",
-            "smart_load4_l2_power": "smart_load4_power_l2",
-            # AC Couple Power sensors (runtime data - L1/L2 have valid data)
-            # Property names match MIDRuntimePropertiesMixin in pylxpweb 0.5.5+
-            "ac_couple1_l1_power": "ac_couple1_power_l1",
-            "ac_couple1_l2_power": "ac_couple1_power_l2",
-            "ac_couple2_l1_power": "ac_couple2_power_l1",
-            "ac_couple2_l2_power": "ac_couple2_power_l2",
-            "ac_couple3_l1_power": "ac_couple3_power_l1",
-            "ac_couple3_l2_power": "ac_couple3_power_l2",
-            "ac_couple4_l1_power": "ac_couple4_power_l1",
-            "ac_couple4_l2_power": "ac_couple4_power_l2",
-            # Energy sensors - aggregate only (L2 energy registers always read 0)
-            # UPS energy
-            "e_ups_today": "ups_today",
-            "e_ups_total": "ups_total",
-            # Grid energy
-            "e_to_grid_today": "grid_export_today",
-            "e_to_grid_total": "grid_export_total",
-            "e_to_user_today": "grid_import_today",
-            "e_to_user_total": "grid_import_total",
-            # Load energy
-            "e_load_today": "load_today",
-            "e_load_total": "load_total",
-            # AC Couple energy (all 4 ports)
-            "e_ac_couple1_today": "ac_couple1_today",
-            "e_ac_couple1_total": "ac_couple1_total",
-            "e_ac_couple2_today": "ac_couple2_today",
-            "e_ac_couple2_total": "ac_couple2_total",
-            "e_ac_couple3_today": "ac_couple3_today",
-            "e_ac_couple3_total": "ac_couple3_total",
-            "e_ac_couple4_today": "ac_couple4_today",
-            "e_ac_couple4_total": "ac_couple4_total",
-            # Smart Load energy (all 4 ports)
-            "e_smart_load1_today": "smart_load1_today",
-            "e_smart_load1_total": "smart_load1_total",
-            "e_smart_load2_today": "smart_load2_today",
-            "e_smart_load2_total": "smart_load2_total",
-            "e_smart_load3_today": "smart_load3_today",
-            "e_smart_load3_total": "smart_load3_total",
-            "e_smart_load4_today": "smart_load4_today",
-            "e_smart_load4_total": "smart_load4_total",
-        }
-
     @staticmethod
     def _filter_unused_smart_port_sensors(
         sensors: dict[str, Any], mid_device: Any
@@ -989,11 +1143,11 @@ class DeviceInfoMixin:
         if device_type != "parallel_group":
             device_info["serial_number"] = serial
             sw_version = "1.0.0"
-            if device_type in ["gridboss", "inverter"]:
+            if device_type in FIRMWARE_DEVICE_TYPES:
                 sw_version = device_data.get("firmware_version", "1.0.0")
             device_info["sw_version"] = sw_version
 
-        if device_type in ["inverter", "gridboss"]:
+        if device_type in FIRMWARE_DEVICE_TYPES:
             parallel_group_serial = self._get_parallel_group_for_device(serial)
             if parallel_group_serial:
                 device_info["via_device"] = (DOMAIN, parallel_group_serial)
@@ -1280,12 +1434,12 @@ class ParameterManagementMixin:
         except Exception as e:
             _LOGGER.error("Error during hourly parameter refresh: %s", e)
 
-    def _should_refresh_parameters(self) -> bool:
-        """Check if hourly parameter refresh is due."""
+    def _should_refresh_parameters(self, now: datetime) -> bool:
+        """Check if hourly parameter refresh is due as of the given time."""
         if self._last_parameter_refresh is None:
             return True
 
-        time_since_refresh = dt_util.utcnow() - self._last_parameter_refresh
+        time_since_refresh = now - self._last_parameter_refresh
         return bool(time_since_refresh >= self._parameter_refresh_interval)
 
 
@@ -1296,13 +1450,11 @@ class DSTSyncMixin:
     _last_dst_sync: datetime | None
     _dst_sync_interval: timedelta
 
-    def _should_sync_dst(self) -> bool:
-        """Check if DST sync is due.
+    def _should_sync_dst(self, now: datetime) -> bool:
+        """Check if DST sync is due as of the given time.
 
         Performs DST sync one minute before the top of each hour.
         """
-        now = dt_util.utcnow()
-
         minutes_to_hour = 60 - now.minute
         is_near_hour = minutes_to_hour <= 1
 
@@ -1370,13 +1522,7 @@ class BackgroundTaskMixin:
             await asyncio.sleep(0)
             _LOGGER.debug("Cancelled debounced refresh")
 
-        for task in self._background_tasks:
-            if not task.done():
-                task.cancel()
-
-        if self._background_tasks:
-            await asyncio.gather(*self._background_tasks, return_exceptions=True)
-            self._background_tasks.clear()
+        await self._cancel_background_tasks()
 
         _LOGGER.debug("All background tasks cancelled and cleaned up")
 
@@ -1386,15 +1532,57 @@ class BackgroundTaskMixin:
             self._shutdown_listener_remove()
             _LOGGER.debug("Removed homeassistant_stop event listener")
 
-        for task in self._background_tasks:
+        await self._cancel_background_tasks()
+
+        _LOGGER.debug("Coordinator shutdown complete, all background tasks cleaned up")
+
+    def _create_background_task(
+        self, target: "Coroutine[Any, Any, Any]", name: str
+    ) -> None:
+        """Start a tracked background task bound to the config entry.
+
+        Background tasks do not hold up Home Assistant startup or shutdown,
+        are cancelled when the entry unloads, and with eager_start run
+        synchronously until their first suspension point.
+        """
+        task = self.entry.async_create_background_task(
+            self.hass, target, name=name, eager_start=True
+        )
+        if task.done():
+            # Eagerly started and already finished; nothing left to track
+            self._log_task_exception(task)
+            return
+
+        if len(self._background_tasks) >= _MAX_BACKGROUND_TASKS:
+            self._prune_background_tasks()
+
+        self._background_tasks.add(task)
+        task.add_done_callback(self._remove_task_from_set)
+        task.add_done_callback(self._log_task_exception)
+
+    async def _cancel_background_tasks(self) -> None:
+        """Cancel all pending background tasks and wait for them to finish."""
+        # Snapshot first: done callbacks discard tasks from the set
+        tasks = list(self._background_tasks)
+        if not tasks:
+            return
+
+        for task in tasks:
             if not task.done():
                 task.cancel()
 
-        if self._background_tasks:
-            await asyncio.gather(*self._background_tasks, return_exceptions=True)
-            self._background_tasks.clear()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._background_tasks.clear()
 
-        _LOGGER.debug("Coordinator shutdown complete, all background tasks cleaned up")
+    def _prune_background_tasks(self) -> None:
+        """Drop finished tasks whose removal callback never ran."""
+        pending = {task for task in self._background_tasks if not task.done()}
+        _LOGGER.warning(
+            "Background task set reached %d entries, pruned %d finished tasks",
+            len(self._background_tasks),
+            len(self._background_tasks) - len(pending),
+        )
+        self._background_tasks = pending
 
     def _remove_task_from_set(self, task: asyncio.Task[Any]) -> None:
         """Remove completed task from background tasks set."""
@@ -18,24 +18,12 @@ else:
 from . import EG4ConfigEntry
 from .base_entity import EG4BaseNumber, optimistic_value_context
 from .const import (
-    AC_CHARGE_POWER_MAX,
-    AC_CHARGE_POWER_MIN,
-    AC_CHARGE_POWER_STEP,
-    BATTERY_CURRENT_MAX,
-    BATTERY_CURRENT_MIN,
-    BATTERY_CURRENT_STEP,
-    GRID_PEAK_SHAVING_POWER_MAX,
-    GRID_PEAK_SHAVING_POWER_MIN,
-    GRID_PEAK_SHAVING_POWER_STEP,
-    PV_CHARGE_POWER_MAX,
-    PV_CHARGE_POWER_MIN,
-    PV_CHARGE_POWER_STEP,
-    SOC_LIMIT_MAX,
-    SOC_LIMIT_MIN,
-    SOC_LIMIT_STEP,
-    SYSTEM_CHARGE_SOC_LIMIT_MAX,
-    SYSTEM_CHARGE_SOC_LIMIT_MIN,
-    SYSTEM_CHARGE_SOC_LIMIT_STEP,
+    AC_CHARGE_POWER,
+    BATTERY_CURRENT,
+    GRID_PEAK_SHAVING_POWER,
+    PV_CHARGE_POWER,
+    SOC_LIMIT,
+    SYSTEM_CHARGE_SOC_LIMIT,
 )
 from .coordinator import EG4DataUpdateCoordinator
 
@@ -186,9 +174,9 @@ class SystemChargeSOCLimitNumber(EG4BaseNumberEntity):
         )
 
         # Number configuration for SOC limit (10-101%) - integer only
-        self._attr_native_min_value = SYSTEM_CHARGE_SOC_LIMIT_MIN
-        self._attr_native_max_value = SYSTEM_CHARGE_SOC_LIMIT_MAX
-        self._attr_native_step = SYSTEM_CHARGE_SOC_LIMIT_STEP
+        self._attr_native_min_value = SYSTEM_CHARGE_SOC_LIMIT.min
+        self._attr_native_max_value = SYSTEM_CHARGE_SOC_LIMIT.max
+        self._attr_native_step = SYSTEM_CHARGE_SOC_LIMIT.step
         self._attr_native_unit_of_measurement = "%"
         self._attr_icon = "mdi:battery-charging"
         self._attr_native_precision = 0
@@ -301,9 +289,9 @@ class ACChargePowerNumber(EG4BaseNumberEntity):
 
         # Number configuration for AC Charge Power (0-15 kW)
         # Supports decimal values (0.1 kW step) to match EG4 web interface
-        self._attr_native_min_value = AC_CHARGE_POWER_MIN
-        self._attr_native_max_value = AC_CHARGE_POWER_MAX
-        self._attr_native_step = AC_CHARGE_POWER_STEP
+        self._attr_native_min_value = AC_CHARGE_POWER.min
+        self._attr_native_max_value = AC_CHARGE_POWER.max
+        self._attr_native_step = AC_CHARGE_POWER.step
         self._attr_native_unit_of_measurement = "kW"
         self._attr_icon = "mdi:battery-charging-medium"
         self._attr_native_precision = 1
@@ -378,9 +366,9 @@ class PVChargePowerNumber(EG4BaseNumberEntity):
         self._attr_unique_id = f"{self._clean_model}_{serial.lower()}_pv_charge_power"
 
         # Number configuration for PV Charge Power (0-15 kW)
-        self._attr_native_min_value = PV_CHARGE_POWER_MIN
-        self._attr_native_max_value = PV_CHARGE_POWER_MAX
-        self._attr_native_step = PV_CHARGE_POWER_STEP
+        self._attr_native_min_value = PV_CHARGE_POWER.min
+        self._attr_native_max_value = PV_CHARGE_POWER.max
+        self._attr_native_step = PV_CHARGE_POWER.step
         self._attr_native_unit_of_measurement = "kW"
         self._attr_icon = "mdi:solar-power"
         self._attr_native_precision = 0
@@ -463,9 +451,9 @@ class GridPeakShavingPowerNumber(EG4BaseNumberEntity):
         )
 
         # Number configuration for Grid Peak Shaving Power (0.0-25.5 kW)
-        self._attr_native_min_value = GRID_PEAK_SHAVING_POWER_MIN
-        self._attr_native_max_value = GRID_PEAK_SHAVING_POWER_MAX
-        self._attr_native_step = GRID_PEAK_SHAVING_POWER_STEP
+        self._attr_native_min_value = GRID_PEAK_SHAVING_POWER.min
+        self._attr_native_max_value = GRID_PEAK_SHAVING_POWER.max
+        self._attr_native_step = GRID_PEAK_SHAVING_POWER.step
         self._attr_native_unit_of_measurement = "kW"
         self._attr_icon = "mdi:chart-bell-curve-cumulative"
         self._attr_native_precision = 1
@@ -546,9 +534,9 @@ class ACChargeSOCLimitNumber(EG4BaseNumberEntity):
         )
 
         # Number configuration for AC Charge SOC Limit (0-100%)
-        self._attr_native_min_value = SOC_LIMIT_MIN
-        self._attr_native_max_value = SOC_LIMIT_MAX
-        self._attr_native_step = SOC_LIMIT_STEP
+        self._attr_native_min_value = SOC_LIMIT.min
+        self._attr_native_max_value = SOC_LIMIT.max
+        self._attr_native_step = SOC_LIMIT.step
         self._attr_native_unit_of_measurement = "%"
         self._attr_icon = "mdi:battery-charging-medium"
         self._attr_native_precision = 0
@@ -635,9 +623,9 @@ class OnGridSOCCutoffNumber(EG4BaseNumberEntity):
         )
 
         # Number configuration for On-Grid SOC Cut-Off (0-100%)
-        self._attr_native_min_value = SOC_LIMIT_MIN
-        self._attr_native_max_value = SOC_LIMIT_MAX
-        self._attr_native_step = SOC_LIMIT_STEP
+        self._attr_native_min_value = SOC_LIMIT.min
+        self._attr_native_max_value = SOC_LIMIT.max
+        self._attr_native_step = SOC_LIMIT.step
         self._attr_native_unit_of_measurement = "%"
         self._attr_icon = "mdi:battery-alert"
         self._attr_native_precision = 0
@@ -726,9 +714,9 @@ class OffGridSOCCutoffNumber(EG4BaseNumberEntity):
         )
 
         # Number configuration for Off-Grid SOC Cut-Off (0-100%)
-        self._attr_native_min_value = SOC_LIMIT_MIN
-        self._attr_native_max_value = SOC_LIMIT_MAX
-        self._attr_native_step = SOC_LIMIT_STEP
+        self._attr_native_min_value = SOC_LIMIT.min
+        self._attr_native_max_value = SOC_LIMIT.max
+        self._attr_native_step = SOC_LIMIT.step
         self._attr_native_unit_of_measurement = "%"
         self._attr_icon = "mdi:battery-outline"
         self._attr_native_precision = 0
@@ -819,9 +807,9 @@ class BatteryChargeCurrentNumber(EG4BaseNumberEntity):
         )
 
         # Number configuration for Battery Charge Current (0-250 A)
-        self._attr_native_min_value = BATTERY_CURRENT_MIN
-        self._attr_native_max_value = BATTERY_CURRENT_MAX
-        self._attr_native_step = BATTERY_CURRENT_STEP
+        self._attr_native_min_value = BATTERY_CURRENT.min
+        self._attr_native_max_value = BATTERY_CURRENT.max
+        self._attr_native_step = BATTERY_CURRENT.step
         self._attr_native_unit_of_measurement = "A"
         self._attr_icon = "mdi:battery-plus"
         self._attr_native_precision = 0
@@ -908,9 +896,9 @@ class BatteryDischargeCurrentNumber(EG4BaseNumberEntity):
         )
 
         # Number configuration for Battery Discharge Current (0-250 A)
-        self._attr_native_min_value = BATTERY_CURRENT_MIN
-        self._attr_native_max_value = BATTERY_CURRENT_MAX
-        self._attr_native_step = BATTERY_CURRENT_STEP
+        self._attr_native_min_value = BATTERY_CURRENT.min
+        self._attr_native_max_value = BATTERY_CURRENT.max
+        self._attr_native_step = BATTERY_CURRENT.step
         self._attr_native_unit_of_measurement = "A"
         self._attr_icon = "mdi:battery-minus"
         self._attr_native_precision = 0
@@ -3,8 +3,6 @@
 import logging
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -21,53 +19,36 @@ from .base_entity import (
     EG4StationEntity,
 )
 from .const import (
-    DISCHARGE_RECOVERY_SENSORS,
+    ALL_SENSOR_FEATURES,
+    SENSOR_KEYS_BY_FEATURE,
     SENSOR_TYPES,
-    SPLIT_PHASE_ONLY_SENSORS,
     STATION_SENSOR_TYPES,
-    THREE_PHASE_ONLY_SENSORS,
-    VOLT_WATT_SENSORS,
+    sensor_types_for,
 )
 from .coordinator import EG4DataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _should_create_sensor(sensor_key: str, features: dict[str, Any] | None) -> bool:
-    """Determine if a sensor should be created based on device features.
+def _supported_sensor_features(features: dict[str, Any] | None) -> frozenset[str]:
+    """Determine which feature-gated sensor groups a device supports.
 
     This function implements feature-based sensor filtering to avoid creating
     sensors for capabilities that the inverter doesn't support.
 
     Args:
-        sensor_key: The sensor key to check
         features: Device features dictionary from feature detection, or None
 
     Returns:
-        True if the sensor should be created, False if it should be skipped
+        Frozenset of feature flags whose sensors should be created
     """
     # If no features detected, create all sensors (conservative fallback)
     if not features:
-        return True
+        return ALL_SENSOR_FEATURES
 
-    # Check split-phase sensors (only for SNA series)
-    if sensor_key in SPLIT_PHASE_ONLY_SENSORS:
-        return bool(features.get("supports_split_phase", True))
-
-    # Check three-phase sensors (only for PV Series, LXP-EU)
-    if sensor_key in THREE_PHASE_ONLY_SENSORS:
-        return bool(features.get("supports_three_phase", True))
-
-    # Check discharge recovery sensors (only for SNA series)
-    if sensor_key in DISCHARGE_RECOVERY_SENSORS:
-        return bool(features.get("supports_discharge_recovery_hysteresis", True))
-
-    # Check Volt-Watt sensors (only for PV Series, LXP-EU)
-    if sensor_key in VOLT_WATT_SENSORS:
-        return bool(features.get("supports_volt_watt_curve", True))
-
-    # Default: create the sensor
-    return True
+    return frozenset(
+        feature for feature in SENSOR_KEYS_BY_FEATURE if features.get(feature, True)
+    )
 
 
 # Silver tier requirement: Specify parallel update count
@@ -193,8 +174,10 @@ def _create_inverter_sensors(
     # Phase 2: Individual battery sensors (reference battery bank via via_device)
     battery_entities: list[SensorEntity] = []
 
-    # Get device features for capability-based filtering
-    features = device_data.get("features")
+    # Get the sensor table for this device based on capability-based filtering
+    sensor_types = sensor_types_for(
+        _supported_sensor_features(device_data.get("features"))
+    )
     skipped_sensors: list[str] = []
 
     # Create main inverter sensors (excluding battery_bank sensors)
@@ -203,7 +186,7 @@ def _create_inverter_sensors(
             # Skip battery_bank sensors - they'll be created separately
             if not sensor_key.startswith("battery_bank_"):
                 # Check if sensor should be created based on device features
-                if _should_create_sensor(sensor_key, features):
+                if sensor_key in sensor_types:
                     inverter_entities.append(
                         EG4InverterSensor(
                             coordinator=coordinator,
@@ -416,15 +399,12 @@ class EG4StationSensor(EG4StationEntity, SensorEntity):
 
         # Get sensor configuration
         sensor_config = STATION_SENSOR_TYPES[sensor_key]
-        self._attr_name = sensor_config["name"]
-        self._attr_icon = sensor_config.get("icon")
-        entity_category = sensor_config.get("entity_category")
-        if entity_category:
-            self._attr_entity_category = EntityCategory(entity_category)
-
-        device_class = sensor_config.get("device_class")
-        if device_class:
-            self._attr_device_class = SensorDeviceClass(device_class)
+        self._attr_name = sensor_config.name
+        self._attr_icon = sensor_config.icon
+        if sensor_config.entity_category:
+            self._attr_entity_category = sensor_config.entity_category
+        if sensor_config.device_class:
+            self._attr_device_class = sensor_config.device_class
 
         # Build unique ID
         self._attr_unique_id = f"station_{coordinator.plant_id}_{sensor_key}"
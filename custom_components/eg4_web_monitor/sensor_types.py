@@ -0,0 +1,863 @@
+"""Sensor type definitions for EG4 Web Monitor integration.
+
+Kept out of const.py and imported on first access to const.SENSOR_TYPES, so
+the integration only pays for this table once the sensor metadata is used.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfEnergy,
+    UnitOfFrequency,
+    UnitOfPower,
+    UnitOfTemperature,
+)
+
+from .const import SensorSpec
+
+# Unit members bound once, so the sensor tables skip repeated enum lookups
+_W = UnitOfPower.WATT
+_V = UnitOfElectricPotential.VOLT
+_A = UnitOfElectricCurrent.AMPERE
+_C = UnitOfTemperature.CELSIUS
+_HZ = UnitOfFrequency.HERTZ
+_KWH = UnitOfEnergy.KILO_WATT_HOUR
+
+# Shared sensor profiles, spread into SensorSpec for families of sensors
+_VOLTAGE: Mapping[str, Any] = MappingProxyType(
+    {
+        "unit": _V,
+        "device_class": SensorDeviceClass.VOLTAGE,
+        "state_class": SensorStateClass.MEASUREMENT,
+    }
+)
+_POWER: Mapping[str, Any] = MappingProxyType(
+    {
+        "unit": _W,
+        "device_class": SensorDeviceClass.POWER,
+        "state_class": SensorStateClass.MEASUREMENT,
+    }
+)
+_CURRENT: Mapping[str, Any] = MappingProxyType(
+    {
+        "unit": _A,
+        "device_class": SensorDeviceClass.CURRENT,
+        "state_class": SensorStateClass.MEASUREMENT,
+    }
+)
+_ENERGY_TOTAL: Mapping[str, Any] = MappingProxyType(
+    {
+        "unit": _KWH,
+        "device_class": SensorDeviceClass.ENERGY,
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+    }
+)
+_TEMPERATURE: Mapping[str, Any] = MappingProxyType(
+    {
+        "unit": _C,
+        "device_class": SensorDeviceClass.TEMPERATURE,
+        "state_class": SensorStateClass.MEASUREMENT,
+    }
+)
+_FREQUENCY: Mapping[str, Any] = MappingProxyType(
+    {
+        "unit": _HZ,
+        "device_class": SensorDeviceClass.FREQUENCY,
+        "state_class": SensorStateClass.MEASUREMENT,
+    }
+)
+
+# Icons shared by many sensors, bound once so every spec references one object
+_ICON_BATTERY = "mdi:battery"
+_ICON_BATTERY_CHARGING = "mdi:battery-charging"
+_ICON_BATTERY_MINUS = "mdi:battery-minus"
+_ICON_ELECTRIC_SWITCH = "mdi:electric-switch"
+_ICON_FLASH = "mdi:flash"
+_ICON_HOME_LIGHTNING_BOLT = "mdi:home-lightning-bolt"
+_ICON_NUMERIC = "mdi:numeric"
+_ICON_SINE_WAVE = "mdi:sine-wave"
+_ICON_SOLAR_PANEL = "mdi:solar-panel"
+_ICON_THERMOMETER = "mdi:thermometer"
+_ICON_TRANSMISSION_TOWER = "mdi:transmission-tower"
+
+# Phase labels used for per-phase sensor keys and names
+_THREE_PHASES = ("R", "S", "T")
+_LINE_PHASES = ("L1", "L2", "L3")
+_SPLIT_PHASES = ("L1", "L2")
+
+# GridBOSS smart load / AC couple port numbers
+_GRIDBOSS_PORTS = (1, 2, 3, 4)
+
+
+def _phase_sensors(
+    key: str,
+    name: str,
+    profile: Mapping[str, Any],
+    icon: str,
+    phases: tuple[str, ...] = _THREE_PHASES,
+) -> dict[str, SensorSpec]:
+    """Expand one sensor definition across phase suffixes (e.g. R/S/T)."""
+    return {
+        f"{key}_{phase.lower()}": SensorSpec(
+            **profile, name=f"{name} {phase}", icon=icon
+        )
+        for phase in phases
+    }
+
+
+def _port_sensors(
+    key: str,
+    name: str,
+    profile: Mapping[str, Any],
+    icon: str,
+    phases: tuple[str, ...] | None = None,
+) -> dict[str, SensorSpec]:
+    """Expand a "{port}" sensor template across the GridBOSS ports.
+
+    When phases are given, each port sensor is further split per phase.
+    """
+    sensors: dict[str, SensorSpec] = {}
+    for port in _GRIDBOSS_PORTS:
+        port_key = key.format(port=port)
+        port_name = name.format(port=port)
+        if phases:
+            sensors.update(_phase_sensors(port_key, port_name, profile, icon, phases))
+        else:
+            sensors[port_key] = SensorSpec(**profile, name=port_name, icon=icon)
+    return sensors
+
+
+def _energy_with_lifetime(key: str, name: str, icon: str) -> dict[str, SensorSpec]:
+    """Build the daily and lifetime energy sensors sharing a name and icon."""
+    return {
+        key: SensorSpec(**_ENERGY_TOTAL, name=name, icon=icon),
+        f"{key}_lifetime": SensorSpec(
+            **_ENERGY_TOTAL, name=f"{name} (Lifetime)", icon=icon
+        ),
+    }
+
+
+def build_sensor_types() -> dict[str, SensorSpec]:
+    """Build the sensor definition table.
+
+    Called once, on first access to const.SENSOR_TYPES.
+    """
+    sensor_types: dict[str, SensorSpec] = {
+        # Power sensors
+        "ac_power": SensorSpec(**_POWER, name="AC Power", icon="mdi:solar-power"),
+        "dc_power": SensorSpec(**_POWER, name="DC Power", icon="mdi:solar-power"),
+        "load_power": SensorSpec(
+            **_POWER, name="Load Power", icon=_ICON_HOME_LIGHTNING_BOLT
+        ),
+        "consumption_power": SensorSpec(
+            **_POWER, name="Consumption Power", icon=_ICON_HOME_LIGHTNING_BOLT
+        ),
+        "grid_power": SensorSpec(
+            **_POWER, name="Grid Power", icon=_ICON_TRANSMISSION_TOWER
+        ),
+        "grid_import_power": SensorSpec(
+            **_POWER, name="Grid Import Power", icon="mdi:transmission-tower-import"
+        ),
+        "grid_export_power": SensorSpec(
+            **_POWER, name="Grid Export Power", icon="mdi:transmission-tower-export"
+        ),
+        "battery_power": SensorSpec(**_POWER, name="Battery Power", icon=_ICON_BATTERY),
+        "hybrid_power": SensorSpec(
+            **_POWER, name="Hybrid Power", icon="mdi:solar-power-variant-outline"
+        ),
+        "battery_charge_power": SensorSpec(
+            **_POWER, name="Battery Charge Power", icon=_ICON_BATTERY_CHARGING
+        ),
+        "battery_discharge_power": SensorSpec(
+            **_POWER, name="Battery Discharge Power", icon=_ICON_BATTERY_MINUS
+        ),
+        "power_output": SensorSpec(**_POWER, name="Power Output", icon=_ICON_FLASH),
+        "rectifier_power": SensorSpec(
+            **_POWER, name="Rectifier Power", icon="mdi:flash-triangle"
+        ),
+        "ac_couple_power": SensorSpec(
+            **_POWER, name="AC Couple Power", icon="mdi:solar-power-variant"
+        ),
+        "eps_power": SensorSpec(**_POWER, name="EPS Power", icon="mdi:power-plug"),
+        **_phase_sensors(
+            "eps_power", "EPS Power", _POWER, "mdi:power-plug", _SPLIT_PHASES
+        ),
+        # Synthetic sensor: Total Load Power (EPS + Consumption for power flow charts)
+        "total_load_power": SensorSpec(
+            **_POWER, name="Total Load Power", icon=_ICON_HOME_LIGHTNING_BOLT
+        ),
+        "battery_status": SensorSpec(
+            name="Battery Status",
+            icon="mdi:battery-heart",
+        ),
+        # Voltage sensors
+        "ac_voltage": SensorSpec(**_VOLTAGE, name="AC Voltage", icon=_ICON_FLASH),
+        "dc_voltage": SensorSpec(**_VOLTAGE, name="DC Voltage", icon=_ICON_FLASH),
+        "battery_voltage": SensorSpec(
+            **_VOLTAGE, name="Battery Voltage", icon=_ICON_BATTERY
+        ),
+        "bus1_voltage": SensorSpec(
+            **_VOLTAGE, name="Bus 1 Voltage", icon=_ICON_SINE_WAVE
+        ),
+        "bus2_voltage": SensorSpec(
+            **_VOLTAGE, name="Bus 2 Voltage", icon=_ICON_SINE_WAVE
+        ),
+        # Grid voltage and frequency sensors (R/S/T phases)
+        **_phase_sensors(
+            "grid_voltage", "Grid Voltage", _VOLTAGE, _ICON_TRANSMISSION_TOWER
+        ),
+        "grid_frequency": SensorSpec(
+            **_FREQUENCY, name="Grid Frequency", icon=_ICON_TRANSMISSION_TOWER
+        ),
+        # EPS (Emergency Power Supply) voltage sensors
+        **_phase_sensors("eps_voltage", "EPS Voltage", _VOLTAGE, "mdi:power-plug"),
+        "eps_frequency": SensorSpec(
+            **_FREQUENCY, name="EPS Frequency", icon="mdi:power-plug"
+        ),
+        # Current sensors
+        "ac_current": SensorSpec(**_CURRENT, name="AC Current", icon="mdi:current-ac"),
+        "dc_current": SensorSpec(**_CURRENT, name="DC Current", icon="mdi:current-dc"),
+        "battery_current": SensorSpec(
+            **_CURRENT, name="Battery Current", icon=_ICON_BATTERY
+        ),
+        # Energy sensors
+        "total_energy": SensorSpec(
+            **_ENERGY_TOTAL, name="Total Energy", icon="mdi:lightning-bolt"
+        ),
+        "daily_energy": SensorSpec(
+            **_ENERGY_TOTAL, name="Daily Energy", icon="mdi:calendar-today"
+        ),
+        "monthly_energy": SensorSpec(
+            **_ENERGY_TOTAL, name="Monthly Energy", icon="mdi:calendar-month"
+        ),
+        "yearly_energy": SensorSpec(
+            **_ENERGY_TOTAL, name="Yearly Energy", icon="mdi:calendar-year"
+        ),
+        # Current day and lifetime energy sensors (values need to be divided by 10)
+        **_energy_with_lifetime("yield", "Yield", "mdi:solar-power"),
+        **_energy_with_lifetime("discharging", "Discharging", "mdi:battery-arrow-down"),
+        **_energy_with_lifetime("charging", "Charging", "mdi:battery-arrow-up"),
+        **_energy_with_lifetime(
+            "consumption", "Consumption", _ICON_HOME_LIGHTNING_BOLT
+        ),
+        **_energy_with_lifetime(
+            "grid_export", "Grid Export", "mdi:transmission-tower-export"
+        ),
+        **_energy_with_lifetime(
+            "grid_import", "Grid Import", "mdi:transmission-tower-import"
+        ),
+        # Parallel Group aggregate battery sensors (calculated from all inverters)
+        "parallel_battery_charge_power": SensorSpec(
+            **_POWER, name="Battery Charge Power", icon=_ICON_BATTERY_CHARGING
+        ),
+        "parallel_battery_discharge_power": SensorSpec(
+            **_POWER, name="Battery Discharge Power", icon=_ICON_BATTERY_MINUS
+        ),
+        "parallel_battery_power": SensorSpec(
+            **_POWER, name="Battery Power", icon=_ICON_BATTERY
+        ),
+        "parallel_battery_soc": SensorSpec(
+            name="Battery State of Charge",
+            unit="%",
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=_ICON_BATTERY,
+        ),
+        "parallel_battery_max_capacity": SensorSpec(
+            name="Battery Max Capacity",
+            unit="Ah",
+            device_class=None,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-high",
+        ),
+        "parallel_battery_current_capacity": SensorSpec(
+            name="Battery Current Capacity",
+            unit="Ah",
+            device_class=None,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=_ICON_BATTERY,
+        ),
+        "parallel_battery_voltage": SensorSpec(
+            **_VOLTAGE, name="Battery Voltage", icon=_ICON_FLASH
+        ),
+        "parallel_battery_count": SensorSpec(
+            name="Battery Count",
+            unit=None,
+            device_class=None,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-multiple",
+        ),
+        # Battery charge/discharge energy sensors (pylxpweb 0.3.3+)
+        **_energy_with_lifetime(
+            "battery_charge", "Battery Charge", _ICON_BATTERY_CHARGING
+        ),
+        **_energy_with_lifetime(
+            "battery_discharge", "Battery Discharge", _ICON_BATTERY_MINUS
+        ),
+        # Frequency
+        "frequency": SensorSpec(**_FREQUENCY, name="Frequency", icon=_ICON_SINE_WAVE),
+        # Temperature
+        "temperature": SensorSpec(
+            **_TEMPERATURE, name="Temperature", icon=_ICON_THERMOMETER
+        ),
+        # Battery specific
+        "state_of_charge": SensorSpec(
+            name="State of Charge",
+            unit="%",
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=_ICON_BATTERY,
+        ),
+        "state_of_health": SensorSpec(
+            name="State of Health",
+            unit="%",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-heart",
+        ),
+        "cycle_count": SensorSpec(
+            name="Cycle Count",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            icon="mdi:counter",
+        ),
+        # Battery Bank aggregate sensors (pylxpweb 0.3.3+)
+        "battery_bank_voltage": SensorSpec(
+            **_VOLTAGE, name="Battery Bank Voltage", icon=_ICON_BATTERY
+        ),
+        "battery_bank_soc": SensorSpec(
+            name="Battery Bank SOC",
+            unit="%",
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=_ICON_BATTERY,
+        ),
+        "battery_bank_charge_power": SensorSpec(
+            **_POWER, name="Battery Bank Charge Power", icon=_ICON_BATTERY_CHARGING
+        ),
+        "battery_bank_discharge_power": SensorSpec(
+            **_POWER, name="Battery Bank Discharge Power", icon=_ICON_BATTERY_MINUS
+        ),
+        "battery_bank_power": SensorSpec(
+            **_POWER, name="Battery Bank Power", icon=_ICON_BATTERY_CHARGING
+        ),
+        "battery_bank_max_capacity": SensorSpec(
+            name="Battery Bank Max Capacity",
+            unit="Ah",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-high",
+        ),
+        "battery_bank_current_capacity": SensorSpec(
+            name="Battery Bank Current Capacity",
+            unit="Ah",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-medium",
+        ),
+        "battery_bank_remain_capacity": SensorSpec(
+            name="Battery Bank Remaining Capacity",
+            unit="Ah",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=_ICON_BATTERY,
+        ),
+        "battery_bank_full_capacity": SensorSpec(
+            name="Battery Bank Full Capacity",
+            unit="Ah",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-high",
+        ),
+        "battery_bank_capacity_percent": SensorSpec(
+            name="Battery Bank Capacity Percent",
+            unit="%",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-heart",
+        ),
+        "battery_bank_count": SensorSpec(
+            name="Battery Count",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:counter",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_bank_status": SensorSpec(
+            name="Battery Bank Status",
+            icon="mdi:information",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        # Additional battery sensors from batteryArray
+        "battery_real_voltage": SensorSpec(
+            **_VOLTAGE, name="Voltage", icon=_ICON_BATTERY
+        ),
+        "battery_real_current": SensorSpec(
+            **_CURRENT, name="Current", icon=_ICON_BATTERY
+        ),
+        "battery_real_power": SensorSpec(
+            **_POWER, name="Real Power", icon=_ICON_BATTERY
+        ),
+        "battery_cell_voltage_max": SensorSpec(
+            **_VOLTAGE, name="Cell Voltage Max", icon="mdi:battery-plus-variant"
+        ),
+        "battery_cell_voltage_min": SensorSpec(
+            **_VOLTAGE, name="Cell Voltage Min", icon="mdi:battery-minus-variant"
+        ),
+        "battery_cell_voltage_diff": SensorSpec(
+            **_VOLTAGE, name="Cell Voltage Difference", icon="mdi:battery-sync"
+        ),
+        "battery_mos_temperature": SensorSpec(
+            **_TEMPERATURE, name="MOS Temperature", icon=_ICON_THERMOMETER
+        ),
+        "battery_env_temperature": SensorSpec(
+            **_TEMPERATURE, name="Environment Temperature", icon=_ICON_THERMOMETER
+        ),
+        "battery_cell_temp_max": SensorSpec(
+            **_TEMPERATURE,
+            name="Max Cell Temperature",
+            icon="mdi:thermometer-chevron-up",
+        ),
+        "battery_cell_temp_min": SensorSpec(
+            **_TEMPERATURE,
+            name="Min Cell Temperature",
+            icon="mdi:thermometer-chevron-down",
+        ),
+        "battery_ambient_temperature": SensorSpec(
+            **_TEMPERATURE, name="Ambient Temperature", icon="mdi:home-thermometer"
+        ),
+        "battery_remaining_capacity": SensorSpec(
+            name="Remaining Capacity",
+            unit="Ah",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=_ICON_BATTERY,
+        ),
+        "battery_full_capacity": SensorSpec(
+            name="Full Capacity",
+            unit="Ah",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=_ICON_BATTERY,
+        ),
+        "battery_design_capacity": SensorSpec(
+            name="Design Capacity",
+            unit="Ah",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=_ICON_BATTERY,
+        ),
+        "battery_rsoc": SensorSpec(
+            name="Relative SOC",
+            unit="%",
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=_ICON_BATTERY,
+        ),
+        "battery_asoc": SensorSpec(
+            name="Absolute SOC",
+            unit="%",
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=_ICON_BATTERY,
+        ),
+        "battery_firmware_version": SensorSpec(
+            name="Firmware Version",
+            icon="mdi:chip",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_capacity_percentage": SensorSpec(
+            name="Capacity Percentage",
+            unit="%",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-charging-100",
+        ),
+        "battery_max_charge_current": SensorSpec(
+            **_CURRENT, name="Max Charge Current", icon="mdi:current-dc"
+        ),
+        "battery_max_cell_temp_num": SensorSpec(
+            name="Max Temp Cell Number",
+            icon=_ICON_NUMERIC,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_min_cell_temp_num": SensorSpec(
+            name="Min Temp Cell Number",
+            icon=_ICON_NUMERIC,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_max_cell_voltage_num": SensorSpec(
+            name="Max Voltage Cell Number",
+            icon=_ICON_NUMERIC,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_min_cell_voltage_num": SensorSpec(
+            name="Min Voltage Cell Number",
+            icon=_ICON_NUMERIC,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "firmware_version": SensorSpec(
+            name="Firmware Version",
+            icon="mdi:chip",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "inverter_family": SensorSpec(
+            name="Inverter Family",
+            icon="mdi:family-tree",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "device_type_code": SensorSpec(
+            name="Device Type Code",
+            icon="mdi:identifier",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "grid_type": SensorSpec(
+            name="Grid Type",
+            icon=_ICON_TRANSMISSION_TOWER,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_balance_status": SensorSpec(
+            name="Balance Status",
+            icon="mdi:scale-balance",
+        ),
+        "battery_protection_status": SensorSpec(
+            name="Protection Status",
+            icon="mdi:shield-check",
+        ),
+        "battery_fault_status": SensorSpec(
+            name="Fault Status",
+            icon="mdi:alert-circle",
+        ),
+        "battery_warning_status": SensorSpec(
+            name="Warning Status",
+            icon="mdi:alert",
+        ),
+        # Battery temperature sensors (pylxpweb 0.3.3+)
+        "battery_max_cell_temp": SensorSpec(
+            **_TEMPERATURE, name="Max Cell Temperature", icon="mdi:thermometer-high"
+        ),
+        "battery_min_cell_temp": SensorSpec(
+            **_TEMPERATURE, name="Min Cell Temperature", icon="mdi:thermometer-low"
+        ),
+        # Battery cell voltage sensors (pylxpweb 0.3.3+)
+        "battery_max_cell_voltage": SensorSpec(
+            **_VOLTAGE, name="Max Cell Voltage", icon="mdi:battery-plus"
+        ),
+        "battery_min_cell_voltage": SensorSpec(
+            **_VOLTAGE, name="Min Cell Voltage", icon=_ICON_BATTERY_MINUS
+        ),
+        "battery_cell_voltage_delta": SensorSpec(
+            **_VOLTAGE, name="Cell Voltage Delta", icon="mdi:delta"
+        ),
+        "battery_cell_temp_delta": SensorSpec(
+            **_TEMPERATURE, name="Cell Temperature Delta", icon="mdi:delta"
+        ),
+        # Battery capacity sensors (pylxpweb 0.3.3+)
+        "battery_discharge_capacity": SensorSpec(
+            name="Discharge Capacity",
+            unit="Ah",
+            icon="mdi:battery-arrow-down",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_charge_voltage_ref": SensorSpec(
+            **_VOLTAGE, name="Charge Voltage Reference", icon=_ICON_BATTERY_CHARGING
+        ),
+        # Battery metadata sensors (pylxpweb 0.3.3+)
+        "battery_serial_number": SensorSpec(
+            name="Serial Number",
+            icon="mdi:identifier",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_type": SensorSpec(
+            name="Battery Type Code",
+            icon=_ICON_BATTERY,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_type_text": SensorSpec(
+            name="Battery Type",
+            icon="mdi:battery-sync",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_bms_model": SensorSpec(
+            name="BMS Model",
+            icon="mdi:chip",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_index": SensorSpec(
+            name="Index",
+            icon=_ICON_NUMERIC,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        # PV String sensors
+        "pv1_voltage": SensorSpec(
+            **_VOLTAGE, name="PV1 Voltage", icon=_ICON_SOLAR_PANEL
+        ),
+        "pv2_voltage": SensorSpec(
+            **_VOLTAGE, name="PV2 Voltage", icon=_ICON_SOLAR_PANEL
+        ),
+        "pv3_voltage": SensorSpec(
+            **_VOLTAGE, name="PV3 Voltage", icon=_ICON_SOLAR_PANEL
+        ),
+        "pv1_power": SensorSpec(**_POWER, name="PV1 Power", icon=_ICON_SOLAR_PANEL),
+        "pv2_power": SensorSpec(**_POWER, name="PV2 Power", icon=_ICON_SOLAR_PANEL),
+        "pv3_power": SensorSpec(**_POWER, name="PV3 Power", icon=_ICON_SOLAR_PANEL),
+        # GridBOSS MidBox specific sensors
+        **_phase_sensors(
+            "grid_voltage",
+            "Grid Voltage",
+            _VOLTAGE,
+            _ICON_TRANSMISSION_TOWER,
+            _LINE_PHASES,
+        ),
+        **_phase_sensors(
+            "grid_current",
+            "Grid Current",
+            _CURRENT,
+            _ICON_TRANSMISSION_TOWER,
+            _LINE_PHASES,
+        ),
+        **_phase_sensors(
+            "load_voltage",
+            "Load Voltage",
+            _VOLTAGE,
+            _ICON_HOME_LIGHTNING_BOLT,
+            _LINE_PHASES,
+        ),
+        **_phase_sensors(
+            "load_current",
+            "Load Current",
+            _CURRENT,
+            _ICON_HOME_LIGHTNING_BOLT,
+            _LINE_PHASES,
+        ),
+        **_phase_sensors(
+            "load_power", "Load Power", _POWER, _ICON_HOME_LIGHTNING_BOLT, _LINE_PHASES
+        ),
+        **_phase_sensors(
+            "grid_power", "Grid Power", _POWER, _ICON_TRANSMISSION_TOWER, _LINE_PHASES
+        ),
+        "ups_voltage": SensorSpec(
+            **_VOLTAGE, name="UPS Voltage", icon=_ICON_BATTERY_CHARGING
+        ),
+        "ups_current": SensorSpec(
+            **_CURRENT, name="UPS Current", icon=_ICON_BATTERY_CHARGING
+        ),
+        **_phase_sensors(
+            "ups_current",
+            "UPS Current",
+            _CURRENT,
+            _ICON_BATTERY_CHARGING,
+            _SPLIT_PHASES,
+        ),
+        "ups_power": SensorSpec(
+            **_POWER, name="UPS Power", icon=_ICON_BATTERY_CHARGING
+        ),
+        **_phase_sensors(
+            "ups_power", "UPS Power", _POWER, _ICON_BATTERY_CHARGING, _SPLIT_PHASES
+        ),
+        # Status sensors (diagnostic)
+        "status_code": SensorSpec(
+            name="Status Code",
+            icon=_ICON_NUMERIC,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "status_text": SensorSpec(
+            name="Status",
+            icon="mdi:information",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "has_data": SensorSpec(
+            name="Has Runtime Data",
+            icon="mdi:database-check",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        # New runtime sensors
+        "pv_total_power": SensorSpec(
+            **_POWER, name="PV Total Power", icon="mdi:solar-power"
+        ),
+        "internal_temperature": SensorSpec(
+            **_TEMPERATURE,
+            name="Internal Temperature",
+            icon=_ICON_THERMOMETER,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "radiator1_temperature": SensorSpec(
+            **_TEMPERATURE,
+            name="Radiator 1 Temperature",
+            icon="mdi:radiator",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "radiator2_temperature": SensorSpec(
+            **_TEMPERATURE,
+            name="Radiator 2 Temperature",
+            icon="mdi:radiator",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        # GridBOSS Smart Load sensors
+        "smart_load_power": SensorSpec(
+            **_POWER, name="Smart Load Power", icon=_ICON_ELECTRIC_SWITCH
+        ),
+        **_port_sensors(
+            "smart_load{port}_power",
+            "Smart Load {port} Power",
+            _POWER,
+            _ICON_ELECTRIC_SWITCH,
+        ),
+        # GridBOSS Smart Port Status sensors
+        "smart_port1_status": SensorSpec(
+            name="Smart Port 1 Status",
+            icon=_ICON_ELECTRIC_SWITCH,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "smart_port2_status": SensorSpec(
+            name="Smart Port 2 Status",
+            icon=_ICON_ELECTRIC_SWITCH,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "smart_port3_status": SensorSpec(
+            name="Smart Port 3 Status",
+            icon=_ICON_ELECTRIC_SWITCH,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "smart_port4_status": SensorSpec(
+            name="Smart Port 4 Status",
+            icon=_ICON_ELECTRIC_SWITCH,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        # GridBOSS Aggregate Energy sensors (L1 + L2 combined)
+        "ups_today": SensorSpec(
+            **_ENERGY_TOTAL, name="UPS Energy Today", icon="mdi:battery-charging-100"
+        ),
+        "ups_total": SensorSpec(
+            **_ENERGY_TOTAL, name="UPS Energy Total", icon="mdi:battery-charging-100"
+        ),
+        "grid_export_today": SensorSpec(
+            **_ENERGY_TOTAL,
+            name="Grid Export Today",
+            icon="mdi:transmission-tower-export",
+        ),
+        "grid_export_total": SensorSpec(
+            **_ENERGY_TOTAL,
+            name="Grid Export Total",
+            icon="mdi:transmission-tower-export",
+        ),
+        "grid_import_today": SensorSpec(
+            **_ENERGY_TOTAL,
+            name="Grid Import Today",
+            icon="mdi:transmission-tower-import",
+        ),
+        "grid_import_total": SensorSpec(
+            **_ENERGY_TOTAL,
+            name="Grid Import Total",
+            icon="mdi:transmission-tower-import",
+        ),
+        "load_today": SensorSpec(
+            **_ENERGY_TOTAL, name="Load Energy Today", icon=_ICON_HOME_LIGHTNING_BOLT
+        ),
+        "load_total": SensorSpec(
+            **_ENERGY_TOTAL, name="Load Energy Total", icon=_ICON_HOME_LIGHTNING_BOLT
+        ),
+        # GridBOSS AC Couple energy sensors
+        **_port_sensors(
+            "ac_couple{port}_today",
+            "AC Couple {port} Today",
+            _ENERGY_TOTAL,
+            "mdi:solar-power",
+        ),
+        **_port_sensors(
+            "ac_couple{port}_total",
+            "AC Couple {port} Total",
+            _ENERGY_TOTAL,
+            "mdi:solar-power",
+        ),
+        # GridBOSS Smart Load aggregate energy sensors (L1 + L2 combined)
+        **_port_sensors(
+            "smart_load{port}_today",
+            "Smart Load {port} Energy Today",
+            _ENERGY_TOTAL,
+            _ICON_ELECTRIC_SWITCH,
+        ),
+        **_port_sensors(
+            "smart_load{port}_total",
+            "Smart Load {port} Energy Total",
+            _ENERGY_TOTAL,
+            _ICON_ELECTRIC_SWITCH,
+        ),
+        # GridBOSS Generator sensors
+        "generator_voltage": SensorSpec(
+            **_VOLTAGE, name="Generator Voltage", icon="mdi:engine"
+        ),
+        "generator_frequency": SensorSpec(
+            **_FREQUENCY, name="Generator Frequency", icon="mdi:engine"
+        ),
+        "generator_power": SensorSpec(
+            **_POWER, name="Generator Power", icon="mdi:engine"
+        ),
+        # GridBOSS Phase Lock Frequency
+        "phase_lock_frequency": SensorSpec(
+            **_FREQUENCY, name="Phase Lock Frequency", icon=_ICON_SINE_WAVE
+        ),
+        # GridBOSS Generator L1/L2 sensors
+        **_phase_sensors(
+            "generator_current",
+            "Generator Current",
+            _CURRENT,
+            "mdi:engine",
+            _SPLIT_PHASES,
+        ),
+        **_phase_sensors(
+            "generator_power", "Generator Power", _POWER, "mdi:engine", _SPLIT_PHASES
+        ),
+        # GridBOSS Smart Load L1/L2 Power sensors
+        **_port_sensors(
+            "smart_load{port}_power",
+            "Smart Load {port} Power",
+            _POWER,
+            _ICON_ELECTRIC_SWITCH,
+            _SPLIT_PHASES,
+        ),
+        # GridBOSS AC Couple aggregate Power sensors (per-port totals)
+        **_port_sensors(
+            "ac_couple{port}_power",
+            "AC Couple {port} Power",
+            _POWER,
+            "mdi:solar-power-variant",
+        ),
+        # GridBOSS AC Couple L1/L2 Power sensors
+        **_port_sensors(
+            "ac_couple{port}_power",
+            "AC Couple {port} Power",
+            _POWER,
+            "mdi:solar-power-variant",
+            _SPLIT_PHASES,
+        ),
+        # Individual Inverter Energy API additional sensors
+        "inverter_power_rating": SensorSpec(
+            name="Power Rating",
+            unit=None,
+            device_class=None,
+            state_class=None,
+            icon="mdi:lightning-bolt",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "inverter_lost_status": SensorSpec(
+            name="Connection Lost",
+            unit=None,
+            device_class=None,
+            state_class=None,
+            icon="mdi:access-point-network-off",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "off_grid": SensorSpec(
+            name="Off Grid",
+            unit=None,
+            device_class=None,
+            state_class=None,
+            icon="mdi:transmission-tower-off",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "inverter_has_runtime_data": SensorSpec(
+            name="Has Runtime Data",
+            unit=None,
+            device_class=None,
+            state_class=None,
+            icon="mdi:database-check",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    }
+
+    return sensor_types
@@ -22,7 +22,7 @@ else:
 from . import EG4ConfigEntry
 from .base_entity import EG4BaseSwitch
 from .const import (
-    FUNCTION_PARAM_MAPPING,
+    FUNCTION_PARAM_REGISTERS,
     INVERTER_FAMILY_SNA,
     SUPPORTED_INVERTER_MODELS,
     WORKING_MODES,
@@ -431,9 +431,9 @@ class EG4WorkingModeSwitch(EG4BaseSwitch):
 
         # Read state from coordinator parameters
         try:
-            # Map function parameter to parameter register
-            param_key = FUNCTION_PARAM_MAPPING.get(self._mode_config["param"])
-            if param_key:
+            # Function parameters report status under the same register name
+            param_key = self._mode_config["param"]
+            if param_key in FUNCTION_PARAM_REGISTERS:
                 param_value = self._parameter_data.get(param_key, False)
                 # Handle both bool and int values
                 if isinstance(param_value, bool):
@@ -475,8 +475,8 @@ class EG4WorkingModeSwitch(EG4BaseSwitch):
         }
 
         # Add parameter register information
-        param_key = FUNCTION_PARAM_MAPPING.get(self._mode_config["param"])
-        if param_key:
+        param_key = self._mode_config["param"]
+        if param_key in FUNCTION_PARAM_REGISTERS:
             attributes["parameter_register"] = param_key
 
         # Add optimistic state indicator for debugging
@@ -0,0 +1,70 @@
+"""Test cases for the EG4 Web Monitor circuit breaker."""
+import asyncio
+import unittest
+from custom_components.eg4_web_monitor.utils import CircuitBreaker
+
+
+def _half_open_breaker():
+    """Return a breaker whose timeout has elapsed, so the next allow() probes."""
+    breaker = CircuitBreaker(failure_threshold=1, timeout=0)
+    breaker.record_failure()
+    breaker.last_failure_time -= 1
+    return breaker
+
+
+class TestCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the circuit breaker."""
+
+    async def test_half_open_allows_single_probe(self):
+        """Test only half_open_requests probes run at a time."""
+        breaker = _half_open_breaker()
+
+        assert breaker.allow()
+        assert breaker.state == "half-open"
+        assert not breaker.allow()
+
+    async def test_release_returns_probe_slot(self):
+        """Test releasing a probe lets the next one through."""
+        breaker = _half_open_breaker()
+        assert breaker.allow()
+
+        breaker.release()
+
+        assert breaker.allow()
+
+    async def test_cancelled_call_releases_probe_slot(self):
+        """Test a cancelled probe does not leave the breaker stuck half-open."""
+        breaker = _half_open_breaker()
+        task = asyncio.create_task(breaker.call(asyncio.sleep, 60))
+        await asyncio.sleep(0)
+
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        assert breaker.state == "half-open"
+        assert breaker.allow()
+
+    async def test_successful_probes_close_circuit(self):
+        """Test success_threshold probe successes close the circuit."""
+        breaker = _half_open_breaker()
+
+        for _ in range(breaker.success_threshold):
+            await breaker.call(asyncio.sleep, 0)
+
+        assert breaker.state == "closed"
+
+    async def test_failed_probe_reopens_circuit(self):
+        """Test a failing probe opens the circuit again."""
+        breaker = _half_open_breaker()
+
+        with self.assertRaises(ValueError):
+            await breaker.call(self._fail)
+
+        assert breaker.state == "open"
+
+    @staticmethod
+    async def _fail():
+        """Raise like a failing API call."""
+        raise ValueError("API down")
+
@@ -13,7 +13,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ENTITY_PREFIX
+from .const import FIRMWARE_DEVICE_TYPES, UPDATE_ENTITY_ID_PREFIX
 from .coordinator import EG4DataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,7 +37,7 @@ async def async_setup_entry(
         device_type = device_data.get("type")
 
         # Only create update entities for inverters and GridBOSS
-        if device_type in ["inverter", "gridboss"]:
+        if device_type in FIRMWARE_DEVICE_TYPES:
             entities.append(EG4FirmwareUpdateEntity(coordinator, serial))
 
     async_add_entities(entities)
@@ -71,11 +71,13 @@ class EG4FirmwareUpdateEntity(
         self._attr_unique_id = f"{serial}_firmware_update"
 
         if device_type == "gridboss":
-            self._attr_entity_id = f"update.{ENTITY_PREFIX}_gridboss_{serial}_firmware"
+            self._attr_entity_id = (
+                f"{UPDATE_ENTITY_ID_PREFIX}gridboss_{serial}_firmware"
+            )
         else:
             model_clean = model.replace(" ", "_").replace("-", "_").lower()
             self._attr_entity_id = (
-                f"update.{ENTITY_PREFIX}_{model_clean}_{serial}_firmware"
+                f"{UPDATE_ENTITY_ID_PREFIX}{model_clean}_{serial}_firmware"
             )
 
         # Entity naming
@@ -233,7 +235,9 @@ class EG4FirmwareUpdateEntity(
             await device.start_firmware_update()
             _LOGGER.info("Firmware update initiated for %s", self._serial)
 
-            # Refresh coordinator data to update status
+            # Refresh coordinator data to update status, bypassing the cached
+            # firmware check so progress is reported straight away
+            self.coordinator.invalidate_firmware_check(self._serial)
             await self.coordinator.async_request_refresh()
 
         except Exception as err:
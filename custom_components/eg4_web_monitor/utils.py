@@ -1,7 +1,11 @@
 """Utility functions for EG4 Inverter integration."""
 
+import asyncio
+import functools
 import logging
+import socket
 import time
+from types import TracebackType
 from typing import (
     Any,
     Callable,
@@ -20,9 +24,12 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
 def clean_battery_display_name(battery_key: str, serial: str) -> str:
     """Clean up battery key for display in entity names.
 
+    Memoized: the same battery keys are cleaned on every coordinator update.
+
     Args:
         battery_key: Raw battery key from API (e.g., "1234567890_Battery_ID_01")
         serial: Parent device serial number
@@ -153,21 +160,55 @@ def generate_unique_id(serial: str, entity_type: str, suffix: str | None = None)
     return base_id
 
 
+def enable_tcp_keepalive(
+    sock: socket.socket, idle: int = 30, interval: int = 10, count: int = 3
+) -> None:
+    """Enable TCP keepalive on a socket so idle connections survive NAT timeouts.
+
+    Args:
+        sock: Connected TCP socket
+        idle: Seconds of idle time before the first keepalive probe
+        interval: Seconds between keepalive probes
+        count: Unanswered probes before the connection is dropped
+    """
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Fine-grained timings are platform specific (Linux exposes all three)
+    for option, value in (
+        ("TCP_KEEPIDLE", idle),
+        ("TCP_KEEPINTVL", interval),
+        ("TCP_KEEPCNT", count),
+    ):
+        if (opt := getattr(socket, option, None)) is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, opt, value)
+
+
 class CircuitBreaker:
     """Simple circuit breaker pattern for API calls."""
 
-    def __init__(self, failure_threshold: int = 5, timeout: int = 60) -> None:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        timeout: int = 60,
+        half_open_requests: int = 1,
+        success_threshold: int = 2,
+    ) -> None:
         """Initialize circuit breaker.
 
         Args:
             failure_threshold: Number of failures before opening circuit
             timeout: Timeout in seconds before trying again
+            half_open_requests: Probe requests allowed in flight while half-open
+            success_threshold: Consecutive half-open successes needed to close
         """
         self.failure_threshold = failure_threshold
         self.timeout = timeout
+        self.half_open_requests = half_open_requests
+        self.success_threshold = success_threshold
         self.failure_count = 0
         self.last_failure_time: float | None = None
         self.state = "closed"  # closed, open, half-open
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
 
     async def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Execute function with circuit breaker protection.
@@ -180,25 +221,149 @@ class CircuitBreaker:
         Returns:
             Function result or raises exception
         """
-        if self.state == "open":
-            if self.last_failure_time and (
-                time.monotonic() - self.last_failure_time > self.timeout
-            ):
-                self.state = "half-open"
-            else:
-                raise RuntimeError("Circuit breaker is open")
+        if not self.allow():
+            raise RuntimeError("Circuit breaker is open")
 
         try:
             result = await func(*args, **kwargs)
-            if self.state == "half-open":
-                self.state = "closed"
-                self.failure_count = 0
+        except Exception:
+            self.record_failure()
+            raise
+        else:
+            self.record_success()
             return result
-        except Exception as e:
-            self.failure_count += 1
-            self.last_failure_time = time.monotonic()
+        finally:
+            self.release()
+
+    def allow(self) -> bool:
+        """Return whether a request may proceed.
 
-            if self.failure_count >= self.failure_threshold:
-                self.state = "open"
+        An open circuit moves to half-open once the timeout has elapsed, after
+        which only half_open_requests probes are let through at a time. Every
+        allowed request must be paired with release(), including on
+        cancellation, so the probe slot is returned.
+        """
+        if self.state == "open":
+            if not self.last_failure_time or (
+                time.monotonic() - self.last_failure_time <= self.timeout
+            ):
+                return False
+            self.state = "half-open"
+            self._half_open_in_flight = 0
+            self._half_open_successes = 0
+
+        if self.state == "half-open":
+            if self._half_open_in_flight >= self.half_open_requests:
+                return False
+            self._half_open_in_flight += 1
+
+        return True
 
-            raise e
+    def record_success(self) -> None:
+        """Record a successful request.
+
+        While half-open, the circuit only closes after success_threshold
+        consecutive probe successes.
+        """
+        if self.state == "half-open":
+            self._half_open_successes += 1
+            if self._half_open_successes < self.success_threshold:
+                return
+
+        self.state = "closed"
+        self.failure_count = 0
+
+    def release(self) -> None:
+        """Return the half-open probe slot taken by allow().
+
+        Safe to call for requests that did not hold a slot; outside the
+        half-open state there is nothing to return.
+        """
+        if self.state == "half-open" and self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit at the threshold."""
+        self.failure_count += 1
+        self.last_failure_time = time.monotonic()
+
+        if self.state == "half-open" or self.failure_count >= self.failure_threshold:
+            self.state = "open"
+
+
+class RateLimiter:
+    """Token-bucket limiter bounding both concurrency and request rate.
+
+    Used as an async context manager around each API request, in place of a
+    bare semaphore, so that bursts of API calls cannot exceed the cloud API's
+    request rate limits.
+    """
+
+    def __init__(
+        self, max_concurrent: int = 3, rate: float = 0.5, max_tokens: int = 3
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            max_concurrent: Maximum number of calls in flight at once
+            rate: Tokens added per second
+            max_tokens: Bucket capacity (maximum burst size)
+        """
+        self.rate = rate
+        self.max_tokens = max_tokens
+        self.tokens = float(max_tokens)
+        self.updated_at = time.monotonic()
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill, capped at max_tokens."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.max_tokens, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def resize(self, rate: float, max_tokens: int) -> None:
+        """Change the refill rate and bucket capacity.
+
+        Tokens accrued at the old rate are kept, and added capacity is
+        available immediately.
+
+        Args:
+            rate: Tokens added per second
+            max_tokens: Bucket capacity (maximum burst size)
+        """
+        self._refill()
+        self.tokens = min(
+            max_tokens, self.tokens + max(0, max_tokens - self.max_tokens)
+        )
+        self.rate = rate
+        self.max_tokens = max_tokens
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+    async def __aenter__(self) -> None:
+        """Acquire a concurrency slot and a rate token."""
+        await self._semaphore.acquire()
+        try:
+            await self.acquire()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release the concurrency slot."""
+        self._semaphore.release()